@@ -38,6 +38,14 @@ class Config:
             return item
         return item.lower() in {"1", "yes", "true", "on"}
 
+    @staticmethod
+    def _convert(attribute: str, value: Any, conversion: type) -> Any:
+        try:
+            return conversion(value)
+        except ValueError:
+            msg = f"An incorrect config type was given for option {attribute}. The expected type is {conversion.__name__}, but the given value is {value}."
+            raise ValueError(msg) from None
+
     @classmethod
     def _load_config(cls, *, config_interpolation: str | None = None):
         """Attempt to load settings from various praw.ini files."""
@@ -122,12 +130,30 @@ class Config:
 
     def _initialize_attributes(self):
         self._short_url = self._fetch_default("short_url") or self.CONFIG_NOT_SET
+        self.async_max_workers = self._fetch_default("async_max_workers", default=8)
+        self.cache_max_bytes = self._fetch_default("cache_max_bytes", default=16777216)
+        self.cache_ttl = self._fetch_default("cache_ttl", default=0)
+        self.cache_ttls = {
+            key[len("cache_ttl_") :]: self._fetch(key)
+            for key in list(self.custom)
+            if key.startswith("cache_ttl_")
+        }
         self.check_for_async = self._config_boolean(
             self._fetch_default("check_for_async", default=True)
         )
         self.check_for_updates = self._config_boolean(
             self._fetch_or_not_set("check_for_updates")
         )
+        self.conditional_requests = self._config_boolean(
+            self._fetch_default("conditional_requests", default=False)
+        )
+        self.json_backend = self._fetch_default("json_backend", default="auto")
+        self.intern_models = self._config_boolean(
+            self._fetch_default("intern_models", default=False)
+        )
+        self.lean_models = self._config_boolean(
+            self._fetch_default("lean_models", default=False)
+        )
         self.warn_comment_sort = self._config_boolean(
             self._fetch_default("warn_comment_sort", default=True)
         )
@@ -166,11 +192,18 @@ class Config:
             setattr(self, required_attribute, self._fetch(required_attribute))
 
         for attribute, conversion in {
+            "async_max_workers": int,
+            "cache_max_bytes": int,
+            "cache_ttl": float,
             "ratelimit_seconds": int,
             "timeout": int,
         }.items():
-            try:
-                setattr(self, attribute, conversion(getattr(self, attribute)))
-            except ValueError:
-                msg = f"An incorrect config type was given for option {attribute}. The expected type is {conversion.__name__}, but the given value is {getattr(self, attribute)}."
-                raise ValueError(msg) from None
+            setattr(
+                self,
+                attribute,
+                self._convert(attribute, getattr(self, attribute), conversion),
+            )
+        self.cache_ttls = {
+            name: self._convert(f"cache_ttl_{name}", value, float)
+            for name, value in self.cache_ttls.items()
+        }
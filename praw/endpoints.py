@@ -1,4 +1,10 @@
 """List of API endpoints PRAW knows about."""
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from urllib.parse import urlparse
+
 # fmt: off
 API_PATH = {
     "about_edited":            "r/{subreddit}/about/edited/",
@@ -232,3 +238,101 @@ API_PATH = {
     "wiki_revert":             "r/{subreddit}/api/wiki/revert",
     "wiki_revisions":          "r/{subreddit}/wiki/revisions/",
 }
+# fmt: on
+
+
+def _endpoint_pattern(template: str) -> tuple[str, int]:
+    """Return a pattern matching paths built from ``template`` and its literal length.
+
+    Wiki page names may contain slashes, so ``{page}`` matches across them.
+
+    """
+    pattern = ""
+    literal_length = 0
+    for literal, field in re.findall(r"([^{]*)(?:\{(\w+)\})?", template.strip("/")):
+        pattern += re.escape(literal)
+        literal_length += len(literal)
+        if field:
+            pattern += "(?:.+)" if field == "page" else "(?:[^/]+)"
+    return f"{pattern}/?", literal_length
+
+
+def _endpoint_prefix(template: str) -> tuple[str, ...]:
+    """Return up to the first two path segments of ``template`` before any field."""
+    prefix = []
+    for segment in template.strip("/").split("/")[:2]:
+        if "{" in segment:
+            break
+        prefix.append(segment)
+    return tuple(prefix)
+
+
+def _compile_endpoint_patterns(
+    templates: list[tuple[int, str, str]]
+) -> tuple[re.Pattern, dict[str, str]]:
+    """Return one pattern alternating between ``templates`` and its group names."""
+    names = {f"e{rank}": name for rank, name, _ in templates}
+    pattern = "|".join(f"(?P<e{rank}>{pattern})" for rank, _, pattern in templates)
+    return re.compile(pattern), names
+
+
+def _index_endpoint_patterns() -> (
+    dict[tuple[str, ...], tuple[re.Pattern, dict[str, str]]]
+):
+    """Return the patterns of the templates that can match paths, by path prefix.
+
+    Each path is matched against a single alternation of the templates sharing its
+    first one or two literal segments, e.g., ``("api", "v1")`` or ``("r",)``, rather
+    than against each of the templates in turn. Templates with the most literal
+    characters come first so that, e.g., ``wiki_pages`` is preferred over
+    ``wiki_page`` for ``r/test/wiki/pages/``.
+
+    """
+    prefixes = {}
+    for rank, ((pattern, _), name, template) in enumerate(
+        sorted(
+            (
+                (_endpoint_pattern(template), name, template)
+                for name, template in API_PATH.items()
+            ),
+            key=lambda item: -item[0][1],
+        )
+    ):
+        prefix = _endpoint_prefix(template)
+        prefixes.setdefault(prefix, []).append((rank, name, pattern))
+    index = {}
+    for prefix in {(), *(prefix[:1] for prefix in prefixes), *prefixes}:
+        # A path with a two segment prefix can also match the templates that only
+        # share its first segment, or no segment at all.
+        templates = sorted(
+            template
+            for length in range(len(prefix) + 1)
+            for template in prefixes.get(prefix[:length], [])
+        )
+        if templates:
+            index[prefix] = _compile_endpoint_patterns(templates)
+    return index
+
+
+_ENDPOINT_PATTERNS = _index_endpoint_patterns()
+
+
+@lru_cache(maxsize=4096)
+def endpoint_name(path: str) -> str | None:
+    """Return the name of the ``API_PATH`` template that ``path`` was built from.
+
+    :param path: The path of a request, e.g., ``"r/test/about/"``. Full URLs are also
+        accepted.
+
+    :returns: The name of the template, e.g., ``"subreddit_about"``, or ``None`` when
+        ``path`` does not match any template.
+
+    """
+    path = urlparse(path).path.strip("/")
+    segments = tuple(path.split("/", 2)[:2])
+    for prefix in (segments, segments[:1], ()):
+        if prefix in _ENDPOINT_PATTERNS:
+            pattern, names = _ENDPOINT_PATTERNS[prefix]
+            match = pattern.fullmatch(path)
+            return None if match is None else names[match.lastgroup]
+    return None
@@ -77,6 +77,43 @@ class ClientException(PRAWException):
     """Indicate exceptions that don't involve interaction with Reddit's API."""
 
 
+class CircuitBreakerOpenException(ClientException):
+    """Indicate that a request was not issued because Reddit appears to be unavailable.
+
+    Raised by :class:`.RetryPolicy` while its circuit breaker is open.
+
+    """
+
+    def __init__(self, *, retry_after: float):
+        """Initialize a :class:`.CircuitBreakerOpenException` instance.
+
+        :param retry_after: The number of seconds until a request is attempted again.
+
+        """
+        self.retry_after = retry_after
+        super().__init__(
+            "Requests are failing fast after repeated failures. A request will be"
+            f" attempted again in {retry_after:.1f} seconds."
+        )
+
+
+class DeadlineExceededException(ClientException):
+    """Indicate that an operation was stopped by its :class:`.Deadline`."""
+
+    def __init__(self, *, cancelled: bool):
+        """Initialize a :class:`.DeadlineExceededException` instance.
+
+        :param cancelled: Whether the deadline was cancelled rather than passed.
+
+        """
+        self.cancelled = cancelled
+        super().__init__(
+            "The operation was cancelled."
+            if cancelled
+            else "The deadline of the operation has passed."
+        )
+
+
 class DuplicateReplaceException(ClientException):
     """Indicate exceptions that involve the replacement of :class:`.MoreComments`."""
 
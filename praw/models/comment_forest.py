@@ -11,6 +11,8 @@ from .reddit.more import MoreComments
 if TYPE_CHECKING:  # pragma: no cover
     import praw.models
 
+    from ..util.deadline import Deadline
+
 
 class CommentForest:
     """A forest of comments starts with multiple top-level comments.
@@ -120,10 +122,18 @@ class CommentForest:
 
     @_deprecate_args("limit", "threshold")
     def replace_more(
-        self, *, limit: int | None = 32, threshold: int = 0
+        self,
+        *,
+        deadline: Deadline | None = None,
+        limit: int | None = 32,
+        threshold: int = 0,
     ) -> list[praw.models.MoreComments]:
         """Update the comment forest by resolving instances of :class:`.MoreComments`.
 
+        :param deadline: A :class:`.Deadline` bounding the time spent replacing
+            :class:`.MoreComments` instances (default: ``None``). When it passes, the
+            instances replaced so far remain in the forest and
+            :class:`.DeadlineExceededException` is raised.
         :param limit: The maximum number of :class:`.MoreComments` instances to replace.
             Each replacement requires 1 API request. Set to ``None`` to have no limit,
             or to ``0`` to remove all :class:`.MoreComments` instances without
@@ -176,6 +186,9 @@ class CommentForest:
             method again will result in a :class:`.DuplicateReplaceException`.
 
         """
+        if deadline is not None:
+            with deadline:
+                return self.replace_more(limit=limit, threshold=threshold)
         remaining = limit
         more_comments = self._gather_more_comments(self._comments)
         skipped = []
@@ -332,7 +332,11 @@ class SubredditHelper(PRAWBase):
         if lower_name == "randnsfw":
             return self._reddit.random_subreddit(nsfw=True)
 
-        return Subreddit(self._reddit, display_name=display_name)
+        return self._reddit.interner.get(
+            Subreddit,
+            display_name,
+            lambda: Subreddit(self._reddit, display_name=display_name),
+        )
 
     @_deprecate_args("name", "title", "link_type", "subreddit_type", "wikimode")
     def create(
@@ -1,15 +1,47 @@
 """Provide the ListingGenerator class."""
 from __future__ import annotations
 
+from contextlib import nullcontext
 from copy import deepcopy
-from typing import TYPE_CHECKING, Any, Iterator
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
 
+from ...endpoints import endpoint_name
+from ...util.rate_limit import RateLimitScheduler
 from ..base import PRAWBase
-from .listing import FlairListing, ModNoteListing
+from .listing import FlairListing, Listing, ModNoteListing
 
 if TYPE_CHECKING:  # pragma: no cover
     import praw
 
+    from ...util.async_iterator import AsyncIterator
+    from ...util.deadline import Deadline
+
+
+# Listings polled by moderation bots, which keep the default lane rather than the low
+# priority lane of other listings
+MODERATION_ENDPOINTS = frozenset(
+    {
+        "about_edited",
+        "about_log",
+        "about_modqueue",
+        "about_reports",
+        "about_spam",
+        "about_unmoderated",
+        "moderator_messages",
+        "moderator_unread",
+        "modmail_conversations",
+    }
+)
+
+
+class _RawListing(list):
+    """The plain dictionaries of the items in a page of a listing."""
+
+    def __init__(self, children: list[Any], *, after: str | None, after_param: str):
+        super().__init__(children)
+        self.AFTER_PARAM = after_param
+        self.after = after
+
 
 class ListingGenerator(PRAWBase, Iterator):
     """Instances of this class generate :class:`.RedditBase` instances.
@@ -23,12 +55,25 @@ class ListingGenerator(PRAWBase, Iterator):
 
     """
 
+    def __aiter__(self) -> AsyncIterator:
+        """Permit :class:`.ListingGenerator` to operate as an asynchronous iterator.
+
+        Items are fetched in a thread of :attr:`.Reddit.async_executor`. See
+        :meth:`.Reddit.async_iterator`.
+
+        """
+        return self._reddit.async_iterator(self)
+
     def __init__(
         self,
         reddit: praw.Reddit,
         url: str,
         limit: int = 100,
         params: dict[str, str | int] | None = None,
+        *,
+        deadline: Deadline | None = None,
+        fields: Iterable[str] | None = None,
+        raw: bool = False,
     ):
         """Initialize a :class:`.ListingGenerator` instance.
 
@@ -40,15 +85,32 @@ class ListingGenerator(PRAWBase, Iterator):
             automatically issue all necessary requests (default: ``100``).
         :param params: A dictionary containing additional query string parameters to
             send with the request.
+        :param deadline: A :class:`.Deadline` applied to every request issued by the
+            generator (default: ``None``).
+        :param fields: The names of the attributes to keep on each yielded comment,
+            submission, or subreddit. Other attributes are dropped before the items are
+            built, which saves time and memory when only a few of them are used, and
+            accessing them raises an ``AttributeError`` (default: ``None``, all
+            attributes are kept).
+        :param raw: When ``True``, yield the ``data`` dictionary of each item as
+            returned by Reddit rather than building objects from it. With ``fields``,
+            the dictionaries only contain those keys and ``"name"`` (default:
+            ``False``).
 
         """
+        if isinstance(fields, str):
+            msg = "'fields' must be a non-str iterable."
+            raise TypeError(msg)
         super().__init__(reddit, _data=None)
         self._exhausted = False
         self._listing = None
         self._list_index = None
+        self.deadline = deadline
+        self.fields = None if fields is None else frozenset(fields)
         self.limit = limit
         self.params = deepcopy(params) if params else {}
         self.params["limit"] = limit or 1024
+        self.raw = raw
         self.url = url
         self.yielded = 0
 
@@ -68,7 +130,49 @@ class ListingGenerator(PRAWBase, Iterator):
         self.yielded += 1
         return self._listing[self._list_index - 1]
 
+    def _extract_raw_sublist(
+        self, listing: dict[str, Any] | list[dict[str, Any]]
+    ) -> _RawListing:
+        if isinstance(listing, list):
+            listing = listing[1]  # for submission duplicates
+        if "kind" in listing and "data" in listing:
+            data = listing["data"]
+            children = [
+                child["data"] if "kind" in child and "data" in child else child
+                for child in data["children"]
+            ]
+            after, after_param = data.get("after"), Listing.AFTER_PARAM
+        else:
+            for listing_type in [FlairListing, ModNoteListing]:
+                if listing_type.CHILD_ATTRIBUTE in listing:
+                    break
+            else:
+                msg = "The generator returned a dictionary PRAW didn't recognize. File a bug report at PRAW."
+                raise ValueError(msg)
+            children = listing[listing_type.CHILD_ATTRIBUTE]
+            metadata = {
+                key: value
+                for key, value in listing.items()
+                if key != listing_type.CHILD_ATTRIBUTE
+            }
+            after = listing_type(self._reddit, metadata).after
+            after_param = listing_type.AFTER_PARAM
+        if self.fields is not None:
+            # Like the ``STR_FIELD`` of built items, ``name`` is always kept so that
+            # items can be identified, e.g., by streams.
+            children = [
+                {
+                    key: value
+                    for key, value in child.items()
+                    if key in self.fields or key == "name"
+                }
+                for child in children
+            ]
+        return _RawListing(children, after=after, after_param=after_param)
+
     def _extract_sublist(self, listing: dict[str, Any] | list[Any]):
+        if self.raw:
+            return self._extract_raw_sublist(listing)
         if isinstance(listing, list):
             return listing[1]  # for submission duplicates
         if isinstance(listing, dict):
@@ -86,7 +190,13 @@ class ListingGenerator(PRAWBase, Iterator):
         if self._exhausted:
             raise StopIteration
 
-        self._listing = self._reddit.get(self.url, params=self.params)
+        lane = "normal" if endpoint_name(self.url) in MODERATION_ENDPOINTS else "low"
+        with RateLimitScheduler.default_priority(lane), (
+            nullcontext() if self.deadline is None else self.deadline
+        ), self._reddit._objector.lean(), self._reddit._objector.projection(
+            self.fields
+        ):
+            self._listing = self._reddit.get(self.url, params=self.params, raw=self.raw)
         self._listing = self._extract_sublist(self._listing)
         self._list_index = 0
 
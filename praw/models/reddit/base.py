@@ -7,14 +7,68 @@ from urllib.parse import urlparse
 from ...endpoints import API_PATH
 from ...exceptions import InvalidURL
 from ..base import PRAWBase
+from ..state import dump_state, load_state
 
 if TYPE_CHECKING:  # pragma: no cover
     import praw
 
+_MISSING = object()
+
 
 class RedditBase(PRAWBase):
     """Base class that represents actual Reddit objects."""
 
+    # Maps the attributes that lean instances resolve on first access to the keys of
+    # their data, or ``None`` when the class does not support lean instances.
+    _LEAN_ATTRIBUTES = None
+
+    @classmethod
+    def _parse_lean(cls, data: dict[str, Any], reddit: praw.Reddit) -> Any:
+        """Return a lean instance of ``cls`` from ``data``.
+
+        Unlike :meth:`.parse`, which sets every attribute, a lean instance uses a copy of
+        ``data`` as its attributes and converts those in ``_LEAN_ATTRIBUTES``, e.g.,
+        ``author`` into a :class:`.Redditor`, when they are first accessed.
+
+        :param data: The structured data.
+        :param reddit: An instance of :class:`.Reddit`.
+
+        """
+        attributes = data.copy()
+        lean_data = {}
+        for attribute, key in cls._LEAN_ATTRIBUTES.items():
+            if key in attributes:
+                lean_data[attribute] = attributes.pop(key)
+        instance = cls(reddit, _data={cls.STR_FIELD: attributes[cls.STR_FIELD]})
+        for attribute in lean_data:
+            instance.__dict__.pop(attribute, None)
+        instance.__dict__.update(attributes)
+        instance._lean_data = lean_data
+        return instance
+
+    @classmethod
+    def from_state(cls, reddit: praw.Reddit, state: dict[str, Any]) -> Any:
+        """Return an instance of ``cls`` from a state returned by :meth:`.to_state`.
+
+        :param reddit: An instance of :class:`.Reddit` to attach the instance, and the
+            models it references, to.
+        :param state: The state of the instance.
+
+        For example, to rebuild a submission sent from another process:
+
+        .. code-block:: python
+
+            submission = praw.models.Submission.from_state(reddit, state)
+            for comment in submission.comments.list():
+                print(comment.body)
+
+        """
+        instance = load_state(reddit, state)
+        if not isinstance(instance, cls):
+            msg = f"The state is of a {instance.__class__.__name__!r}, not a {cls.__name__!r}."
+            raise ValueError(msg)
+        return instance
+
     @staticmethod
     def _url_parts(url: str) -> list[str]:
         parsed = urlparse(url)
@@ -24,24 +78,66 @@ class RedditBase(PRAWBase):
 
     def __eq__(self, other: Any | str) -> bool:
         """Return whether the other instance equals the current."""
+        if other is self:
+            return True
         if isinstance(other, str):
-            return other.lower() == str(self).lower()
-        return (
-            isinstance(other, self.__class__)
-            and str(self).lower() == str(other).lower()
-        )
+            return other.lower() == self._identity()[1]
+        if not isinstance(other, self.__class__):
+            return False
+        identity = self.__dict__.get("_identity_cache")
+        other_identity = other.__dict__.get("_identity_cache")
+        if (
+            identity is None
+            or other_identity is None
+            or identity[0] is not self.__dict__.get(self.STR_FIELD)
+            or other_identity[0] is not other.__dict__.get(other.STR_FIELD)
+        ):
+            identity, other_identity = self._identity(), other._identity()
+        return identity[1] == other_identity[1]
 
     def __getattr__(self, attribute: str) -> Any:
         """Return the value of ``attribute``."""
+        lean_data = self.__dict__.get("_lean_data")
+        if lean_data:
+            # The raw value is removed only once it is converted, so that a concurrent
+            # first access converts it too instead of finding it in neither place
+            value = lean_data.get(attribute, _MISSING)
+            if value is not _MISSING:
+                setattr(self, self._LEAN_ATTRIBUTES[attribute], value)
+                lean_data.pop(attribute, None)
+            if attribute in self.__dict__:
+                return self.__dict__[attribute]
+        fields = self.__dict__.get("_fields")
+        if (
+            fields is not None
+            and attribute not in fields
+            and not attribute.startswith("_")
+        ):
+            msg = f"{self.__class__.__name__!r} object has no attribute {attribute!r}, which was dropped because it is not in 'fields'"
+            raise AttributeError(msg)
         if not attribute.startswith("_") and not self._fetched:
             self._fetch()
             return getattr(self, attribute)
         msg = f"{self.__class__.__name__!r} object has no attribute {attribute!r}"
         raise AttributeError(msg)
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state of the instance for pickling, without its cached identity.
+
+        The cached hash depends on the hash seed of the process, which may differ where
+        the instance is unpickled.
+
+        """
+        state = self.__dict__.copy()
+        state.pop("_identity_cache", None)
+        return state
+
     def __hash__(self) -> int:
         """Return the hash of the current instance."""
-        return hash(self.__class__.__name__) ^ hash(str(self).lower())
+        identity = self.__dict__.get("_identity_cache")
+        if identity is not None and identity[0] is self.__dict__.get(self.STR_FIELD):
+            return identity[2]
+        return self._identity()[2]
 
     def __init__(
         self,
@@ -87,8 +183,57 @@ class RedditBase(PRAWBase):
         path = API_PATH[name].format(**fields)
         return self._reddit.request(method="GET", params=params, path=path)
 
+    def _identity(self) -> tuple[Any, str, int]:
+        """Return the ``STR_FIELD`` value, lowercase string, and hash of the instance.
+
+        The result is cached for as long as the ``STR_FIELD`` attribute is the same
+        object, unless the class overrides ``__str__``.
+
+        """
+        if type(self).__str__ is not RedditBase.__str__:
+            key = str(self).lower()
+            return None, key, hash(self.__class__.__name__) ^ hash(key)
+        value = self.__dict__.get(self.STR_FIELD)
+        identity = self.__dict__.get("_identity_cache")
+        if identity is None or identity[0] is not value:
+            key = (value if value.__class__ is str else str(self)).lower()
+            identity = self.__dict__["_identity_cache"] = (
+                self.__dict__.get(self.STR_FIELD),
+                key,
+                hash(self.__class__.__name__) ^ hash(key),
+            )
+        return identity
+
     def _reset_attributes(self, *attributes: str):
         for attribute in attributes:
             if attribute in self.__dict__:
                 del self.__dict__[attribute]
         self._fetched = False
+
+    def to_state(self) -> dict[str, Any]:
+        """Return the state of the instance for sending to another process.
+
+        The state consists of built-in types only: the kind and data attributes of the
+        instance, and of the models it references, such as its author or the
+        :class:`.CommentForest` of a submission, but not its :class:`.Reddit` instance.
+        As such it is much smaller to pickle than the instance itself. Use
+        :meth:`.from_state` to rebuild the instance:
+
+        .. code-block:: python
+
+            from concurrent.futures import ProcessPoolExecutor
+
+
+            def count_words(state):
+                reddit = praw.Reddit(...)
+                submission = praw.models.Submission.from_state(reddit, state)
+                return sum(len(comment.body.split()) for comment in submission.comments)
+
+
+            submission = reddit.submission("5or86n")
+            submission.comments.replace_more()
+            with ProcessPoolExecutor() as executor:
+                print(executor.submit(count_words, submission.to_state()).result())
+
+        """
+        return dump_state(self)
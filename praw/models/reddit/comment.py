@@ -60,6 +60,11 @@ class Comment(InboxableMixin, UserContentMixin, FullnameMixin, RedditBase):
 
     MISSING_COMMENT_MESSAGE = "This comment does not appear to be in the comment tree"
     STR_FIELD = "id"
+    _LEAN_ATTRIBUTES = {
+        "_replies": "replies",
+        "author": "author",
+        "subreddit": "subreddit",
+    }
 
     @staticmethod
     def id_from_url(url: str) -> str:
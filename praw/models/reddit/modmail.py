@@ -63,6 +63,7 @@ class ModmailConversation(RedditBase):
     """
 
     STR_FIELD = "id"
+    _LEAN_ATTRIBUTES = {"user": "user"}
 
     @staticmethod
     def _convert_conversation_objects(data: dict[str, Any], reddit: praw.Reddit):
@@ -112,13 +113,15 @@ class ModmailConversation(RedditBase):
         for entity in "owner", "participant":
             data[entity] = reddit._objector.objectify(data[entity])
 
-        if data.get("user"):
-            cls._convert_user_summary(data["user"], reddit)
-            data["user"] = reddit._objector.objectify(data["user"])
+        # The user summary is converted when ``user`` is first accessed.
+        lean_data = {"user": data.pop("user")} if data.get("user") else None
 
         data = snake_case_keys(data)
 
-        return cls(reddit, _data=data)
+        conversation = cls(reddit, _data=data)
+        if lean_data:
+            conversation._lean_data = lean_data
+        return conversation
 
     def __init__(
         self,
@@ -144,6 +147,13 @@ class ModmailConversation(RedditBase):
 
         self._info_params = {"markRead": True} if mark_read else None
 
+    def __setattr__(self, attribute: str, value: Any):
+        """Objectify the user summary."""
+        if attribute == "user" and value and isinstance(value, dict):
+            self._convert_user_summary(value, self._reddit)
+            value = self._reddit._objector.objectify(value)
+        super().__setattr__(attribute, value)
+
     def _build_conversation_list(
         self, other_conversations: list[ModmailConversation]
     ) -> str:
@@ -154,6 +164,7 @@ class ModmailConversation(RedditBase):
     def _fetch(self):
         data = self._fetch_data()
         other = self._reddit._objector.objectify(data)
+        self.__dict__.pop("user", None)
         self.__dict__.update(other.__dict__)
         super()._fetch()
 
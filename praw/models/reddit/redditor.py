@@ -80,7 +80,7 @@ class Redditor(MessageableMixin, RedditorListingMixin, FullnameMixin, RedditBase
         """Return an instance of :class:`.Redditor`, or ``None`` from ``data``."""
         if data == "[deleted]":
             return None
-        return cls(reddit, data)
+        return reddit.interner.get(cls, data, lambda: cls(reddit, data))
 
     @cachedproperty
     def notes(self) -> praw.models.RedditorModNotes:
@@ -456,6 +456,11 @@ class Submission(SubmissionListingMixin, UserContentMixin, FullnameMixin, Reddit
     """
 
     STR_FIELD = "id"
+    _LEAN_ATTRIBUTES = {
+        "author": "author",
+        "poll_data": "poll_data",
+        "subreddit": "subreddit",
+    }
 
     @staticmethod
     def id_from_url(url: str) -> str:
@@ -613,7 +618,9 @@ class Submission(SubmissionListingMixin, UserContentMixin, FullnameMixin, Reddit
         if attribute == "author":
             value = Redditor.from_data(self._reddit, value)
         elif attribute == "subreddit":
-            value = Subreddit(self._reddit, value)
+            value = self._reddit.interner.get(
+                Subreddit, value, lambda: Subreddit(self._reddit, value)
+            )
         elif attribute == "poll_data":
             value = PollData(self._reddit, value)
         elif (
@@ -5,7 +5,7 @@ import contextlib
 from copy import deepcopy
 from csv import writer
 from io import StringIO
-from json import dumps, loads
+from json import dumps
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Generator, Iterator
 from urllib.parse import urljoin
@@ -3084,7 +3084,7 @@ class Subreddit(MessageableMixin, SubredditListingMixin, FullnameMixin, RedditBa
             return None
 
         try:
-            ws_update = loads(connection.recv())
+            ws_update = self._reddit._json_backend.loads(connection.recv())
             connection.close()
         except (OSError, websocket.WebSocketException, BlockingIOError) as ws_exception:
             msg = "Websocket error. Check your media file. Your post may still have been created."
@@ -258,16 +258,14 @@ class SubredditWidgets(PRAWBase):
     @cachedproperty
     def id_card(self) -> praw.models.IDCard:
         """Get this :class:`.Subreddit`'s :class:`.IDCard` widget."""
-        return self.items[self.layout["idCardWidget"]]
+        return self._widget(self.layout["idCardWidget"])
 
     @cachedproperty
     def items(self) -> dict[str, praw.models.Widget]:
         """Get this :class:`.Subreddit`'s widgets as a dict from ID to widget."""
-        items = {}
-        for item_name, data in self._raw_items.items():
-            data["subreddit"] = self.subreddit
-            items[item_name] = self._reddit._objector.objectify(data)
-        return items
+        if not self._fetched:
+            self._fetch()
+        return {widget_id: self._widget(widget_id) for widget_id in self._raw_items}
 
     @cachedproperty
     def mod(self) -> praw.models.SubredditWidgetsModeration:
@@ -285,20 +283,20 @@ class SubredditWidgets(PRAWBase):
     @cachedproperty
     def moderators_widget(self) -> praw.models.ModeratorsWidget:
         """Get this :class:`.Subreddit`'s :class:`.ModeratorsWidget`."""
-        return self.items[self.layout["moderatorWidget"]]
+        return self._widget(self.layout["moderatorWidget"])
 
     @cachedproperty
     def sidebar(self) -> list[praw.models.Widget]:
         r"""Get a list of :class:`.Widget`\ s that make up the sidebar."""
         return [
-            self.items[widget_name] for widget_name in self.layout["sidebar"]["order"]
+            self._widget(widget_name) for widget_name in self.layout["sidebar"]["order"]
         ]
 
     @cachedproperty
     def topbar(self) -> list[praw.models.Menu]:
         r"""Get a list of :class:`.Widget`\ s that make up the top bar."""
         return [
-            self.items[widget_name] for widget_name in self.layout["topbar"]["order"]
+            self._widget(widget_name) for widget_name in self.layout["topbar"]["order"]
         ]
 
     def __getattr__(self, attr: str) -> Any:
@@ -316,6 +314,7 @@ class SubredditWidgets(PRAWBase):
 
         """
         self._raw_items = None
+        self._widgets = {}
         self._fetched = False
         self.subreddit = subreddit
         self.progressive_images = False
@@ -333,6 +332,7 @@ class SubredditWidgets(PRAWBase):
         )
 
         self._raw_items = data.pop("items")
+        self._widgets = {}
         super().__init__(self.subreddit._reddit, data)
 
         cached_property_names = [
@@ -348,6 +348,22 @@ class SubredditWidgets(PRAWBase):
 
         self._fetched = True
 
+    def _widget(self, widget_id: str) -> praw.models.Widget:
+        """Return the widget with ID ``widget_id``, building it on first access.
+
+        Only the raw data of widgets is kept when fetched, so that reading, e.g., the
+        :attr:`.id_card` does not build every other widget of the subreddit.
+
+        """
+        if not self._fetched:
+            self._fetch()
+        widget = self._widgets.get(widget_id)
+        if widget is None:
+            data = self._raw_items[widget_id]
+            data["subreddit"] = self.subreddit
+            widget = self._widgets[widget_id] = self._reddit._objector.objectify(data)
+        return widget
+
     def refresh(self):
         """Refresh the :class:`.Subreddit`'s widgets.
 
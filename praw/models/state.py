@@ -0,0 +1,134 @@
+"""Provide functions to convert models to and from compact, picklable states."""
+from __future__ import annotations
+
+from datetime import datetime
+from types import FunctionType
+from typing import TYPE_CHECKING, Any
+
+from ..util import cachedproperty
+from .base import PRAWBase
+from .comment_forest import CommentForest
+
+if TYPE_CHECKING:  # pragma: no cover
+    import praw
+
+DATETIME_KEY = "__praw_datetime__"
+KIND_KEY = "__praw__"
+REF_KEY = "__praw_ref__"
+_PRIMITIVES = (bool, float, int, str, type(None))
+_SKIPPED_ATTRIBUTES = frozenset({"_identity_cache", "_reddit"})
+
+
+def _classes() -> dict[str, type]:
+    classes = {CommentForest.__name__: CommentForest}
+    queue = [PRAWBase]
+    while queue:
+        cls = queue.pop()
+        classes[cls.__name__] = cls
+        queue.extend(cls.__subclasses__())
+    return classes
+
+
+class _Dumper:
+    def __init__(self):
+        self.references = {}
+
+    def dump(self, value: Any) -> Any:
+        if isinstance(value, _PRIMITIVES):
+            return value
+        if isinstance(value, list):
+            return [self.dump(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self.dump(item) for key, item in value.items()}
+        if isinstance(value, (frozenset, set, tuple)) and all(
+            isinstance(item, _PRIMITIVES) for item in value
+        ):
+            return value
+        if isinstance(value, (CommentForest, PRAWBase)):
+            return self.dump_object(value)
+        if isinstance(value, datetime):
+            return {DATETIME_KEY: value.isoformat()}
+        msg = f"Cannot convert {value.__class__.__name__!r} object to state."
+        raise TypeError(msg)
+
+    def dump_object(self, instance: CommentForest | PRAWBase) -> dict[str, Any]:
+        if id(instance) in self.references:
+            return {REF_KEY: self.references[id(instance)]}
+        self.references[id(instance)] = len(self.references)
+        data = {}
+        cls = instance.__class__
+        for attribute, value in instance.__dict__.items():
+            if (
+                attribute in _SKIPPED_ATTRIBUTES
+                or isinstance(getattr(cls, attribute, None), cachedproperty)
+                or isinstance(value, FunctionType)
+            ):
+                # Helpers, such as ``Submission.mod``, are created again when accessed,
+                # and functions, such as the deprecated dict methods of
+                # ``UserSubreddit``, are not data.
+                continue
+            data[attribute] = self.dump(value)
+        return {KIND_KEY: instance.__class__.__name__, "data": data}
+
+
+class _Loader:
+    def __init__(self, reddit: praw.Reddit):
+        self.classes = _classes()
+        self.instances = []
+        self.reddit = reddit
+
+    def load(self, value: Any) -> Any:
+        if isinstance(value, list):
+            return [self.load(item) for item in value]
+        if isinstance(value, dict):
+            if REF_KEY in value:
+                return self.instances[value[REF_KEY]]
+            if DATETIME_KEY in value:
+                return datetime.fromisoformat(value[DATETIME_KEY])
+            if KIND_KEY in value:
+                return self.load_object(value)
+            return {key: self.load(item) for key, item in value.items()}
+        return value
+
+    def load_object(self, state: dict[str, Any]) -> CommentForest | PRAWBase:
+        try:
+            cls = self.classes[state[KIND_KEY]]
+        except KeyError:
+            msg = f"Unknown kind {state[KIND_KEY]!r} in state."
+            raise ValueError(msg) from None
+        instance = cls.__new__(cls)
+        self.instances.append(instance)
+        if isinstance(instance, PRAWBase):
+            instance.__dict__["_reddit"] = self.reddit
+        for attribute, value in state["data"].items():
+            instance.__dict__[attribute] = self.load(value)
+        return instance
+
+
+def dump_state(instance: PRAWBase) -> dict[str, Any]:
+    """Return the state of ``instance`` as built-in types, without :class:`.Reddit`.
+
+    Attributes that hold other models, including :class:`.CommentForest` trees, are
+    converted recursively. Models referenced more than once, e.g., the submission of
+    each comment in a forest, are stored once. Helpers cached via
+    :class:`.cachedproperty`, such as ``Submission.mod``, are left out and created again
+    when accessed.
+
+    :param instance: The model to convert.
+
+    :raises: :py:class:`TypeError` if an attribute holds an object that cannot be
+        converted.
+
+    """
+    return _Dumper().dump_object(instance)
+
+
+def load_state(reddit: praw.Reddit, state: dict[str, Any]) -> PRAWBase:
+    """Return the model described by ``state``, attached to ``reddit``.
+
+    :param reddit: An instance of :class:`.Reddit` used by the model and every model
+        it references.
+    :param state: A state returned by :func:`.dump_state`.
+
+    """
+    return _Loader(reddit).load_object(state)
@@ -7,6 +7,7 @@ from collections import OrderedDict
 from typing import Any, Callable, Generator
 
 from ..util import _deprecate_args
+from ..util.rate_limit import RateLimitScheduler
 
 
 @_deprecate_args("permissions", "known_permissions")
@@ -72,7 +73,10 @@ def stream_generator(
         ``params``. The stream will continue from the item following this one (default:
         ``None``).
 
-    Additional keyword arguments will be passed to ``function``.
+    Additional keyword arguments will be passed to ``function``. When they include
+    ``raw=True``, the plain dictionaries yielded by the :class:`.ListingGenerator` are
+    streamed, and the ID is read from their ``"name"`` key in place of the
+    ``"fullname"`` attribute. The key is kept even when ``fields`` does not include it.
 
     .. note::
 
@@ -131,6 +135,10 @@ def stream_generator(
             print(comment)
 
     """
+    raw = function_kwargs.get("raw", False)
+    attribute_name = "name" if raw and attribute_name == "fullname" else attribute_name
+    if raw and function_kwargs.get("fields") is not None:
+        function_kwargs["fields"] = {*function_kwargs["fields"], attribute_name}
     before_attribute = continue_after_id
     exponential_counter = ExponentialCounter(max_counter=16)
     seen_attributes = BoundedSet(301)
@@ -146,8 +154,10 @@ def stream_generator(
             without_before_counter = (without_before_counter + 1) % 30
         if not exclude_before:
             function_kwargs["params"] = {"before": before_attribute}
-        for item in reversed(list(function(limit=limit, **function_kwargs))):
-            attribute = getattr(item, attribute_name)
+        with RateLimitScheduler.default_priority("normal"):
+            items = list(function(limit=limit, **function_kwargs))
+        for item in reversed(items):
+            attribute = item[attribute_name] if raw else getattr(item, attribute_name)
             if attribute in seen_attributes:
                 continue
             found = True
@@ -1,9 +1,10 @@
 """Provides the Objector class."""
 from __future__ import annotations
 
+from contextlib import contextmanager
 from datetime import datetime
-from json import loads
-from typing import TYPE_CHECKING, Any
+from threading import local
+from typing import TYPE_CHECKING, Any, Callable, Generator
 
 from .exceptions import ClientException, RedditAPIException
 from .util import snake_case_keys
@@ -13,10 +14,69 @@ if TYPE_CHECKING:  # pragma: no cover
 
     from .models.reddit.base import RedditBase
 
+# The rules used to objectify dicts, in order of precedence. A dict matches a rule when
+# its keys include all the keys of one of the rule's alternatives.
+_DICT_RULES = (
+    (
+        (
+            {"conversations", "messages", "modActions"},
+            {"conversation", "messages", "modActions"},
+        ),
+        "_objectify_modmail_fetched_conversation",
+    ),
+    (
+        ({"messages", "modActions"}, {"legacyFirstMessageId", "state"}),
+        "_objectify_modmail_conversation",
+    ),
+    (
+        ({"conversationIds", "conversations", "messages"},),
+        "_objectify_modmail_conversations",
+    ),
+    (({"actionTypeId", "author", "date"},), "_objectify_modmail_action"),
+    (({"bodyMarkdown", "isInternal"},), "_objectify_modmail_message"),
+    (({"kind", "short_name", "violation_reason"},), "_objectify_rule"),
+    (({"isAdmin", "isDeleted"},), "_objectify_modmail_author"),
+    (({"banStatus", "muteStatus", "recentComments"},), "_objectify_modmail_user"),
+    (({"displayName", "id", "type"},), "_objectify_modmail_subreddit"),
+    (({"date", "id", "name"}, {"id", "name", "permissions"}), "_objectify_redditor"),
+    (({"text", "url"},), "_objectify_button_or_menu_link"),
+    (({"children", "text"},), "_objectify_submenu"),
+    (({"height", "url", "width"},), "_objectify_image"),
+    (({"isSubscribed", "name", "subscribers"},), "_objectify_subreddit_name"),
+    (({"authorFlairType", "name"},), "_objectify_redditor_name"),
+    (({"parent_id"},), "_objectify_comment"),
+    (({"collection_id"},), "_objectify_collection"),
+    (
+        ({"allUsersLoaded", "moderatorIds", "moderators", "subredditId"},),
+        "_objectify_moderator_list",
+    ),
+    (({"username"},), "_objectify_username"),
+    (
+        ({"mod_permissions", "name", "sr", "subscribers"},),
+        "_objectify_moderated_subreddit",
+    ),
+    (({"drafts", "subreddits"},), "_objectify_draft_list"),
+    (({"mod_action_data", "user_note_data"},), "_objectify_mod_note"),
+    (({"created"},), "_objectify_created"),
+)
+
 
 class Objector:
     """The objector builds :class:`.RedditBase` objects."""
 
+    MAX_DICT_HANDLERS = 4096
+
+    _dict_handlers = {}
+    _local = local()
+
+    @staticmethod
+    def _dict_handler(keys: frozenset[str]) -> str:
+        """Return the name of the method objectifying dicts with the given keys."""
+        for alternatives, handler in _DICT_RULES:
+            if any(alternative.issubset(keys) for alternative in alternatives):
+                return handler
+        return "_objectify_unknown"
+
     @classmethod
     def check_error(cls, data: list[Any] | dict[str, dict[str, str]]):
         """Raise an error if the argument resolves to an error object."""
@@ -57,163 +117,260 @@ class Objector:
 
         """
         self.parsers = {} if parsers is None else parsers
+        self._listing_kinds = {
+            reddit.config.kinds[kind]
+            for kind in ("comment", "message", "submission", "subreddit")
+        }
+        self._projected_kinds = {
+            reddit.config.kinds[kind] for kind in ("comment", "submission", "subreddit")
+        }
         self._reddit = reddit
 
-    def _objectify_dict(  # noqa: PLR0912,PLR0915
-        self, data: dict[str, Any]
-    ) -> RedditBase:
+    def _kind_parser(self, kind: str) -> Any:
+        return self.parsers[self._reddit.config.kinds[kind]]
+
+    def _objectify_button_or_menu_link(self, data: dict[str, Any]) -> RedditBase:
+        if "color" in data or "linkUrl" in data:
+            return self.parsers["Button"].parse(data, self._reddit)
+        return self.parsers["MenuLink"].parse(data, self._reddit)
+
+    def _objectify_collection(self, data: dict[str, Any]) -> RedditBase:
+        return self.parsers["Collection"].parse(data, self._reddit)
+
+    def _objectify_comment(self, data: dict[str, Any]) -> RedditBase:
+        return self._kind_parser("comment").parse(data, self._reddit)
+
+    def _objectify_created(self, data: dict[str, Any]) -> Any:
+        if isinstance(data["created"], dict) and {
+            "mod_action_data",
+            "user_note_data",
+        }.issubset(data["created"]):
+            return self._objectify_dict(data["created"])
+        return self._objectify_unknown(data)
+
+    def _objectify_dict(self, data: dict[str, Any]) -> Any:
         """Create :class:`.RedditBase` objects from dicts.
 
+        The handler for a dict is chosen by the first rule in ``_DICT_RULES`` matched
+        by its keys, and memoized per set of keys.
+
         :param data: The structured data, assumed to be a dict.
 
-        :returns: An instance of :class:`.RedditBase`.
+        :returns: An instance of :class:`.RedditBase`, or ``data`` if no rule matches.
 
         """
-        if {"messages", "modActions"}.issubset(data) and {
-            "conversations",
-            "conversation",
-        }.intersection(data):
-            # fetched conversation
-            data.update(
-                data.pop("conversation")
-                if "conversation" in data
-                else data.pop("conversations")
-            )
-            parser = self.parsers["ModmailConversation"]
-            parser._convert_conversation_objects(data, self._reddit)
-        elif {"messages", "modActions"}.issubset(data) or {
-            "legacyFirstMessageId",
-            "state",
-        }.issubset(data):
-            # not fetched conversation i.e., from conversations()
-            del data["objIds"]  # delete objIds since it could be missing data
-            parser = self.parsers["ModmailConversation"]
-        elif {"conversationIds", "conversations", "messages"}.issubset(data):
-            # modmail conversations
-            conversations = []
-            for conversation_id in data["conversationIds"]:
-                conversation = data["conversations"][conversation_id]
-                # set if the numMessages is same as number of messages in objIds
-                if conversation["numMessages"] == len(
-                    [obj for obj in conversation["objIds"] if obj["key"] == "messages"]
-                ):
-                    conversation["messages"] = [
-                        self.objectify(data["messages"][obj_id["id"]])
-                        for obj_id in conversation["objIds"]
-                    ]
-                conversations.append(conversation)
-            data["conversations"] = conversations
-            data = snake_case_keys(data)
-            parser = self.parsers["ModmailConversations-list"]
-        elif {"actionTypeId", "author", "date"}.issubset(data):
-            # Modmail mod action
-            data = snake_case_keys(data)
-            parser = self.parsers["ModmailAction"]
-        elif {"bodyMarkdown", "isInternal"}.issubset(data):
-            # Modmail message
-            data = snake_case_keys(data)
-            parser = self.parsers["ModmailMessage"]
-        elif {"kind", "short_name", "violation_reason"}.issubset(data):
-            # This is a Rule
-            parser = self.parsers["rule"]
-        elif {"isAdmin", "isDeleted"}.issubset(data):
-            # Modmail author
-            data = snake_case_keys(data)
-            # Prevent clobbering base-36 id
-            del data["id"]
-            data["is_subreddit_mod"] = data.pop("is_mod")
-            parser = self.parsers[self._reddit.config.kinds["redditor"]]
-        elif {"banStatus", "muteStatus", "recentComments"}.issubset(data):
-            # Modmail user
-            data = snake_case_keys(data)
-            data["created_string"] = data.pop("created")
-            parser = self.parsers[self._reddit.config.kinds["redditor"]]
-        elif {"displayName", "id", "type"}.issubset(data):
-            # Modmail subreddit
-            data = snake_case_keys(data)
-            parser = self.parsers[self._reddit.config.kinds[data["type"]]]
-        elif {"date", "id", "name"}.issubset(data) or {
-            "id",
-            "name",
-            "permissions",
-        }.issubset(data):
-            parser = self.parsers[self._reddit.config.kinds["redditor"]]
-        elif {"text", "url"}.issubset(data):
-            if "color" in data or "linkUrl" in data:
-                parser = self.parsers["Button"]
-            else:
-                parser = self.parsers["MenuLink"]
-        elif {"children", "text"}.issubset(data):
-            parser = self.parsers["Submenu"]
-        elif {"height", "url", "width"}.issubset(data):
-            parser = self.parsers["Image"]
-        elif {"isSubscribed", "name", "subscribers"}.issubset(data):
-            # discards icon and subscribed information
-            return self._reddit.subreddit(data["name"])
-        elif {"authorFlairType", "name"}.issubset(data):
-            # discards flair information
-            return self._reddit.redditor(data["name"])
-        elif {"parent_id"}.issubset(data):
-            parser = self.parsers[self._reddit.config.kinds["comment"]]
-        elif "collection_id" in data:
-            parser = self.parsers["Collection"]
-        elif {"moderators", "moderatorIds", "allUsersLoaded", "subredditId"}.issubset(
-            data
-        ):
-            data = snake_case_keys(data)
-            moderators = []
-            for mod_id in data["moderator_ids"]:
-                mod = snake_case_keys(data["moderators"][mod_id])
-                mod["mod_permissions"] = list(mod["mod_permissions"].keys())
-                moderators.append(mod)
-            data["moderators"] = moderators
-            parser = self.parsers["moderator-list"]
-        elif "username" in data:
-            data["name"] = data.pop("username")
-            parser = self.parsers[self._reddit.config.kinds["redditor"]]
-        elif {"mod_permissions", "name", "sr", "subscribers"}.issubset(data):
-            data["display_name"] = data["sr"]
-            parser = self.parsers[self._reddit.config.kinds["subreddit"]]
-        elif {"drafts", "subreddits"}.issubset(data):  # Draft list
-            subreddit_parser = self.parsers[self._reddit.config.kinds["subreddit"]]
-            user_subreddit_parser = self.parsers["UserSubreddit"]
-            subreddits = {
-                subreddit["name"]: user_subreddit_parser.parse(subreddit, self._reddit)
-                if subreddit["display_name_prefixed"].startswith("u/")
-                else subreddit_parser.parse(subreddit, self._reddit)
-                for subreddit in data.pop("subreddits")
-            }
-            for draft in data["drafts"]:
-                if draft["subreddit"]:
-                    draft["subreddit"] = subreddits[draft["subreddit"]]
-                draft["modified"] = datetime.fromtimestamp(
-                    draft["modified"] / 1000
-                ).astimezone()
-            parser = self.parsers["DraftList"]
-        elif {"mod_action_data", "user_note_data"}.issubset(data):
-            data["moderator"] = self._reddit.redditor(data["operator"])
-            data["subreddit"] = self._reddit.subreddit(data["subreddit"])
-            data["user"] = self._reddit.redditor(data["user"])
-            # move these sub dict values into the main dict for simplicity
-            data.update(data["mod_action_data"])
-            del data["mod_action_data"]
-            data.update(data["user_note_data"])
-            del data["user_note_data"]
-            parser = self.parsers["mod_note"]
-        elif (
-            "created" in data
-            and isinstance(data["created"], dict)
-            and {"mod_action_data", "user_note_data"}.issubset(data["created"])
+        keys = frozenset(data)
+        handler = self._dict_handlers.get(keys)
+        if handler is None:
+            handler = self._dict_handler(keys)
+            if len(self._dict_handlers) >= self.MAX_DICT_HANDLERS:
+                self._dict_handlers.clear()
+            self._dict_handlers[keys] = handler
+        return getattr(self, handler)(data)
+
+    def _objectify_draft_list(self, data: dict[str, Any]) -> RedditBase:
+        subreddit_parser = self._kind_parser("subreddit")
+        user_subreddit_parser = self.parsers["UserSubreddit"]
+        subreddits = {
+            subreddit["name"]: user_subreddit_parser.parse(subreddit, self._reddit)
+            if subreddit["display_name_prefixed"].startswith("u/")
+            else subreddit_parser.parse(subreddit, self._reddit)
+            for subreddit in data.pop("subreddits")
+        }
+        for draft in data["drafts"]:
+            if draft["subreddit"]:
+                draft["subreddit"] = subreddits[draft["subreddit"]]
+            draft["modified"] = datetime.fromtimestamp(
+                draft["modified"] / 1000
+            ).astimezone()
+        return self.parsers["DraftList"].parse(data, self._reddit)
+
+    def _objectify_image(self, data: dict[str, Any]) -> RedditBase:
+        return self.parsers["Image"].parse(data, self._reddit)
+
+    def _objectify_listing_children(self, data: list[Any]) -> list[Any] | None:
+        """Create the objects of a list of things that all have the same kind.
+
+        :param data: The structured data, assumed to be a non-empty list.
+
+        :returns: A list of instances of :class:`.RedditBase`, or ``None`` if ``data``
+            is not a list of comments, messages, submissions, or subreddits of a single
+            kind.
+
+        """
+        first = data[0]
+        kind = first.get("kind") if isinstance(first, dict) else None
+        if kind not in self._listing_kinds:
+            return None
+        for item in data:
+            if not (
+                isinstance(item, dict)
+                and len(item) == 2
+                and item.get("kind") == kind
+                and "data" in item
+            ):
+                return None
+        parser = self.parsers[kind]
+        if (
+            getattr(self._local, "lean", False)
+            and getattr(parser, "_LEAN_ATTRIBUTES", None) is not None
         ):
-            data = data["created"]
-            return self._objectify_dict(data)
+            parse = parser._parse_lean
         else:
-            if "user" in data:
-                parser = self.parsers[self._reddit.config.kinds["redditor"]]
-                data["user"] = parser.parse({"name": data["user"]}, self._reddit)
-            return data
+            parse = parser.parse
+        fields = getattr(self._local, "fields", None)
+        if fields is not None and kind in self._projected_kinds:
+            return [
+                self._parse_projected(parse, parser.STR_FIELD, item["data"], fields)
+                for item in data
+            ]
+        reddit = self._reddit
+        return [parse(item["data"], reddit) for item in data]
+
+    def _objectify_mod_note(self, data: dict[str, Any]) -> RedditBase:
+        data["moderator"] = self._reddit.redditor(data["operator"])
+        data["subreddit"] = self._reddit.subreddit(data["subreddit"])
+        data["user"] = self._reddit.redditor(data["user"])
+        # move these sub dict values into the main dict for simplicity
+        data.update(data["mod_action_data"])
+        del data["mod_action_data"]
+        data.update(data["user_note_data"])
+        del data["user_note_data"]
+        return self.parsers["mod_note"].parse(data, self._reddit)
+
+    def _objectify_moderated_subreddit(self, data: dict[str, Any]) -> RedditBase:
+        data["display_name"] = data["sr"]
+        return self._kind_parser("subreddit").parse(data, self._reddit)
+
+    def _objectify_moderator_list(self, data: dict[str, Any]) -> RedditBase:
+        data = snake_case_keys(data)
+        moderators = []
+        for mod_id in data["moderator_ids"]:
+            mod = snake_case_keys(data["moderators"][mod_id])
+            mod["mod_permissions"] = list(mod["mod_permissions"].keys())
+            moderators.append(mod)
+        data["moderators"] = moderators
+        return self.parsers["moderator-list"].parse(data, self._reddit)
+
+    def _objectify_modmail_action(self, data: dict[str, Any]) -> RedditBase:
+        return self.parsers["ModmailAction"].parse(snake_case_keys(data), self._reddit)
+
+    def _objectify_modmail_author(self, data: dict[str, Any]) -> RedditBase:
+        data = snake_case_keys(data)
+        # Prevent clobbering base-36 id
+        del data["id"]
+        data["is_subreddit_mod"] = data.pop("is_mod")
+        return self._kind_parser("redditor").parse(data, self._reddit)
+
+    def _objectify_modmail_conversation(self, data: dict[str, Any]) -> RedditBase:
+        # not fetched conversation i.e., from conversations()
+        del data["objIds"]  # delete objIds since it could be missing data
+        return self.parsers["ModmailConversation"].parse(data, self._reddit)
+
+    def _objectify_modmail_conversations(self, data: dict[str, Any]) -> RedditBase:
+        conversations = []
+        for conversation_id in data["conversationIds"]:
+            conversation = data["conversations"][conversation_id]
+            # set if the numMessages is same as number of messages in objIds
+            if conversation["numMessages"] == sum(
+                obj["key"] == "messages" for obj in conversation["objIds"]
+            ):
+                conversation["messages"] = [
+                    self.objectify(data["messages"][obj_id["id"]])
+                    for obj_id in conversation["objIds"]
+                ]
+            conversations.append(conversation)
+        data["conversations"] = conversations
+        data = snake_case_keys(data)
+        return self.parsers["ModmailConversations-list"].parse(data, self._reddit)
+
+    def _objectify_modmail_fetched_conversation(
+        self, data: dict[str, Any]
+    ) -> RedditBase:
+        data.update(
+            data.pop("conversation")
+            if "conversation" in data
+            else data.pop("conversations")
+        )
+        parser = self.parsers["ModmailConversation"]
+        parser._convert_conversation_objects(data, self._reddit)
         return parser.parse(data, self._reddit)
 
+    def _objectify_modmail_message(self, data: dict[str, Any]) -> RedditBase:
+        return self.parsers["ModmailMessage"].parse(snake_case_keys(data), self._reddit)
+
+    def _objectify_modmail_subreddit(self, data: dict[str, Any]) -> RedditBase:
+        data = snake_case_keys(data)
+        return self._kind_parser(data["type"]).parse(data, self._reddit)
+
+    def _objectify_modmail_user(self, data: dict[str, Any]) -> RedditBase:
+        data = snake_case_keys(data)
+        data["created_string"] = data.pop("created")
+        return self._kind_parser("redditor").parse(data, self._reddit)
+
+    def _objectify_redditor(self, data: dict[str, Any]) -> RedditBase:
+        return self._kind_parser("redditor").parse(data, self._reddit)
+
+    def _objectify_redditor_name(self, data: dict[str, Any]) -> RedditBase:
+        # discards flair information
+        return self._reddit.redditor(data["name"])
+
+    def _objectify_rule(self, data: dict[str, Any]) -> RedditBase:
+        return self.parsers["rule"].parse(data, self._reddit)
+
+    def _objectify_submenu(self, data: dict[str, Any]) -> RedditBase:
+        return self.parsers["Submenu"].parse(data, self._reddit)
+
+    def _objectify_subreddit_name(self, data: dict[str, Any]) -> RedditBase:
+        # discards icon and subscribed information
+        return self._reddit.subreddit(data["name"])
+
+    def _objectify_unknown(self, data: dict[str, Any]) -> dict[str, Any]:
+        if "user" in data:
+            parser = self._kind_parser("redditor")
+            data["user"] = parser.parse({"name": data["user"]}, self._reddit)
+        return data
+
+    def _objectify_username(self, data: dict[str, Any]) -> RedditBase:
+        data["name"] = data.pop("username")
+        return self._kind_parser("redditor").parse(data, self._reddit)
+
+    def _parse_projected(
+        self,
+        parse: Callable[[dict[str, Any], praw.Reddit], RedditBase],
+        str_field: str,
+        data: dict[str, Any],
+        fields: frozenset[str],
+    ) -> RedditBase:
+        instance = parse(
+            {
+                key: value
+                for key, value in data.items()
+                if key in fields or key == str_field
+            },
+            self._reddit,
+        )
+        instance._fields = fields
+        return instance
+
+    @contextmanager
+    def lean(self) -> Generator[None, None, None]:
+        """Build lean comments and submissions from listings within the block.
+
+        Lean instances are only built in the current thread, and when the
+        ``lean_models`` setting is enabled.
+
+        """
+        if not self._reddit.config.lean_models:
+            yield
+            return
+        previous = getattr(self._local, "lean", False)
+        self._local.lean = True
+        try:
+            yield
+        finally:
+            self._local.lean = previous
+
     def objectify(  # noqa: PLR0911,PLR0912,PLR0915
         self, data: dict[str, Any] | list[Any] | bool | None
     ) -> RedditBase | dict[str, Any] | list[Any] | bool | None:
@@ -228,6 +385,10 @@ class Objector:
         if data is None:  # 204 no content
             return None
         if isinstance(data, list):
+            if data:
+                children = self._objectify_listing_children(data)
+                if children is not None:
+                    return children
             return [self.objectify(item) for item in data]
         if isinstance(data, bool):  # Reddit.username_available
             return data
@@ -245,6 +406,11 @@ class Objector:
             parser = self.parsers[data["kind"]]
             if data["kind"] == "ModeratedList":
                 return parser.parse(data, self._reddit)
+            fields = getattr(self._local, "fields", None)
+            if fields is not None and data["kind"] in self._projected_kinds:
+                return self._parse_projected(
+                    parser.parse, parser.STR_FIELD, data["data"], fields
+                )
             return parser.parse(data["data"], self._reddit)
         if "json" in data and "data" in data["json"]:
             if "websocket_url" in data["json"]["data"]:
@@ -252,7 +418,9 @@ class Objector:
             if "things" in data["json"]["data"]:  # Submission.reply
                 return self.objectify(data["json"]["data"]["things"])
             if "rules" in data["json"]["data"]:
-                return self.objectify(loads(data["json"]["data"]["rules"]))
+                return self.objectify(
+                    self._reddit._json_backend.loads(data["json"]["data"]["rules"])
+                )
             if "drafts_count" in data["json"]["data"] and all(
                 key not in data["json"]["data"] for key in ["name", "url"]
             ):  # Draft
@@ -281,3 +449,24 @@ class Objector:
         if isinstance(data, dict):
             return self._objectify_dict(data)
         return data
+
+    @contextmanager
+    def projection(self, fields: frozenset[str] | None) -> Generator[None, None, None]:
+        """Only keep the given attributes of comments, submissions, and subreddits.
+
+        Within the block, other attributes are dropped before these objects are built in
+        the current thread, and accessing them raises an ``AttributeError``.
+
+        :param fields: The names of the attributes to keep, or ``None`` to keep all of
+            them.
+
+        """
+        if fields is None:
+            yield
+            return
+        previous = getattr(self._local, "fields", None)
+        self._local.fields = fields
+        try:
+            yield
+        finally:
+            self._local.fields = previous
@@ -6,6 +6,10 @@ import configparser
 import os
 import re
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import partial
 from itertools import islice
 from logging import getLogger
 from typing import IO, TYPE_CHECKING, Any, Generator, Iterable
@@ -35,6 +39,20 @@ from .exceptions import (
 )
 from .objector import Objector
 from .util import _deprecate_args
+from .util.async_iterator import AsyncExecutor, AsyncIterator
+from .util.cache import (
+    ConditionalRequestCache,
+    ResponseCache,
+    SingleFlight,
+    request_key,
+)
+from .util.deadline import Deadline
+from .util.deferred_writes import DeferredWriteQueue
+from .util.interning import Interner
+from .util.json_backend import JSONBackend
+from .util.metrics import RequestInfo, RequestMetrics
+from .util.rate_limit import RateLimitScheduler
+from .util.retry import RetryPolicy
 
 try:
     from update_checker import update_check
@@ -49,6 +67,7 @@ if TYPE_CHECKING:  # pragma: no cover
 
     import praw.models
 
+    from .util.connection_pool import ConnectionPool
     from .util.token_manager import BaseTokenManager
 
 Comment = models.Comment
@@ -142,6 +161,7 @@ class Reddit:
 
     def __exit__(self, *_: object):
         """Handle the context manager close."""
+        self.async_executor.shutdown()
 
     @_deprecate_args(
         "site_name",
@@ -150,11 +170,12 @@ class Reddit:
         "requestor_kwargs",
         "token_manager",
     )
-    def __init__(
+    def __init__(  # noqa: PLR0915
         self,
         site_name: str | None = None,
         *,
         config_interpolation: str | None = None,
+        connection_pool: ConnectionPool | None = None,
         requestor_class: type[prawcore.requestor.Requestor] | None = None,
         requestor_kwargs: dict[str, Any] | None = None,
         token_manager: BaseTokenManager | None = None,
@@ -171,6 +192,11 @@ class Reddit:
             there, the ``DEFAULT`` site will be used (default: ``None``).
         :param config_interpolation: Config parser interpolation type that will be
             passed to :class:`.Config` (default: ``None``).
+        :param connection_pool: A :class:`.ConnectionPool` whose connections are used
+            to issue requests. Pass the same instance to several :class:`.Reddit`
+            instances to share their connections. When set, the requestor is
+            initialized with a ``session`` using the pool. This parameter cannot be used
+            with a ``session`` in ``requestor_kwargs`` (default: ``None``).
         :param requestor_class: A class that will be used to create a requestor. If not
             set, use ``prawcore.Requestor`` (default: ``None``).
         :param requestor_kwargs: Dictionary with additional keyword arguments used to
@@ -262,12 +288,32 @@ class Reddit:
             msg = f"{required_message.format('client_secret')}\nFor installed applications this value must be set to None via a keyword argument to the Reddit class constructor."
             raise MissingRequiredAttributeException(msg)
 
+        self._single_flight = SingleFlight()
+        self._conditional_cache = ConditionalRequestCache(
+            enabled=self.config.conditional_requests,
+            max_bytes=self.config.cache_max_bytes,
+        )
+        self._json_backend = JSONBackend(self.config.json_backend)
         self._check_for_update()
         self._prepare_objector()
+        if connection_pool is not None and "session" in (requestor_kwargs or {}):
+            msg = "At most one of 'connection_pool' or a 'session' in 'requestor_kwargs' is supported."
+            raise TypeError(msg)
         self._prepare_prawcore(
-            requestor_class=requestor_class, requestor_kwargs=requestor_kwargs
+            connection_pool=connection_pool,
+            requestor_class=requestor_class,
+            requestor_kwargs=requestor_kwargs,
         )
 
+        self.async_executor = AsyncExecutor(max_workers=self.config.async_max_workers)
+        """An instance of :class:`.AsyncExecutor`.
+
+        Provides the threads used by :meth:`.async_iterator` to fetch items without
+        blocking the event loop. At most ``async_max_workers`` iterators are advanced at
+        the same time.
+
+        """
+
         self.auth = models.Auth(self, None)
         """An instance of :class:`.Auth`.
 
@@ -279,6 +325,36 @@ class Reddit:
 
         """
 
+        self.cache = ResponseCache(
+            default_ttl=self.config.cache_ttl,
+            max_bytes=self.config.cache_max_bytes,
+            ttls=self.config.cache_ttls,
+        )
+        """An instance of :class:`.ResponseCache`.
+
+        Caches the responses of ``GET`` requests when the ``cache_ttl`` or
+        ``cache_ttl_<name>`` settings are configured. For example, to fetch a subreddit
+        without using cached responses, run:
+
+        .. code-block:: python
+
+            with reddit.cache.bypass():
+                reddit.subreddit("test")._fetch()
+
+        """
+
+        self.connection_pool = connection_pool
+        """The :class:`.ConnectionPool` used to issue requests.
+
+        ``None`` unless a pool is passed via the ``connection_pool`` parameter. For
+        example, to see how many connections are open to each host, run:
+
+        .. code-block:: python
+
+            print(reddit.connection_pool.stats()["hosts"])
+
+        """
+
         self.drafts = models.DraftHelper(self, None)
         """An instance of :class:`.DraftHelper`.
 
@@ -324,6 +400,14 @@ class Reddit:
 
         """
 
+        self.interner = Interner(enabled=self.config.intern_models)
+        """An instance of :class:`.Interner`.
+
+        Shares lazy :class:`.Subreddit` and :class:`.Redditor` instances by name when
+        the ``intern_models`` setting is enabled.
+
+        """
+
         self.live = models.LiveHelper(self, None)
         """An instance of :class:`.LiveHelper`.
 
@@ -336,6 +420,18 @@ class Reddit:
 
         """
 
+        self.metrics = RequestMetrics()
+        """An instance of :class:`.RequestMetrics`.
+
+        Counts the requests issued by this instance, along with their errors, retries,
+        HTTP status codes, received bytes, and elapsed time. For example:
+
+        .. code-block:: python
+
+            print(reddit.metrics.snapshot()["requests"])
+
+        """
+
         self.multireddit = models.MultiredditHelper(self, None)
         """An instance of :class:`.MultiredditHelper`.
 
@@ -373,6 +469,27 @@ class Reddit:
 
         """
 
+        self.request_hooks = {"post": [], "pre": []}
+        """A dictionary of lists of functions called for every request.
+
+        Functions in ``request_hooks["pre"]`` are called before a request is issued, and
+        functions in ``request_hooks["post"]`` once it completes, successfully or not.
+        Each is passed a :class:`.RequestInfo` describing the request, which includes
+        its timing, HTTP status code, received bytes, retry count, and ratelimit
+        headers. Requests answered by :attr:`.cache` are not issued and do not call the
+        hooks. For example, to log slow requests:
+
+        .. code-block:: python
+
+            def log_slow_request(info):
+                if info.elapsed > 2:
+                    print(f"{info.method} {info.path} took {info.elapsed:.1f}s")
+
+
+            reddit.request_hooks["post"].append(log_slow_request)
+
+        """
+
         self.redditors = models.Redditors(self, None)
         """An instance of :class:`.Redditors`.
 
@@ -386,6 +503,40 @@ class Reddit:
 
         """
 
+        self.retry_policy = RetryPolicy()
+        """An instance of :class:`.RetryPolicy`.
+
+        Controls how requests failing with server errors or timeouts are retried, and
+        whether requests fail fast during a Reddit outage. By default, requests are not
+        retried beyond the retries made by prawcore. For example, to retry ``GET``
+        requests failing with a server error up to three times:
+
+        .. code-block:: python
+
+            from prawcore.exceptions import ServerError
+
+            from praw.util.retry import RetryPolicy
+
+            reddit.retry_policy = RetryPolicy(
+                methods={"DELETE": 0, "PATCH": 0, "POST": 0, "PUT": 0},
+                retries={ServerError: 3},
+            )
+
+        """
+
+        self.scheduler = RateLimitScheduler()
+        """An instance of :class:`.RateLimitScheduler`.
+
+        Hands out request slots by priority based on the ratelimit budget reported by
+        Reddit. By default, the last 100 requests of every ratelimit window are kept for
+        requests other than listings. For example, to keep the last 200 instead, run:
+
+        .. code-block:: python
+
+            reddit.scheduler.reserves["low"] = 200
+
+        """
+
         self.subreddit = models.SubredditHelper(self, None)
         """An instance of :class:`.SubredditHelper`.
 
@@ -437,29 +588,39 @@ class Reddit:
 
         """
 
+        self.write_queue = DeferredWriteQueue(self)
+        """An instance of :class:`.DeferredWriteQueue`.
+
+        Retries rate limited writes in a background thread rather than sleeping in the
+        calling thread. For example, to reply to a comment without blocking on a
+        ``RATELIMIT`` error:
+
+        .. code-block:: python
+
+            future = reddit.write_queue.submit(comment.reply, "Hello!")
+
+        """
+
     def _check_for_async(self):
         if self.config.check_for_async:  # pragma: no cover
+            # This runs for every request, so the common case, without a running event
+            # loop, is answered without raising and catching an exception
+            if asyncio._get_running_loop() is None:
+                return
             try:
                 shell = get_ipython().__class__.__name__
                 if shell == "ZMQInteractiveShell":
                     return
             except NameError:
                 pass
-            in_async = False
-            try:
-                asyncio.get_running_loop()
-                in_async = True
-            except Exception:  # noqa: BLE001,S110
-                pass  # Quietly fail if any exception occurs during the check
-            if in_async:
-                logger.warning(
-                    "It appears that you are using PRAW in an asynchronous"
-                    " environment.\nIt is strongly recommended to use Async PRAW:"
-                    " https://asyncpraw.readthedocs.io.\nSee"
-                    " https://praw.readthedocs.io/en/latest/getting_started/multiple_instances.html#discord-bots-and-"
-                    "asynchronous-environments"
-                    " for more info.\n",
-                )
+            logger.warning(
+                "It appears that you are using PRAW in an asynchronous"
+                " environment.\nIt is strongly recommended to use Async PRAW:"
+                " https://asyncpraw.readthedocs.io.\nSee"
+                " https://praw.readthedocs.io/en/latest/getting_started/multiple_instances.html#discord-bots-and-"
+                "asynchronous-environments"
+                " for more info.\n",
+            )
 
     def _check_for_update(self):
         if UPDATE_CHECKER_MISSING:
@@ -483,6 +644,134 @@ class Reddit:
                     return seconds + 1
         return None
 
+    def _info(
+        self, params: dict[str, str], *, fields: frozenset[str] | None, raw: bool
+    ) -> Any:
+        if raw:
+            response = self.get(API_PATH["info"], params=params, raw=True)
+            if fields is None:
+                return [child["data"] for child in response["data"]["children"]]
+            return [
+                {
+                    key: value
+                    for key, value in child["data"].items()
+                    if key in fields or key == "name"
+                }
+                for child in response["data"]["children"]
+            ]
+        with self._objector.projection(fields):
+            return self.get(API_PATH["info"], params=params)
+
+    def _info_in_context(
+        self,
+        params: dict[str, str],
+        *,
+        deadlines: tuple[Deadline, ...],
+        fields: frozenset[str] | None,
+        lane: str | None,
+        raw: bool,
+    ) -> Any:
+        """Return the result of :meth:`._info` within the context of another thread."""
+        with ExitStack() as stack:
+            for deadline in deadlines:
+                stack.enter_context(deadline)
+            if lane is not None:
+                stack.enter_context(RateLimitScheduler.priority(lane))
+            return self._info(params, fields=fields, raw=raw)
+
+    def _info_concurrently(
+        self,
+        params: Iterable[dict[str, str]],
+        *,
+        fields: frozenset[str] | None,
+        max_workers: int,
+        raw: bool,
+    ) -> Generator[Any, None, None]:
+        """Yield the results of ``info`` requests issued from a pool of threads.
+
+        At most ``max_workers`` requests are in flight at once, and results are yielded
+        in the order of ``params``. The deadlines active and the priority lane chosen in
+        the calling thread apply to every request.
+
+        """
+        deadlines = Deadline.active()
+        lane = RateLimitScheduler.chosen_lane()
+        pending = deque()
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="praw-info"
+        ) as executor:
+            try:
+                for chunk_params in params:
+                    pending.append(
+                        executor.submit(
+                            self._info_in_context,
+                            chunk_params,
+                            deadlines=deadlines,
+                            fields=fields,
+                            lane=lane,
+                            raw=raw,
+                        )
+                    )
+                    if len(pending) >= max_workers:
+                        yield from pending.popleft().result()
+                while pending:
+                    yield from pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _issue_request(
+        self,
+        *,
+        data: dict[str, str | Any] | bytes | IO | str | None,
+        files: dict[str, IO] | None,
+        json: dict[Any, Any] | list[Any] | None,
+        method: str,
+        params: str | dict[str, str | int] | None,
+        path: str,
+    ) -> Any:
+        """Issue a request through prawcore once the scheduler grants a slot."""
+        info = RequestInfo(method=method, params=params, path=path)
+        for hook in self.request_hooks["pre"]:
+            hook(info)
+        try:
+            with info.track():
+                return self.retry_policy.call(
+                    partial(
+                        self._scheduled_request,
+                        data=data,
+                        files=files,
+                        json=json,
+                        method=method,
+                        params=params,
+                        path=path,
+                    ),
+                    method=method,
+                )
+        except BadRequest as exception:
+            try:
+                data = exception.response.json()
+            except ValueError:
+                if exception.response.text:
+                    data = {"reason": exception.response.text}
+                else:
+                    raise exception from None
+            if set(data) == {"error", "message"}:
+                raise
+            explanation = data.get("explanation")
+            if "fields" in data:
+                assert len(data["fields"]) == 1
+                field = data["fields"][0]
+            else:
+                field = None
+            raise RedditAPIException(
+                [data["reason"], explanation, field]
+            ) from exception
+        finally:
+            self.metrics.record(info)
+            for hook in self.request_hooks["post"]:
+                hook(info)
+
     def _objectify_request(
         self,
         *,
@@ -600,11 +889,17 @@ class Reddit:
     def _prepare_prawcore(
         self,
         *,
+        connection_pool: ConnectionPool | None = None,
         requestor_class: type[prawcore.requestor.Requestor] = None,
         requestor_kwargs: Any | None = None,
     ):
         requestor_class = requestor_class or Requestor
         requestor_kwargs = requestor_kwargs or {}
+        if connection_pool is not None:
+            requestor_kwargs = {
+                **requestor_kwargs,
+                "session": connection_pool.session(),
+            }
 
         requestor = requestor_class(
             USER_AGENT_FORMAT.format(self.config.user_agent),
@@ -612,6 +907,13 @@ class Reddit:
             self.config.reddit_url,
             **requestor_kwargs,
         )
+        requestor.request = partial(
+            self._json_backend.request,
+            partial(
+                self._conditional_cache.request,
+                partial(RequestInfo.observe, requestor.request),
+            ),
+        )
 
         if self.config.client_secret:
             self._prepare_trusted_prawcore(requestor)
@@ -654,6 +956,45 @@ class Reddit:
                 return e.response.next.url
         return url
 
+    def _scheduled_request(self, *, method: str, **kwargs: Any) -> Any:
+        Deadline.check_active()
+        with self.scheduler.slot(method=method, rate_limiter=self._core._rate_limiter):
+            remaining = Deadline.check_active()
+            if remaining is not None:
+                kwargs["timeout"] = min(remaining, self.config.timeout)
+            return self._core.request(method=method, **kwargs)
+
+    def async_iterator(self, iterable: Iterable[Any]) -> AsyncIterator:
+        """Return an asynchronous iterator over a listing or stream.
+
+        :param iterable: A blocking iterable, such as a :class:`.ListingGenerator` or the
+            generator returned by a stream method.
+
+        Each item is fetched in a thread of :attr:`.async_executor`, so many listings
+        and streams can be driven from one event loop. For example:
+
+        .. code-block:: python
+
+            async def watch(reddit, subreddit):
+                stream = reddit.subreddit(subreddit).stream.comments(pause_after=0)
+                async for comment in reddit.async_iterator(stream):
+                    if comment is not None:
+                        print(comment.body)
+
+
+            async def main(reddit):
+                await asyncio.gather(watch(reddit, "AskReddit"), watch(reddit, "test"))
+
+        .. note::
+
+            Requests issued from the threads of :attr:`.async_executor` do not trigger the
+            warning about using PRAW in an asynchronous environment. Other interactions
+            with PRAW from within the event loop, such as fetching an attribute of a lazy
+            object, still block it.
+
+        """
+        return self.async_executor.iterate(iterable)
+
     @_deprecate_args("id", "url")
     def comment(
         self, id: str | None = None, *, url: str | None = None
@@ -711,31 +1052,52 @@ class Reddit:
         path: str,
         *,
         params: str | dict[str, str | int] | None = None,
+        raw: bool = False,
     ) -> Any:
         """Return parsed objects returned from a GET request to ``path``.
 
         :param path: The path to fetch.
         :param params: The query parameters to add to the request (default: ``None``).
+        :param raw: When ``True``, return the decoded JSON response as is, without
+            building any objects from it (default: ``False``).
 
         """
+        if raw:
+            return self.request(method="GET", params=params, path=path)
         return self._objectify_request(method="GET", params=params, path=path)
 
     @_deprecate_args("fullnames", "url", "subreddits")
     def info(
         self,
         *,
+        fields: Iterable[str] | None = None,
         fullnames: Iterable[str] | None = None,
+        max_workers: int | None = None,
+        raw: bool = False,
         subreddits: Iterable[praw.models.Subreddit | str] | None = None,
         url: str | None = None,
     ) -> Generator[
-        praw.models.Subreddit | praw.models.Comment | praw.models.Submission,
+        praw.models.Subreddit
+        | praw.models.Comment
+        | praw.models.Submission
+        | dict[str, Any],
         None,
         None,
     ]:
         """Fetch information about each item in ``fullnames``, ``url``, or ``subreddits``.
 
+        :param fields: The names of the attributes to keep on each yielded item. Other
+            attributes are dropped before the items are built, and accessing them raises
+            an ``AttributeError`` (default: ``None``, all attributes are kept).
         :param fullnames: A list of fullnames for comments, submissions, and/or
             subreddits.
+        :param max_workers: When provided, the number of batches of 100 items to fetch
+            concurrently using a pool of threads. Only applies to ``fullnames`` and
+            ``subreddits`` (default: ``None``, fetch one batch at a time).
+        :param raw: When ``True``, yield the ``data`` dictionary of each item as
+            returned by Reddit rather than building objects from it. With ``fields``,
+            the dictionaries only contain those keys and ``"name"`` (default:
+            ``False``).
         :param subreddits: A list of subreddit names or :class:`.Subreddit` objects to
             retrieve subreddits from.
         :param url: A url (as a string) to retrieve lists of link submissions from.
@@ -745,6 +1107,16 @@ class Reddit:
         Items that cannot be matched will not be generated. Requests will be issued in
         batches for each 100 fullnames.
 
+        When ``max_workers`` is provided, up to that many batches are requested at the
+        same time. Items are still yielded in their relative order, and requests
+        continue to respect the ratelimit shared by this :class:`.Reddit` instance. For
+        example, to check a large number of fullnames using four threads:
+
+        .. code-block:: python
+
+            for item in reddit.info(fullnames=fullnames, max_workers=4):
+                print(item)
+
         .. note::
 
             For comments that are retrieved via this method, if you want to obtain its
@@ -762,6 +1134,14 @@ class Reddit:
         if none_count != 2:
             msg = "Either 'fullnames', 'url', or 'subreddits' must be provided."
             raise TypeError(msg)
+        if max_workers is not None and max_workers < 1:
+            msg = "'max_workers' must be a positive integer."
+            raise ValueError(msg)
+        if isinstance(fields, str):
+            msg = "'fields' must be a non-str iterable."
+            raise TypeError(msg)
+        if fields is not None:
+            fields = frozenset(fields)
 
         is_using_fullnames = fullnames is not None
         ids_or_names = fullnames if is_using_fullnames else subreddits
@@ -778,18 +1158,22 @@ class Reddit:
                     iterable = iter(names)
                 else:
                     iterable = iter([str(item) for item in names])
-                while True:
-                    chunk = list(islice(iterable, 100))
-                    if not chunk:
-                        break
-                    params = {api_parameter_name: ",".join(chunk)}
-                    yield from self.get(API_PATH["info"], params=params)
+                params = (
+                    {api_parameter_name: ",".join(chunk)}
+                    for chunk in iter(lambda: list(islice(iterable, 100)), [])
+                )
+                if max_workers is None:
+                    for chunk_params in params:
+                        yield from self._info(chunk_params, fields=fields, raw=raw)
+                else:
+                    yield from self._info_concurrently(
+                        params, fields=fields, max_workers=max_workers, raw=raw
+                    )
 
             return generator(ids_or_names)
 
         def generator(_url: str):
-            params = {"url": _url}
-            yield from self.get(API_PATH["info"], params=params)
+            yield from self._info({"url": _url}, fields=fields, raw=raw)
 
         return generator(url)
 
@@ -859,7 +1243,8 @@ class Reddit:
             except RedditAPIException as exception:
                 last_exception = exception
                 seconds = self._handle_rate_limit(exception=exception)
-                if seconds is None:
+                if seconds is None or DeferredWriteQueue.deferring():
+                    # The write queue retries without blocking the calling thread
                     break
                 second_string = "second" if seconds == 1 else "seconds"
                 logger.debug(
@@ -916,7 +1301,11 @@ class Reddit:
         Either ``name`` or ``fullname`` can be provided, but not both.
 
         """
-        return models.Redditor(self, name=name, fullname=fullname)
+        if name is None:
+            return models.Redditor(self, name=name, fullname=fullname)
+        return self.interner.get(
+            models.Redditor, name, lambda: models.Redditor(self, name=name)
+        )
 
     @_deprecate_args("method", "path", "params", "data", "files", "json")
     def request(
@@ -949,34 +1338,37 @@ class Reddit:
         if data and json:
             msg = "At most one of 'data' or 'json' is supported."
             raise ClientException(msg)
-        try:
-            return self._core.request(
-                data=data,
-                files=files,
-                json=json,
-                method=method,
-                params=params,
-                path=path,
+        use_cache = method == "GET" and self.cache.enabled
+        if use_cache:
+            response = self.cache.get(
+                path=path, params=params, read_only=self.read_only
             )
-        except BadRequest as exception:
-            try:
-                data = exception.response.json()
-            except ValueError:
-                if exception.response.text:
-                    data = {"reason": exception.response.text}
-                else:
-                    raise exception from None
-            if set(data) == {"error", "message"}:
-                raise
-            explanation = data.get("explanation")
-            if "fields" in data:
-                assert len(data["fields"]) == 1
-                field = data["fields"][0]
-            else:
-                field = None
-            raise RedditAPIException(
-                [data["reason"], explanation, field]
-            ) from exception
+            if response is not ResponseCache.MISS:
+                return response
+        issue_request = partial(
+            self._issue_request,
+            data=data,
+            files=files,
+            json=json,
+            method=method,
+            params=params,
+            path=path,
+        )
+        if method == "GET":
+            # Identical GET requests in flight at the same time share one response, as
+            # long as they are bound by the same deadlines
+            response = self._single_flight.call(
+                (self.read_only, Deadline.active(), request_key(path, params)),
+                issue_request,
+                check=Deadline.check_active,
+            )
+        else:
+            response = issue_request()
+        if use_cache:
+            self.cache.store(
+                path=path, params=params, read_only=self.read_only, value=response
+            )
+        return response
 
     @_deprecate_args("id", "url")
     def submission(
@@ -0,0 +1,133 @@
+"""Provide utilities for iterating over PRAW's blocking iterators from asyncio.
+
+PRAW issues blocking network requests, so advancing a :class:`.ListingGenerator` or a
+stream from a coroutine stalls the event loop. An :class:`.AsyncIterator` instead
+advances the wrapped iterator in a thread of an :class:`.AsyncExecutor`, whose number of
+threads bounds how many of them fetch from Reddit at the same time.
+
+"""
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Iterable
+
+_EXHAUSTED = object()
+
+
+class AsyncExecutor:
+    """Manage the threads used to advance :class:`.AsyncIterator` instances.
+
+    The thread pool is started on first use and shut down by :meth:`.shutdown`, which
+    is called when the :class:`.Reddit` instance is used as a context manager and the
+    block exits.
+
+    """
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state of the instance for pickling, without its thread pool."""
+        return {"max_workers": self.max_workers}
+
+    def __init__(self, *, max_workers: int):
+        """Initialize an :class:`.AsyncExecutor` instance.
+
+        :param max_workers: The maximum number of iterators advanced at the same time.
+
+        """
+        if max_workers < 1:
+            msg = "'max_workers' must be a positive integer."
+            raise ValueError(msg)
+        self._executor = None
+        self._lock = Lock()
+        self.max_workers = max_workers
+
+    def __setstate__(self, state: dict[str, Any]):
+        """Restore the state of the instance when unpickling."""
+        self.__init__(**state)
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Return the thread pool, starting it if needed."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="praw-async"
+                )
+            return self._executor
+
+    def iterate(self, iterable: Iterable[Any]) -> AsyncIterator:
+        """Return an :class:`.AsyncIterator` over ``iterable`` using this executor.
+
+        :param iterable: The blocking iterable, e.g., a :class:`.ListingGenerator` or
+            the generator returned by a stream method.
+
+        """
+        return AsyncIterator(iterable, executor=self)
+
+    def shutdown(self):
+        """Shut down the thread pool once the items being fetched are returned.
+
+        The thread pool is started again if an iterator is advanced afterwards.
+
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+class AsyncIterator:
+    """Advance a blocking iterator in a thread for use with ``async for``.
+
+    Instances are obtained via :meth:`.Reddit.async_iterator`, or by using ``async for``
+    directly on a :class:`.ListingGenerator`:
+
+    .. code-block:: python
+
+        async def ingest(reddit):
+            async for submission in reddit.subreddit("test").new(limit=None):
+                await store(submission)
+
+            stream = reddit.subreddit("test").stream.comments(pause_after=0)
+            async for comment in reddit.async_iterator(stream):
+                if comment is not None:
+                    await store(comment)
+
+    .. note::
+
+        A stream blocks its thread until Reddit returns a new item. Pass
+        ``pause_after`` to the stream method so that the thread is returned between
+        requests, and the executor can be shut down.
+
+    """
+
+    def __aiter__(self) -> AsyncIterator:
+        """Permit :class:`.AsyncIterator` to operate as an asynchronous iterator."""
+        return self
+
+    def __init__(self, iterable: Iterable[Any], *, executor: AsyncExecutor):
+        """Initialize an :class:`.AsyncIterator` instance.
+
+        :param iterable: The blocking iterable to advance.
+        :param executor: The :class:`.AsyncExecutor` whose threads advance the
+            iterator.
+
+        """
+        self._executor = executor
+        self._iterator = iter(iterable)
+        self._lock = Lock()
+
+    async def __anext__(self) -> Any:
+        """Return the next item fetched in a thread of the executor."""
+        item = await asyncio.get_running_loop().run_in_executor(
+            self._executor.executor, self._next
+        )
+        if item is _EXHAUSTED:
+            raise StopAsyncIteration
+        return item
+
+    def _next(self) -> Any:
+        # A generator cannot be advanced from two threads at the same time
+        with self._lock:
+            return next(self._iterator, _EXHAUSTED)
@@ -1,7 +1,30 @@
 """Caching utilities."""
 from __future__ import annotations
 
-from typing import Any, Callable
+import json
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from copy import deepcopy
+from threading import Event, Lock, local
+from typing import TYPE_CHECKING, Any, Callable, Generator, Hashable
+
+from ..endpoints import endpoint_name
+
+if TYPE_CHECKING:  # pragma: no cover
+    import requests
+
+
+def request_key(path: str, params: str | dict[str, Any] | None) -> tuple[str, Any]:
+    """Return a hashable key identifying a request by its path and query parameters.
+
+    :param path: The path of the request.
+    :param params: The query parameters of the request.
+
+    """
+    if isinstance(params, dict):
+        params = tuple(sorted((key, str(value)) for key, value in params.items()))
+    return path.strip("/"), params
 
 
 class cachedproperty:  # noqa: N801
@@ -49,3 +72,376 @@ class cachedproperty:  # noqa: N801
     def __repr__(self) -> str:
         """Return an object initialization representation of the instance."""
         return f"<{self.__class__.__name__} {self.func}>"
+
+
+class ConditionalRequestCache:
+    """Revalidate slowly changing resources with conditional ``GET`` requests.
+
+    The ``ETag`` and ``Last-Modified`` validators, and the body, of responses to
+    endpoints named in ``endpoints`` are stored. Subsequent requests for the same
+    resource send the validators via the ``If-None-Match`` and ``If-Modified-Since``
+    headers. When Reddit responds with ``304 Not Modified``, the stored body is used
+    instead of downloading the resource again.
+
+    By default, subreddit rules, stylesheets, widgets, and wiki pages are revalidated.
+    Conditional requests are enabled via the ``conditional_requests`` setting, and
+    stored bodies are evicted, least recently used first, when their combined size
+    exceeds the ``cache_max_bytes`` setting.
+
+    """
+
+    ENDPOINTS = frozenset({"about_stylesheet", "rules", "widgets", "wiki_page"})
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state of the instance for pickling, without stored bodies."""
+        return {
+            "enabled": self.enabled,
+            "endpoints": self.endpoints,
+            "max_bytes": self.max_bytes,
+        }
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = False,
+        endpoints: frozenset[str] | None = None,
+        max_bytes: int = 0,
+    ):
+        """Initialize a :class:`.ConditionalRequestCache` instance.
+
+        :param enabled: Whether conditional requests are issued (default: ``False``).
+        :param endpoints: The names of the ``API_PATH`` templates of resources to
+            revalidate (default: ``None``, use :attr:`.ENDPOINTS`).
+        :param max_bytes: The maximum combined size, in bytes, of the stored bodies
+            (default: ``0``).
+
+        """
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self.enabled = enabled
+        self.endpoints = self.ENDPOINTS if endpoints is None else endpoints
+        self.max_bytes = max_bytes
+        self.size = 0
+
+    def __len__(self) -> int:
+        """Return the number of stored resources."""
+        return len(self._entries)
+
+    def __setstate__(self, state: dict[str, Any]):
+        """Restore the state of the instance when unpickling."""
+        self.__init__(**state)
+
+    def _evict(self, key: tuple[str, Any]):
+        _, body = self._entries.pop(key)
+        self.size -= len(body)
+
+    def _store(self, key: tuple[str, Any], validators: dict[str, str], body: bytes):
+        with self._lock:
+            if key in self._entries:
+                self._evict(key)
+            if len(body) > self.max_bytes:
+                return
+            self._entries[key] = (validators, body)
+            self.size += len(body)
+            while self.size > self.max_bytes:
+                self._evict(next(iter(self._entries)))
+
+    def clear(self):
+        """Remove all stored resources."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def request(
+        self,
+        request_function: Callable[..., requests.Response],
+        method: str,
+        url: str,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Issue an HTTP request, revalidating the stored resource when possible.
+
+        :param request_function: The function that issues the HTTP request, e.g.,
+            ``prawcore.Requestor.request``.
+        :param method: The HTTP method of the request.
+        :param url: The URL of the request.
+
+        Additional keyword arguments are passed to ``request_function``.
+
+        :returns: The response. A ``304 Not Modified`` response is returned as a ``200
+            OK`` response with the stored body.
+
+        """
+        if (
+            not self.enabled
+            or method.upper() != "GET"
+            or endpoint_name(url) not in self.endpoints
+        ):
+            return request_function(method, url, **kwargs)
+        params = kwargs.get("params") or {}
+        key = (url, tuple(sorted((key, str(value)) for key, value in params.items())))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is not None:
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), **entry[0]}
+        response = request_function(method, url, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            response.status_code = 200
+            response._content = entry[1]
+            response.headers["content-length"] = str(len(entry[1]))
+        elif response.status_code == 200:
+            validators = {}
+            if "ETag" in response.headers:
+                validators["If-None-Match"] = response.headers["ETag"]
+            if "Last-Modified" in response.headers:
+                validators["If-Modified-Since"] = response.headers["Last-Modified"]
+            if validators:
+                self._store(key, validators, response.content)
+        return response
+
+
+class ResponseCache:
+    """An LRU cache for the responses of ``GET`` requests.
+
+    Responses are cached per path and query parameters for a time-to-live (TTL) that
+    is chosen by the name of the ``API_PATH`` template the path was built from, e.g.,
+    ``subreddit_about`` or ``rules``. Responses to paths whose TTL is ``0`` are not
+    cached. When the cached responses exceed ``max_bytes``, the least recently used
+    responses are evicted.
+
+    The cache is configured via the ``cache_ttl``, ``cache_ttl_<name>``, and
+    ``cache_max_bytes`` settings. For example, to cache subreddit rules for five
+    minutes, and all other responses for ten seconds, add the following to
+    ``praw.ini``:
+
+    .. code-block:: ini
+
+        cache_ttl=10
+        cache_ttl_rules=300
+
+    To issue requests without using the cache, try:
+
+    .. code-block:: python
+
+        with reddit.cache.bypass():
+            subreddit = reddit.subreddit("test")
+            subreddit._fetch()
+
+    .. note::
+
+        Requests that modify data do not invalidate cached responses. Use
+        :meth:`.clear` or :meth:`.bypass` when fresh data is needed.
+
+    """
+
+    MISS = object()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state of the instance for pickling, without cached responses."""
+        return {
+            "default_ttl": self.default_ttl,
+            "max_bytes": self.max_bytes,
+            "ttls": self.ttls,
+        }
+
+    def __init__(
+        self,
+        *,
+        default_ttl: float = 0,
+        max_bytes: int = 0,
+        ttls: dict[str, float] | None = None,
+    ):
+        """Initialize a :class:`.ResponseCache` instance.
+
+        :param default_ttl: The number of seconds to cache responses to paths without a
+            TTL in ``ttls`` (default: ``0``).
+        :param max_bytes: The maximum combined size, in bytes of JSON, of the cached
+            responses (default: ``0``).
+        :param ttls: A dictionary mapping ``API_PATH`` names to the number of seconds
+            to cache their responses (default: ``None``).
+
+        """
+        self._entries = OrderedDict()
+        self._local = local()
+        self._lock = Lock()
+        self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.ttls = ttls or {}
+
+    def __len__(self) -> int:
+        """Return the number of cached responses."""
+        return len(self._entries)
+
+    def __setstate__(self, state: dict[str, Any]):
+        """Restore the state of the instance when unpickling."""
+        self.__init__(**state)
+
+    def _evict(self, key: tuple[bool, tuple[str, Any]]):
+        _, body = self._entries.pop(key)
+        self.size -= len(body)
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether any responses can be cached."""
+        return self.max_bytes > 0 and (
+            self.default_ttl > 0 or any(ttl > 0 for ttl in self.ttls.values())
+        )
+
+    @contextmanager
+    def bypass(self) -> Generator[None, None, None]:
+        """Neither read from nor write to the cache within the block in this thread."""
+        previous = getattr(self._local, "bypass", False)
+        self._local.bypass = True
+        try:
+            yield
+        finally:
+            self._local.bypass = previous
+
+    def clear(self):
+        """Remove all cached responses."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def get(
+        self,
+        *,
+        path: str,
+        params: str | dict[str, Any] | None = None,
+        read_only: bool = False,
+    ) -> Any:
+        """Return a copy of the cached response, or :attr:`.MISS` if there is none.
+
+        :param path: The path of the request.
+        :param params: The query parameters of the request (default: ``None``).
+        :param read_only: Whether the request is made in read-only mode (default:
+            ``False``).
+
+        """
+        if getattr(self._local, "bypass", False):
+            return self.MISS
+        key = (read_only, request_key(path, params))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return self.MISS
+            expires_at, body = entry
+            if expires_at <= time.monotonic():
+                self._evict(key)
+                return self.MISS
+            self._entries.move_to_end(key)
+        return json.loads(body)
+
+    def store(
+        self,
+        *,
+        path: str,
+        params: str | dict[str, Any] | None = None,
+        read_only: bool = False,
+        value: Any,
+    ):
+        """Cache ``value`` as the response for ``path`` when it has a TTL.
+
+        Responses to requests made in read-only mode and to those made on behalf of a
+        user are cached separately, as they can differ.
+
+        :param path: The path of the request.
+        :param params: The query parameters of the request (default: ``None``).
+        :param read_only: Whether the request was made in read-only mode (default:
+            ``False``).
+        :param value: The parsed JSON response.
+
+        """
+        if getattr(self._local, "bypass", False):
+            return
+        ttl = self.ttls.get(endpoint_name(path), self.default_ttl)
+        if ttl <= 0:
+            return
+        body = json.dumps(value)
+        if len(body) > self.max_bytes:
+            return
+        key = (read_only, request_key(path, params))
+        with self._lock:
+            if key in self._entries:
+                self._evict(key)
+            self._entries[key] = (time.monotonic() + ttl, body)
+            self.size += len(body)
+            while self.size > self.max_bytes:
+                self._evict(next(iter(self._entries)))
+
+
+class SingleFlight:
+    """Share the result of identical calls that are in flight at the same time.
+
+    When a call is made while an identical call, i.e., one with the same key, is still
+    in progress in another thread, it waits for that call to complete and shares its
+    result instead of being made again. When a result is shared, every caller receives
+    its own deep copy of it, so that callers may modify their result.
+
+    """
+
+    class _Call:
+        def __init__(self):
+            self.done = Event()
+            self.exception = None
+            self.followers = 0
+            self.result = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state of the instance for pickling, without calls in flight."""
+        return {}
+
+    def __init__(self):
+        """Initialize a :class:`.SingleFlight` instance."""
+        self._calls = {}
+        self._lock = Lock()
+
+    def __setstate__(self, state: dict[str, Any]):  # noqa: ARG002
+        """Restore the state of the instance when unpickling."""
+        self.__init__()
+
+    def call(
+        self,
+        key: Hashable,
+        function: Callable[[], Any],
+        *,
+        check: Callable[[], float | None] | None = None,
+    ) -> Any:
+        """Return the result of ``function``, sharing it with identical calls.
+
+        :param key: A key identifying the call, e.g., as returned by
+            :func:`.request_key`.
+        :param function: A function without arguments that makes the call.
+        :param check: A function called while waiting for an identical call, such as
+            :meth:`.Deadline.check_active`. It returns the number of seconds to wait
+            before it is called again, or ``None`` to wait until the identical call
+            completes, and raises to stop waiting (default: ``None``).
+
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = self._Call()
+            else:
+                call.followers += 1
+        if not leader:
+            while not call.done.wait(None if check is None else check()):
+                pass
+            if call.exception is not None:
+                raise call.exception
+            return deepcopy(call.result)
+        try:
+            call.result = function()
+        except Exception as exception:
+            call.exception = exception
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                followers = call.followers
+            call.done.set()
+        return deepcopy(call.result) if followers else call.result
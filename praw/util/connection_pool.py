@@ -0,0 +1,134 @@
+"""Provide the ConnectionPool class."""
+from __future__ import annotations
+
+from threading import Lock
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class _SharedHTTPAdapter(HTTPAdapter):
+    """An adapter whose connections outlive the sessions it is mounted on."""
+
+    def close(self):
+        """Keep the connections open when a session using the adapter is closed."""
+
+    def close_connections(self):
+        """Close the pooled connections."""
+        super().close()
+
+
+class ConnectionPool:
+    """A pool of HTTP connections shared by :class:`.Reddit` instances.
+
+    Every :class:`.Reddit` instance has its own pool of connections by default. When
+    many instances are used, e.g., one per account in each of several threads, sharing
+    a pool avoids opening a new connection, with its TLS handshake, for each of them,
+    and bounds the number of open connections:
+
+    .. code-block:: python
+
+        from praw.util.connection_pool import ConnectionPool
+
+        pool = ConnectionPool(max_per_host=16)
+        instances = [
+            praw.Reddit(account, connection_pool=pool) for account in ("bot1", "bot2")
+        ]
+
+    Each instance still uses its own ``requests.Session``, so that their user agents
+    do not conflict.
+
+    """
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state of the instance for pickling, without its lock."""
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __init__(
+        self,
+        *,
+        block: bool = False,
+        keep_alive: bool = True,
+        max_per_host: int = 10,
+        pool_size: int = 10,
+    ):
+        """Initialize a :class:`.ConnectionPool` instance.
+
+        :param block: When ``True``, a request waits for a connection to a host to be
+            returned to the pool once ``max_per_host`` connections to it are in use.
+            Otherwise, an additional connection is opened and discarded after the
+            request (default: ``False``).
+        :param keep_alive: When ``False``, connections are closed after each request
+            rather than reused (default: ``True``).
+        :param max_per_host: The maximum number of connections to each host kept open
+            for reuse (default: ``10``).
+        :param pool_size: The maximum number of hosts for which connections are kept
+            open (default: ``10``).
+
+        """
+        self._adapter = _SharedHTTPAdapter(
+            pool_block=block, pool_connections=pool_size, pool_maxsize=max_per_host
+        )
+        self._lock = Lock()
+        self.block = block
+        self.keep_alive = keep_alive
+        self.max_per_host = max_per_host
+        self.pool_size = pool_size
+        self.sessions = 0
+
+    def __setstate__(self, state: dict[str, Any]):
+        """Restore the state of the instance when unpickling.
+
+        The connections of the adapter are not pickled, so new ones are opened.
+
+        """
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    def close(self):
+        """Close all pooled connections.
+
+        The pool remains usable, and opens new connections as needed.
+
+        """
+        self._adapter.close_connections()
+
+    def session(self) -> requests.Session:
+        """Return a new ``requests.Session`` using the pooled connections."""
+        session = requests.Session()
+        session.mount("http://", self._adapter)
+        session.mount("https://", self._adapter)
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        with self._lock:
+            self.sessions += 1
+        return session
+
+    def stats(self) -> dict[str, Any]:
+        """Return statistics about the pooled connections.
+
+        :returns: A dictionary with the keys ``"hosts"``, mapping each host to a
+            dictionary with the keys ``"connections"``, the number of connections opened
+            to it, ``"idle"``, the number of open connections waiting to be reused,
+            ``"in_use"``, the number of connections issuing a request, and
+            ``"requests"``, the number of requests issued to it; and ``"sessions"``, the
+            number of sessions using the pool.
+
+        """
+        pools = self._adapter.poolmanager.pools
+        hosts = {}
+        for key in pools.keys():  # noqa: SIM118
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            queue = list(pool.pool.queue) if pool.pool is not None else []
+            hosts[f"{pool.scheme}://{pool.host}:{pool.port}"] = {
+                "connections": pool.num_connections,
+                "idle": sum(connection is not None for connection in queue),
+                "in_use": max(self.max_per_host - len(queue), 0),
+                "requests": pool.num_requests,
+            }
+        return {"hosts": hosts, "sessions": self.sessions}
@@ -0,0 +1,123 @@
+"""Provide the Deadline class."""
+from __future__ import annotations
+
+import time
+from threading import local
+
+from ..exceptions import DeadlineExceededException
+
+
+class Deadline:
+    """Bound the time taken by an operation issuing many requests, or cancel it.
+
+    A deadline applies to the requests issued from the current thread while it is
+    active, i.e., within its ``with`` block. Before each request, PRAW raises
+    :class:`.DeadlineExceededException` if the deadline has passed or was cancelled, and
+    otherwise lowers the request's timeout to the time remaining. Waiting for a slot
+    from :attr:`.Reddit.scheduler` and waiting to retry a failed request also stop at the
+    deadline. For example, to stop replacing :class:`.MoreComments` after 10 seconds:
+
+    .. code-block:: python
+
+        from praw.util.deadline import Deadline
+
+        try:
+            with Deadline(10):
+                submission.comments.replace_more(limit=None)
+        except praw.exceptions.DeadlineExceededException:
+            print("Some comments were not loaded")
+
+    Deadlines can also be passed to :meth:`.CommentForest.replace_more` and to methods
+    returning a :class:`.ListingGenerator` via the ``deadline`` argument. For listings,
+    this applies the deadline to every request the generator issues, even though they
+    are issued outside of any ``with`` block.
+
+    Calling :meth:`.cancel`, e.g., from another thread, stops the operation before its
+    next request:
+
+    .. code-block:: python
+
+        deadline = Deadline()
+        for submission in reddit.subreddit("all").new(deadline=deadline, limit=None):
+            if should_stop(submission):
+                deadline.cancel()
+
+    """
+
+    _local = local()
+
+    @classmethod
+    def active(cls) -> tuple[Deadline, ...]:
+        """Return the deadlines active in the current thread.
+
+        Deadlines only apply to the thread they were entered in. Enter the returned
+        deadlines in other threads issuing requests on behalf of the current one.
+
+        """
+        return tuple(getattr(cls._local, "active", ()))
+
+    @classmethod
+    def check_active(cls) -> float | None:
+        """Check the deadlines active in the current thread.
+
+        :returns: The number of seconds remaining before the earliest active deadline,
+            or ``None`` if no active deadline has a timeout.
+
+        :raises: :class:`.DeadlineExceededException` if an active deadline has passed
+            or was cancelled.
+
+        """
+        remaining = None
+        for deadline in getattr(cls._local, "active", ()):
+            seconds = deadline.check()
+            if seconds is not None and (remaining is None or seconds < remaining):
+                remaining = seconds
+        return remaining
+
+    def __enter__(self):  # noqa: ANN204
+        """Activate the deadline for requests issued from the current thread."""
+        if not hasattr(self._local, "active"):
+            self._local.active = []
+        self._local.active.append(self)
+        return self
+
+    def __exit__(self, *_: object):
+        """Deactivate the deadline."""
+        self._local.active.remove(self)
+
+    def __init__(self, timeout: float | None = None):
+        """Initialize a :class:`.Deadline` instance.
+
+        :param timeout: The number of seconds from now at which the deadline passes
+            (default: ``None``, the deadline only passes when cancelled).
+
+        """
+        self.cancelled = False
+        self.expires_at = None if timeout is None else time.monotonic() + timeout
+
+    def cancel(self):
+        """Cancel the operation, which stops before its next request."""
+        self.cancelled = True
+
+    def check(self) -> float | None:
+        """Check the deadline.
+
+        :returns: The number of seconds remaining, or ``None`` if the deadline has no
+            timeout.
+
+        :raises: :class:`.DeadlineExceededException` if the deadline has passed or was
+            cancelled.
+
+        """
+        if self.cancelled:
+            raise DeadlineExceededException(cancelled=True)
+        remaining = self.remaining()
+        if remaining is not None and remaining <= 0:
+            raise DeadlineExceededException(cancelled=False)
+        return remaining
+
+    def remaining(self) -> float | None:
+        """Return the number of seconds remaining, or ``None`` without a timeout."""
+        if self.expires_at is None:
+            return None
+        return self.expires_at - time.monotonic()
@@ -0,0 +1,194 @@
+"""Provide the DeferredWriteQueue class."""
+from __future__ import annotations
+
+import heapq
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from itertools import count
+from logging import getLogger
+from threading import Condition, Thread, local
+from typing import TYPE_CHECKING, Any, Callable, Generator
+
+from ..exceptions import RedditAPIException
+
+if TYPE_CHECKING:  # pragma: no cover
+    import praw
+
+logger = getLogger("praw")
+
+
+class DeferredWriteQueue:
+    """Retry rate limited writes in a background thread instead of sleeping.
+
+    By default, :meth:`.Reddit.post` handles a ``RATELIMIT`` error by sleeping for the
+    time indicated by Reddit and trying again, which blocks the calling thread. Calls
+    passed to :meth:`.submit` are instead attempted once right away, and if they hit a
+    ``RATELIMIT`` error, are retried by a background thread once the indicated time has
+    passed. The caller immediately receives a :class:`concurrent.futures.Future` for
+    the result.
+
+    For example, to reply to comments from a stream without pausing it:
+
+    .. code-block:: python
+
+        for comment in reddit.subreddit("test").stream.comments():
+            if "!ping" in comment.body:
+                reddit.write_queue.submit(comment.reply, "pong")
+
+    .. note::
+
+        A call is attempted at most ``max_attempts`` times. As with
+        :meth:`.Reddit.post`, ``RATELIMIT`` errors requiring a wait longer than the
+        ``ratelimit_seconds`` setting are not retried.
+
+    """
+
+    _local = local()
+
+    @classmethod
+    def deferring(cls) -> bool:
+        """Return whether the current thread is running a call from a queue."""
+        return getattr(cls._local, "deferring", False)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state of the instance for pickling, without its thread."""
+        return {"max_attempts": self.max_attempts, "reddit": self._reddit}
+
+    def __init__(self, reddit: praw.Reddit, *, max_attempts: int = 3):
+        """Initialize a :class:`.DeferredWriteQueue` instance.
+
+        :param reddit: An instance of :class:`.Reddit`.
+        :param max_attempts: The maximum number of times a call is attempted (default:
+            ``3``).
+
+        """
+        self._closed = False
+        self._condition = Condition()
+        self._counter = count()
+        self._pending = []
+        self._reddit = reddit
+        self._thread = None
+        self.max_attempts = max_attempts
+
+    def __len__(self) -> int:
+        """Return the number of calls waiting to be retried."""
+        with self._condition:
+            return len(self._pending)
+
+    def __setstate__(self, state: dict[str, Any]):
+        """Restore the state of the instance when unpickling."""
+        self.__init__(**state)
+
+    def _attempt(
+        self,
+        future: Future,
+        function: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        attempt: int,
+    ):
+        try:
+            with self._deferring():
+                result = function(*args, **kwargs)
+        except RedditAPIException as exception:
+            seconds = self._reddit._handle_rate_limit(exception=exception)
+            if seconds is None or attempt >= self.max_attempts:
+                future.set_exception(exception)
+                return
+            logger.debug("Rate limit hit, deferring write for %d seconds", seconds)
+            self._schedule(
+                time.monotonic() + seconds,
+                (future, function, args, kwargs, attempt + 1),
+            )
+        except Exception as exception:  # noqa: BLE001
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+
+    @contextmanager
+    def _deferring(self) -> Generator[None, None, None]:
+        previous = self.deferring()
+        self._local.deferring = True
+        try:
+            yield
+        finally:
+            self._local.deferring = previous
+
+    def _next_call(self) -> tuple[Any, ...] | None:
+        with self._condition:
+            while True:
+                if self._pending:
+                    delay = self._pending[0][0] - time.monotonic()
+                    if delay <= 0:
+                        return heapq.heappop(self._pending)[2]
+                    self._condition.wait(delay)
+                elif self._closed:
+                    return None
+                else:
+                    self._condition.wait()
+
+    def _run(self):
+        while True:
+            call = self._next_call()
+            if call is None:
+                return
+            future = call[0]
+            # A future that was cancelled while waiting is skipped. Once running, it
+            # can no longer be cancelled, also while waiting for a further retry.
+            if future.running() or future.set_running_or_notify_cancel():
+                self._attempt(*call)
+
+    def _schedule(self, timestamp: float, call: tuple[Any, ...]):
+        with self._condition:
+            if self._closed:
+                msg = "Cannot retry writes after the queue was shut down."
+                call[0].set_exception(RuntimeError(msg))
+                return
+            heapq.heappush(self._pending, (timestamp, next(self._counter), call))
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = Thread(
+                    daemon=True, name="praw-deferred-writes", target=self._run
+                )
+                self._thread.start()
+            self._condition.notify()
+
+    def shutdown(self, *, wait: bool = True):
+        """Stop accepting calls and stop the background thread.
+
+        :param wait: When ``True``, block until the calls waiting to be retried are
+            completed. Otherwise, cancel them, or, for those that have already been
+            retried, fail them with a :py:class:`RuntimeError` (default: ``True``).
+
+        """
+        with self._condition:
+            self._closed = True
+            if not wait:
+                msg = "The queue was shut down before the write was retried."
+                for _, _, call in self._pending:
+                    if not call[0].cancel():
+                        call[0].set_exception(RuntimeError(msg))
+                self._pending.clear()
+            self._condition.notify()
+            thread = self._thread
+        if wait and thread is not None:
+            thread.join()
+
+    def submit(self, function: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """Call ``function``, retrying it in the background if it is rate limited.
+
+        :param function: The function to call, e.g., :meth:`.Comment.reply` or
+            :meth:`.Reddit.post`.
+        :param args: The positional arguments to call ``function`` with.
+        :param kwargs: The keyword arguments to call ``function`` with.
+
+        :returns: A :class:`concurrent.futures.Future` resolving to the return value of
+            ``function``, or to the exception it raised.
+
+        """
+        if self._closed:
+            msg = "Cannot submit writes after the queue was shut down."
+            raise RuntimeError(msg)
+        future = Future()
+        self._attempt(future, function, args, kwargs, 1)
+        return future
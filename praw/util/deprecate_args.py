@@ -21,27 +21,30 @@ def _deprecate_args(*old_args: str) -> Callable:
         return arg_string + ("s" if arg_count > 1 else "")
 
     def wrapper(func: Callable):
+        # Inspecting the signature is slow, so it is done once per decorated function
+        # rather than on every call
+        positional_args = [
+            name
+            for name, parameter in inspect.signature(func).parameters.items()
+            if parameter.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD
+        ]
+        _old_args = tuple(filter(lambda arg: arg not in positional_args, old_args))
+        positional_count = len(positional_args)
+
         @wraps(func)
         def wrapped(*args: Any, **kwargs: Any):
-            signature = inspect.signature(func)
-            positional_args = [
-                name
-                for name, parameter in signature.parameters.items()
-                if parameter.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD
-            ]
-            _old_args = tuple(filter(lambda arg: arg not in positional_args, old_args))
-            if positional_args:
-                # remove the acceptable positional arguments like self or id for helpers
-                kwargs.update(zip(positional_args, args))
-                args = tuple(args[len(positional_args) :])
-            if args:
-                arg_string = _generate_arg_string(_old_args[: len(args)])
-                warn(
-                    f"Positional arguments for {func.__qualname__!r} will no longer be"
-                    f" supported in PRAW 8.\nCall this function with {arg_string}.",
-                    DeprecationWarning,
-                    stacklevel=2,
-                )
+            if len(args) <= positional_count:
+                return func(*args, **kwargs)
+            # remove the acceptable positional arguments like self or id for helpers
+            kwargs.update(zip(positional_args, args))
+            args = args[positional_count:]
+            arg_string = _generate_arg_string(_old_args[: len(args)])
+            warn(
+                f"Positional arguments for {func.__qualname__!r} will no longer be"
+                f" supported in PRAW 8.\nCall this function with {arg_string}.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
             return func(**dict(zip(_old_args, args)), **kwargs)
 
         return wrapped
@@ -0,0 +1,75 @@
+"""Provide the Interner class."""
+from __future__ import annotations
+
+from threading import Lock
+from typing import Any, Callable
+from weakref import WeakValueDictionary
+
+
+class Interner:
+    """Share lazy :class:`.Subreddit` and :class:`.Redditor` instances by name.
+
+    Each comment or submission in a listing references its author and subreddit. By
+    default, every one of them gets its own lazy :class:`.Redditor` and
+    :class:`.Subreddit` instance, so that crawling a million comments from a few
+    subreddits creates a million :class:`.Subreddit` instances. When the
+    ``intern_models`` setting is enabled, instances are shared between all items
+    referencing the same name, case-insensitively, for as long as any of them is in use.
+    This saves memory, and attributes fetched for one item are available to the
+    others:
+
+    .. code-block:: python
+
+        reddit = praw.Reddit(..., intern_models=True)
+        comments = list(reddit.subreddit("test").comments(limit=100))
+        comments[0].subreddit.subscribers  # fetches the subreddit only once
+        comments[1].subreddit.subscribers
+
+    .. note::
+
+        Only the instances created by :meth:`.Reddit.subreddit`,
+        :meth:`.Reddit.redditor`, and from the author and subreddit names of items are
+        shared. Instances that are built from complete data, such as those yielded by
+        :meth:`.Subreddits.popular`, are not.
+
+    """
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state of the instance for pickling, without its instances."""
+        return {"enabled": self.enabled}
+
+    def __init__(self, *, enabled: bool = False):
+        """Initialize an :class:`.Interner` instance.
+
+        :param enabled: Whether instances are shared (default: ``False``).
+
+        """
+        self._instances = WeakValueDictionary()
+        self._lock = Lock()
+        self.enabled = enabled
+
+    def __len__(self) -> int:
+        """Return the number of shared instances currently in use."""
+        return len(self._instances)
+
+    def __setstate__(self, state: dict[str, Any]):
+        """Restore the state of the instance when unpickling."""
+        self.__init__(**state)
+
+    def get(self, cls: type, name: str, factory: Callable[[], Any]) -> Any:
+        """Return the shared instance of ``cls`` named ``name``.
+
+        :param cls: The class of the instance.
+        :param name: The name of the instance, compared case-insensitively.
+        :param factory: A function returning a new instance, called when there is no
+            shared instance, or when sharing is disabled.
+
+        """
+        if not self.enabled:
+            return factory()
+        key = (cls, name.lower())
+        with self._lock:
+            instance = self._instances.get(key)
+            if instance is None:
+                instance = self._instances[key] = factory()
+        return instance
@@ -0,0 +1,116 @@
+"""Provide the JSONBackend class."""
+from __future__ import annotations
+
+import json
+from functools import partial
+from importlib import import_module
+from typing import Any, Callable
+
+import requests
+
+BACKENDS = ("orjson", "ujson", "json")
+
+
+class JSONBackend:
+    """Decode JSON responses with the fastest installed library.
+
+    Large responses, such as submissions with thousands of comments, spend most of
+    their time in the JSON decoder. By default, PRAW decodes responses with `orjson
+    <https://pypi.org/project/orjson/>`_ or `ujson <https://pypi.org/project/ujson/>`_
+    when one of them is installed, and with the standard library's :py:mod:`json`
+    otherwise. The library can be chosen via the ``json_backend`` setting:
+
+    .. code-block:: python
+
+        reddit = praw.Reddit(..., json_backend="json")
+
+    These libraries are stricter than :py:mod:`json`, e.g., ``orjson`` rejects strings
+    containing a lone surrogate. Content they fail to decode is decoded again with
+    :py:mod:`json`.
+
+    .. note::
+
+        ``orjson`` decodes integers that do not fit in 64 bits as floats. Use
+        ``json_backend="json"`` when exact large integers are needed.
+
+    """
+
+    @staticmethod
+    def _load(name: str) -> Callable[[str | bytes], Any]:
+        return json.loads if name == "json" else import_module(name).loads
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state of the instance for pickling, without its decoder."""
+        return {"name": self.requested}
+
+    def __init__(self, name: str = "auto"):
+        """Initialize a :class:`.JSONBackend` instance.
+
+        :param name: The library used to decode JSON, one of ``"json"``,
+            ``"orjson"``, or ``"ujson"``, or ``"auto"`` to use the first of
+            ``"orjson"``, ``"ujson"``, and ``"json"`` that is installed (default:
+            ``"auto"``).
+
+        :raises: ``ValueError`` if ``name`` is not a supported library, and
+            ``ImportError`` if it is not installed.
+
+        """
+        if name != "auto" and name not in BACKENDS:
+            msg = f"'json_backend' must be one of 'auto', {', '.join(repr(backend) for backend in BACKENDS)}."
+            raise ValueError(msg)
+        self.requested = name
+        for backend in BACKENDS if name == "auto" else (name,):
+            try:
+                self._loads = self._load(backend)
+            except ImportError:
+                if name != "auto":
+                    raise
+                continue
+            self.name = backend
+            break
+
+    def __setstate__(self, state: dict[str, Any]):
+        """Restore the state of the instance when unpickling."""
+        self.__init__(**state)
+
+    def _response_json(self, response: requests.Response, **kwargs: Any) -> Any:
+        if kwargs:
+            return requests.Response.json(response, **kwargs)
+        return self.loads(response.content)
+
+    def loads(self, content: str | bytes) -> Any:
+        """Return the object decoded from the JSON document ``content``.
+
+        :param content: The JSON document to decode.
+
+        :raises: ``ValueError`` if ``content`` is not valid JSON.
+
+        """
+        try:
+            return self._loads(content)
+        except ValueError:
+            if self._loads is json.loads:
+                raise
+            return json.loads(content)
+
+    def request(
+        self,
+        request_function: Callable[..., requests.Response],
+        method: str,
+        url: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Issue an HTTP request whose response is decoded by this backend.
+
+        This wraps the ``request`` method of PRAW's ``prawcore.Requestor`` so that
+        ``response.json()``, which prawcore calls, uses the decoder of this backend.
+
+        :param request_function: The function issuing the HTTP request.
+        :param method: The HTTP method of the request.
+        :param url: The URL of the request.
+
+        """
+        response = request_function(method, url, *args, **kwargs)
+        response.json = partial(self._response_json, response)
+        return response
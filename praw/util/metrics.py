@@ -0,0 +1,376 @@
+"""Provide utilities for observing the requests issued by PRAW.
+
+Every request issued by :meth:`.Reddit.request` is described by a
+:class:`.RequestInfo` instance, which is passed to the hooks in
+:attr:`.Reddit.request_hooks` and aggregated by :attr:`.Reddit.metrics`, an instance of
+:class:`.RequestMetrics`.
+
+To keep the number of distinct names low, requests are named after the ``API_PATH``
+template their path was built from, e.g., ``"morechildren"`` or ``"about_log"``.
+Listings that are not ``API_PATH`` templates, such as ``r/test/new``, are named
+``"listing"`` and all other requests ``"other"``.
+
+"""
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from collections import Counter
+from contextlib import contextmanager
+from threading import Lock, local
+from typing import TYPE_CHECKING, Any, Callable, Generator, Sequence
+from urllib.parse import urlparse
+
+from prawcore.const import ACCESS_TOKEN_PATH, REVOKE_TOKEN_PATH
+
+from ..endpoints import endpoint_name
+
+if TYPE_CHECKING:  # pragma: no cover
+    import requests
+
+_LISTING_SORTS = frozenset(
+    {
+        "controversial",
+        "downvoted",
+        "given",
+        "gilded",
+        "hidden",
+        "hot",
+        "new",
+        "randomrising",
+        "rising",
+        "saved",
+        "top",
+        "upvoted",
+    }
+)
+_TOKEN_PATHS = frozenset({ACCESS_TOKEN_PATH, REVOKE_TOKEN_PATH})
+
+
+def request_name(path: str) -> str:
+    """Return the low-cardinality name used to group requests to ``path``.
+
+    :param path: The path of a request, e.g., ``"api/morechildren/"``.
+
+    :returns: The name of the ``API_PATH`` template ``path`` was built from,
+        ``"listing"`` for other listings, or ``"other"``.
+
+    """
+    name = endpoint_name(path)
+    if name is not None:
+        return name
+    if urlparse(path).path.rstrip("/").rsplit("/", 1)[-1] in _LISTING_SORTS:
+        return "listing"
+    return "other"
+
+
+class Histogram:
+    """Count values in fixed buckets.
+
+    A value is counted in the first bucket whose upper bound is at least the value, or
+    in the final, unbounded bucket. Quantiles are estimated as the upper bound of the
+    bucket containing them, capped at the largest value added.
+
+    """
+
+    def __init__(self, bounds: Sequence[float]):
+        """Initialize a :class:`.Histogram` instance.
+
+        :param bounds: The ascending upper bounds of the buckets.
+
+        """
+        self.bounds = tuple(bounds)
+        self.count = 0
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.max = None
+        self.sum = 0
+
+    def add(self, value: float):
+        """Count ``value`` in its bucket.
+
+        :param value: The value to add.
+
+        """
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.max = value if self.max is None else max(self.max, value)
+        self.sum += value
+
+    def quantile(self, quantile: float) -> float | None:
+        """Return an estimate of ``quantile``, or ``None`` if no values were added.
+
+        :param quantile: The quantile to estimate, between ``0`` and ``1``, e.g.,
+            ``0.99``.
+
+        """
+        if not self.count:
+            return None
+        rank = quantile * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if count and seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a copy of the histogram.
+
+        :returns: A dictionary with the keys ``"buckets"``, mapping upper bounds to
+            counts, with ``float("inf")`` for the unbounded bucket, ``"count"``,
+            ``"max"``, ``"p50"``, ``"p99"``, and ``"sum"``.
+
+        """
+        return {
+            "buckets": dict(zip((*self.bounds, float("inf")), self.counts)),
+            "count": self.count,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+            "sum": self.sum,
+        }
+
+
+class RequestInfo:
+    """Describe a request issued by :meth:`.Reddit.request`.
+
+    Hooks in ``reddit.request_hooks["pre"]`` receive the instance before the request is
+    issued, when only ``method``, ``params``, and ``path`` are set. Hooks in
+    ``reddit.request_hooks["post"]`` receive it once the request completes, whether or
+    not it succeeded.
+
+    Instances have the following attributes:
+
+    ============== ====================================================================
+    Attribute      Description
+    ============== ====================================================================
+    ``bytes``      The number of bytes received over all attempts.
+    ``elapsed``    The number of seconds taken by the request, including retries and
+                   ratelimit delays.
+    ``endpoint``   The name the request is grouped under, e.g., ``"morechildren"``.
+    ``exception``  The exception raised by the request, or ``None``.
+    ``method``     The HTTP method of the request.
+    ``params``     The query parameters of the request.
+    ``path``       The path of the request.
+    ``ratelimit``  A dictionary of the ``X-Ratelimit-*`` headers of the last response,
+                   keyed by ``"remaining"``, ``"reset"``, and ``"used"``.
+    ``retries``    The number of times the request was retried.
+    ``status``     The HTTP status code of the last response, or ``None`` if no
+                   response was received.
+    ============== ====================================================================
+
+    """
+
+    _local = local()
+
+    @classmethod
+    def current(cls) -> RequestInfo | None:
+        """Return the instance describing the request in progress in this thread."""
+        return getattr(cls._local, "info", None)
+
+    @classmethod
+    def observe(
+        cls,
+        request_function: Callable[..., requests.Response],
+        method: str,
+        url: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Issue an HTTP request and record its response on the current instance.
+
+        This wraps the ``request`` method of PRAW's ``prawcore.Requestor``. Requests for
+        OAuth tokens are not recorded.
+
+        :param request_function: The function issuing the HTTP request.
+        :param method: The HTTP method of the request.
+        :param url: The URL of the request.
+
+        """
+        info = cls.current()
+        if info is None or urlparse(url).path in _TOKEN_PATHS:
+            return request_function(method, url, *args, **kwargs)
+        try:
+            response = request_function(method, url, *args, **kwargs)
+        except Exception:
+            info.record_response(None)
+            raise
+        info.record_response(response)
+        return response
+
+    def __init__(
+        self,
+        *,
+        method: str,
+        params: str | dict[str, str | int] | None = None,
+        path: str,
+    ):
+        """Initialize a :class:`.RequestInfo` instance.
+
+        :param method: The HTTP method of the request.
+        :param params: The query parameters of the request (default: ``None``).
+        :param path: The path of the request.
+
+        """
+        self._attempts = 0
+        self.bytes = 0
+        self.elapsed = None
+        self.endpoint = request_name(path)
+        self.exception = None
+        self.method = method
+        self.params = params
+        self.path = path
+        self.ratelimit = {}
+        self.retries = 0
+        self.status = None
+
+    def __repr__(self) -> str:
+        """Return an object initialization representation of the instance."""
+        return (
+            f"{self.__class__.__name__}(method={self.method!r}, path={self.path!r},"
+            f" status={self.status!r})"
+        )
+
+    def record_response(self, response: requests.Response | None):
+        """Record an attempt at issuing the request.
+
+        :param response: The response of the attempt, or ``None`` if the attempt failed
+            without a response, e.g., due to a connection error.
+
+        """
+        self._attempts += 1
+        self.retries = self._attempts - 1
+        if response is None:
+            self.status = None
+            return
+        self.bytes += len(response.content or b"")
+        self.status = response.status_code
+        self.ratelimit = {
+            name: response.headers[f"x-ratelimit-{name}"]
+            for name in ("remaining", "reset", "used")
+            if f"x-ratelimit-{name}" in response.headers
+        }
+
+    @contextmanager
+    def track(self) -> Generator[RequestInfo, None, None]:
+        """Time the block and record the responses received by the current thread."""
+        previous = self.current()
+        self._local.info = self
+        start = time.perf_counter()
+        try:
+            yield self
+        except Exception as exception:
+            self.exception = exception
+            raise
+        finally:
+            self.elapsed = time.perf_counter() - start
+            self._local.info = previous
+
+
+class RequestMetrics:
+    """Aggregate the requests issued by a :class:`.Reddit` instance.
+
+    Besides totals, the latency and response size of requests are counted in
+    :class:`.Histogram` instances per endpoint name, with the bucket bounds in
+    ``LATENCY_BUCKETS`` (seconds) and ``SIZE_BUCKETS`` (bytes). For example, to compare
+    the 99th percentile latency of ``morechildren`` and ``info`` requests, run:
+
+    .. code-block:: python
+
+        endpoints = reddit.metrics.snapshot()["endpoints"]
+        for name in ("info", "morechildren"):
+            if name in endpoints:
+                print(name, endpoints[name]["latency"]["p99"])
+
+    For example, to log the number of requests and errors every hour, run:
+
+    .. code-block:: python
+
+        while True:
+            time.sleep(3600)
+            metrics = reddit.metrics.snapshot()
+            reddit.metrics.reset()
+            print(f"{metrics['requests']} requests, {metrics['errors']} errors")
+
+    """
+
+    LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+    SIZE_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state of the instance for pickling, without its lock."""
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __init__(self):
+        """Initialize a :class:`.RequestMetrics` instance."""
+        self._lock = Lock()
+        self.reset()
+
+    def __setstate__(self, state: dict[str, Any]):
+        """Restore the state of the instance when unpickling."""
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    def record(self, info: RequestInfo):
+        """Add a completed request to the totals.
+
+        :param info: The :class:`.RequestInfo` describing the request.
+
+        """
+        with self._lock:
+            self.bytes += info.bytes
+            self.elapsed += info.elapsed or 0
+            self.errors += info.exception is not None
+            if info.endpoint not in self.endpoints:
+                self.endpoints[info.endpoint] = (
+                    Histogram(self.LATENCY_BUCKETS),
+                    Histogram(self.SIZE_BUCKETS),
+                )
+            latency, size = self.endpoints[info.endpoint]
+            latency.add(info.elapsed or 0)
+            size.add(info.bytes)
+            self.methods[info.method] += 1
+            self.requests += 1
+            self.retries += info.retries
+            self.statuses[info.status] += 1
+
+    def reset(self):
+        """Set all counters and totals to zero."""
+        with self._lock:
+            self.bytes = 0
+            self.elapsed = 0.0
+            self.endpoints = {}
+            self.errors = 0
+            self.methods = Counter()
+            self.requests = 0
+            self.retries = 0
+            self.statuses = Counter()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a copy of the counters and totals.
+
+        :returns: A dictionary with the keys ``"bytes"``, ``"elapsed"``, ``"errors"``,
+            ``"requests"``, and ``"retries"``, holding totals, and the keys
+            ``"methods"`` and ``"statuses"``, holding dictionaries mapping HTTP methods
+            and status codes to the number of requests. Requests that received no
+            response are counted under the status ``None``. The key ``"endpoints"``
+            holds a dictionary mapping endpoint names to dictionaries with the keys
+            ``"latency"`` and ``"size"``, holding :meth:`.Histogram.snapshot` results.
+
+        """
+        with self._lock:
+            return {
+                "bytes": self.bytes,
+                "elapsed": self.elapsed,
+                "endpoints": {
+                    name: {"latency": latency.snapshot(), "size": size.snapshot()}
+                    for name, (latency, size) in self.endpoints.items()
+                },
+                "errors": self.errors,
+                "methods": dict(self.methods),
+                "requests": self.requests,
+                "retries": self.retries,
+                "statuses": dict(self.statuses),
+            }
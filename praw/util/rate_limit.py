@@ -0,0 +1,384 @@
+"""Provide utilities for sharing Reddit's ratelimit between requests.
+
+Reddit allows a fixed number of requests per ratelimit window. The
+:class:`.RateLimitScheduler` tracks that budget as reported by Reddit and hands out
+request slots by priority, so that low priority work, such as a listing backfill, cannot
+use up the budget needed by high priority work, such as moderation actions, issued from
+the same :class:`.Reddit` instance.
+
+When several processes share one OAuth client, each of them only sees the requests it
+issued itself. Subclasses of :class:`.BaseRateLimitStore`, such as
+:class:`.SQLiteRateLimitStore`, share the budget between processes so that, together,
+they pace their requests to stay within the ratelimit.
+
+"""
+from __future__ import annotations
+
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from threading import Condition, Lock, local
+from typing import TYPE_CHECKING, Any, Generator
+
+from .deadline import Deadline
+
+if TYPE_CHECKING:  # pragma: no cover
+    import prawcore
+
+
+class BaseRateLimitStore(ABC):
+    """An abstract class for ratelimit budgets shared between processes."""
+
+    @abstractmethod
+    def acquire(self) -> float:
+        """Claim a request from the shared budget.
+
+        :returns: The number of seconds to wait before issuing the claimed request.
+
+        """
+
+    @abstractmethod
+    def update(self, *, remaining: float, reset_timestamp: float, used: int):
+        """Record the budget reported by Reddit in response to a request.
+
+        :param remaining: The number of requests remaining in the current window.
+        :param reset_timestamp: The timestamp at which the current window ends.
+        :param used: The number of requests used in the current window.
+
+        """
+
+
+class SQLiteRateLimitStore(BaseRateLimitStore):
+    """Provides a SQLite3 based ratelimit store.
+
+    Every process using the same ``database`` and ``key`` draws from the same budget.
+    Claimed requests are spaced evenly over the remainder of the ratelimit window, so
+    that the combined request rate of all processes stays at Reddit's ratelimit.
+
+    For example, to share the budget between worker processes using the same
+    ``client_id``, run the following in each worker:
+
+    .. code-block:: python
+
+        from praw.util.rate_limit import SQLiteRateLimitStore
+
+        reddit.scheduler.store = SQLiteRateLimitStore(
+            database="ratelimit.db", key=reddit.config.client_id
+        )
+
+    .. warning::
+
+        This class is untested on Windows because we encountered file locking issues in
+        the test environment.
+
+    """
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state of the instance for pickling, without its connection."""
+        return {"database": self._database, "key": self.key}
+
+    def __init__(self, *, database: str, key: str):
+        """Initialize a :class:`.SQLiteRateLimitStore` instance.
+
+        :param database: The path to the SQLite database.
+        :param key: The key used to locate the shared budget. Processes sharing an
+            OAuth client should use the same ``key``, such as the ``client_id``.
+
+        """
+        import sqlite3
+
+        self._connection = sqlite3.connect(
+            database, check_same_thread=False, isolation_level=None, timeout=30
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS budgets (id PRIMARY KEY, remaining,"
+            " reset_timestamp, used, next_timestamp)"
+        )
+        self._database = database
+        self._lock = Lock()
+        self.key = key
+
+    def __setstate__(self, state: dict[str, Any]):
+        """Restore the state of the instance when unpickling."""
+        self.__init__(**state)
+
+    def acquire(self) -> float:
+        """Claim a request from the shared budget.
+
+        :returns: The number of seconds to wait before issuing the claimed request.
+
+        """
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._connection.execute(
+                    "SELECT remaining, reset_timestamp, next_timestamp FROM budgets"
+                    " WHERE id=?",
+                    (self.key,),
+                ).fetchone()
+                now = time.time()
+                if row is None or row[1] <= now:
+                    return 0
+                remaining, reset_timestamp, next_timestamp = row
+                timestamp = max(now, next_timestamp or now)
+                if remaining < 1:
+                    timestamp = max(timestamp, reset_timestamp)
+                else:
+                    next_timestamp = timestamp + max(reset_timestamp - timestamp, 0) / (
+                        remaining
+                    )
+                    remaining -= 1
+                self._connection.execute(
+                    "UPDATE budgets SET remaining=?, next_timestamp=? WHERE id=?",
+                    (remaining, next_timestamp, self.key),
+                )
+                return timestamp - now
+            finally:
+                self._connection.execute("COMMIT")
+
+    def update(self, *, remaining: float, reset_timestamp: float, used: int):
+        """Record the budget reported by Reddit in response to a request.
+
+        :param remaining: The number of requests remaining in the current window.
+        :param reset_timestamp: The timestamp at which the current window ends.
+        :param used: The number of requests used in the current window.
+
+        """
+        with self._lock:
+            self._connection.execute(
+                "INSERT INTO budgets VALUES (?, ?, ?, ?, NULL) ON CONFLICT(id) DO"
+                " UPDATE SET remaining=excluded.remaining,"
+                " reset_timestamp=excluded.reset_timestamp, used=excluded.used",
+                (self.key, remaining, reset_timestamp, used),
+            )
+
+
+class RateLimitScheduler:
+    """Hand out request slots by priority based on Reddit's ratelimit budget.
+
+    Every request issued through :meth:`.Reddit.request` belongs to one of the
+    ``"high"``, ``"normal"``, or ``"low"`` priority lanes. By default, requests that
+    modify data (e.g., approving or removing an item) use the ``"high"`` lane, requests
+    for listings, other than moderation listings such as the modqueue, use the
+    ``"low"`` lane, and all other requests use the ``"normal"`` lane.
+
+    A request waits for its slot while a request in a higher priority lane is waiting,
+    or while issuing it would leave fewer requests in the current ratelimit window than
+    its lane's reserve. The reserves are set via ``reserves``. By default, the ``"low"``
+    lane keeps the last 100 requests of every window for ``"high"`` and ``"normal"``
+    priority requests. For example, ``reddit.scheduler.reserves["normal"] = 20`` also
+    keeps the last 20 requests of every window for ``"high"`` priority requests.
+
+    When ``store`` is set to an instance of a :class:`.BaseRateLimitStore` subclass,
+    every request additionally claims its slot from the shared budget of the store,
+    waiting as long as the store requires.
+
+    To explicitly choose the lane of requests issued from the current thread, use
+    :meth:`.priority`:
+
+    .. code-block:: python
+
+        with reddit.scheduler.priority("low"):
+            for submission in reddit.subreddit("test").new(limit=None):
+                archive(submission)
+
+    """
+
+    DEFAULT_RESERVES = {"high": 0, "normal": 0, "low": 100}
+    LANES = ("high", "normal", "low")
+    _local = local()
+
+    @classmethod
+    def _validate_lane(cls, lane: str):
+        if lane not in cls.LANES:
+            msg = f"Invalid priority lane {lane!r}. Must be one of {cls.LANES!r}."
+            raise ValueError(msg)
+
+    @classmethod
+    def chosen_lane(cls) -> str | None:
+        """Return the lane chosen via :meth:`.priority` in the current thread, if any.
+
+        Lanes only apply to the thread they were chosen in. Use the returned lane in
+        other threads issuing requests on behalf of the current one.
+
+        """
+        return getattr(cls._local, "lane", None)
+
+    @classmethod
+    def current_lane(cls, *, method: str) -> str:
+        """Return the lane for a request issued from the current thread.
+
+        :param method: The HTTP method of the request.
+
+        """
+        lane = getattr(cls._local, "lane", None)
+        if lane is not None:
+            return lane
+        return "normal" if method == "GET" else "high"
+
+    @classmethod
+    @contextmanager
+    def default_priority(cls, lane: str) -> Generator[None, None, None]:
+        """Use ``lane`` within the block unless a lane was already chosen.
+
+        This is used internally to set the lane of requests issued by PRAW itself,
+        e.g., by :class:`.ListingGenerator`, without overriding a lane chosen by the
+        caller via :meth:`.priority`.
+
+        :param lane: One of ``"high"``, ``"normal"``, or ``"low"``.
+
+        """
+        if getattr(cls._local, "lane", None) is not None:
+            yield
+            return
+        with cls.priority(lane):
+            yield
+
+    @classmethod
+    @contextmanager
+    def priority(cls, lane: str) -> Generator[None, None, None]:
+        """Use ``lane`` for requests issued from the current thread within the block.
+
+        :param lane: One of ``"high"``, ``"normal"``, or ``"low"``.
+
+        """
+        cls._validate_lane(lane)
+        previous = getattr(cls._local, "lane", None)
+        cls._local.lane = lane
+        try:
+            yield
+        finally:
+            cls._local.lane = previous
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state of the instance for pickling, without its lock."""
+        state = self.__dict__.copy()
+        del state["_condition"]
+        return state
+
+    def __init__(
+        self,
+        *,
+        reserves: dict[str, int] | None = None,
+        store: BaseRateLimitStore | None = None,
+    ):
+        """Initialize a :class:`.RateLimitScheduler` instance.
+
+        :param reserves: A dictionary mapping lane names to the number of requests in
+            each ratelimit window that the lane leaves for higher priority lanes. Lanes
+            that are not included use their reserve in :attr:`.DEFAULT_RESERVES`
+            (default: ``None``).
+        :param store: An instance of a :class:`.BaseRateLimitStore` subclass used to
+            share the budget with other processes (default: ``None``).
+
+        """
+        self._condition = Condition()
+        self._waiting = dict.fromkeys(self.LANES, 0)
+        self._reported = None
+        self.remaining = None
+        self.reserves = {**self.DEFAULT_RESERVES, **(reserves or {})}
+        self.reset_timestamp = None
+        self.store = store
+        self.used = None
+
+    def __setstate__(self, state: dict[str, Any]):
+        """Restore the state of the instance when unpickling."""
+        self.__dict__.update(state)
+        self._condition = Condition()
+        self._waiting = dict.fromkeys(self.LANES, 0)
+
+    def _available(self, lane: str) -> bool:
+        for other_lane in self.LANES[: self.LANES.index(lane)]:
+            if self._waiting[other_lane]:
+                return False
+        if self.remaining is None:
+            return True
+        if self.reset_timestamp is not None and self.reset_timestamp <= time.time():
+            self.remaining = self.reset_timestamp = self.used = None
+            return True
+        return self.remaining > self.reserves[lane]
+
+    def _wait_timeout(self) -> float | None:
+        timeout = Deadline.check_active()
+        if self.reset_timestamp is None:
+            return timeout
+        until_reset = max(self.reset_timestamp - time.time(), 0.01)
+        return until_reset if timeout is None else min(timeout, until_reset)
+
+    def acquire(self, lane: str):
+        """Block until a request in ``lane`` may be issued, and claim its slot.
+
+        :param lane: The priority lane of the request.
+
+        :raises: :class:`.DeadlineExceededException` if a :class:`.Deadline` active in
+            the current thread passes while waiting.
+
+        """
+        self._validate_lane(lane)
+        with self._condition:
+            self._waiting[lane] += 1
+            try:
+                while not self._available(lane):
+                    self._condition.wait(self._wait_timeout())
+            finally:
+                self._waiting[lane] -= 1
+                self._condition.notify_all()
+            if self.remaining is not None:
+                self.remaining -= 1
+        if self.store is not None:
+            seconds = self.store.acquire()
+            if seconds > 0:
+                timeout = Deadline.check_active()
+                time.sleep(seconds if timeout is None else min(seconds, timeout))
+                Deadline.check_active()
+
+    def release(self, rate_limiter: Any):
+        """Record the ratelimit budget after a request and wake any waiting requests.
+
+        :param rate_limiter: An object with ``remaining``, ``reset_timestamp``, and
+            ``used`` attributes, such as a ``prawcore.RateLimiter``.
+
+        """
+        with self._condition:
+            self.update(rate_limiter)
+            self._condition.notify_all()
+
+    @contextmanager
+    def slot(
+        self,
+        *,
+        method: str,
+        rate_limiter: prawcore.rate_limit.RateLimiter | None = None,
+    ) -> Generator[None, None, None]:
+        """Acquire a slot for a request and release it once the request completes.
+
+        :param method: The HTTP method of the request.
+        :param rate_limiter: The ``prawcore.RateLimiter`` whose state is recorded after
+            the request (default: ``None``).
+
+        """
+        self.acquire(self.current_lane(method=method))
+        try:
+            yield
+        finally:
+            self.release(rate_limiter)
+
+    def update(self, rate_limiter: Any):
+        """Update the tracked budget from ``rate_limiter`` when it has been reported.
+
+        :param rate_limiter: An object with ``remaining``, ``reset_timestamp``, and
+            ``used`` attributes.
+
+        """
+        remaining = getattr(rate_limiter, "remaining", None)
+        if remaining is None:
+            return
+        reported = (remaining, rate_limiter.reset_timestamp, rate_limiter.used)
+        if self.store is not None and reported != self._reported:
+            self.store.update(
+                remaining=remaining,
+                reset_timestamp=rate_limiter.reset_timestamp,
+                used=rate_limiter.used,
+            )
+        self._reported = reported
+        self.remaining, self.reset_timestamp, self.used = reported
@@ -0,0 +1,167 @@
+"""Provide the RetryPolicy class."""
+from __future__ import annotations
+
+import time
+from threading import Lock
+from typing import Any, Callable
+
+from ..exceptions import CircuitBreakerOpenException, DeadlineExceededException
+from ..models.util import ExponentialCounter
+from .deadline import Deadline
+
+
+class RetryPolicy:
+    """Retry failed requests with exponential backoff and stop issuing them in outages.
+
+    prawcore already retries a request a couple of times when Reddit responds with a
+    server error or the connection fails. A :class:`.RetryPolicy` retries the request
+    as a whole further, sleeping between attempts for exponentially increasing,
+    jittered intervals computed by an :class:`.ExponentialCounter`.
+
+    The number of retries is chosen per exception class via ``retries``, where the most
+    specific class of the raised exception wins, and can be capped per HTTP method via
+    ``methods``. For example, to retry server errors and timeouts, but never retry
+    requests that may not be idempotent:
+
+    .. code-block:: python
+
+        from prawcore.exceptions import RequestException, ServerError
+
+        from praw.util.retry import RetryPolicy
+
+        reddit.retry_policy = RetryPolicy(
+            methods={"PATCH": 0, "POST": 0},
+            retries={RequestException: 2, ServerError: 4},
+        )
+
+    When ``failure_threshold`` is set, the policy also acts as a circuit breaker: after
+    that many consecutive requests fail with one of the exception classes in
+    ``retries``, the circuit opens, and requests fail immediately with
+    :class:`.CircuitBreakerOpenException` rather than waiting on an unavailable Reddit.
+    Once ``recovery_timeout`` seconds have passed, a single request is let through; the
+    circuit closes if it succeeds, and opens again otherwise.
+
+    By default, no requests are retried and the circuit breaker is disabled.
+
+    """
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state of the instance for pickling, without its lock."""
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int | None = None,
+        max_backoff: int = 16,
+        methods: dict[str, int] | None = None,
+        recovery_timeout: float = 30,
+        retries: dict[type[Exception], int] | None = None,
+    ):
+        """Initialize a :class:`.RetryPolicy` instance.
+
+        :param failure_threshold: The number of consecutive failed requests after which
+            the circuit opens (default: ``None``, the circuit never opens).
+        :param max_backoff: The maximum base number of seconds slept between attempts
+            (default: ``16``).
+        :param methods: A dictionary mapping HTTP methods to the maximum number of
+            retries of requests using them (default: ``None``, no maximum).
+        :param recovery_timeout: The number of seconds the circuit stays open before a
+            request is attempted again (default: ``30``).
+        :param retries: A dictionary mapping exception classes to the number of times a
+            request failing with them is retried (default: ``None``, no retries).
+
+        """
+        self._failures = 0
+        self._lock = Lock()
+        self._opened_at = None
+        self._trial = False
+        self.failure_threshold = failure_threshold
+        self.max_backoff = max_backoff
+        self.methods = methods or {}
+        self.recovery_timeout = recovery_timeout
+        self.retries = retries or {}
+
+    def __setstate__(self, state: dict[str, Any]):
+        """Restore the state of the instance when unpickling."""
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    def _before_attempt(self):
+        with self._lock:
+            if self._opened_at is None:
+                return
+            retry_after = self._opened_at + self.recovery_timeout - time.monotonic()
+            if retry_after > 0 or self._trial:
+                raise CircuitBreakerOpenException(retry_after=max(retry_after, 0))
+            self._trial = True
+
+    def _record(self, *, failed: bool):
+        with self._lock:
+            trial, self._trial = self._trial, False
+            if not failed:
+                self._failures = 0
+                self._opened_at = None
+                return
+            self._failures += 1
+            if trial or (
+                self.failure_threshold is not None
+                and self._failures >= self.failure_threshold
+            ):
+                self._opened_at = time.monotonic()
+
+    def _retries_for(self, exception: Exception) -> int | None:
+        for cls in type(exception).__mro__:
+            if cls in self.retries:
+                return self.retries[cls]
+        return None
+
+    @property
+    def is_open(self) -> bool:
+        """Return whether the circuit is open, i.e., requests currently fail fast."""
+        with self._lock:
+            return self._opened_at is not None
+
+    def call(self, function: Callable[[], Any], *, method: str) -> Any:
+        """Call ``function``, retrying it according to the policy.
+
+        :param function: The function issuing the request.
+        :param method: The HTTP method of the request.
+
+        A failed request is not retried when the retry would be attempted after a
+        :class:`.Deadline` active in the current thread has passed.
+
+        :raises: :class:`.CircuitBreakerOpenException` if the circuit is open.
+
+        """
+        counter = None
+        attempt = 0
+        while True:
+            self._before_attempt()
+            try:
+                result = function()
+            except Exception as exception:  # noqa: BLE001
+                retries = self._retries_for(exception)
+                self._record(failed=retries is not None)
+                if retries is None:
+                    raise
+                retries = min(retries, self.methods.get(method, retries))
+                if attempt >= retries or self.is_open:
+                    raise
+                if counter is None:
+                    counter = ExponentialCounter(max_counter=self.max_backoff)
+                delay = counter.counter()
+                try:
+                    remaining = Deadline.check_active()
+                except DeadlineExceededException:
+                    raise exception from None
+                if remaining is not None and remaining <= delay:
+                    # The retry would be attempted after the deadline has passed
+                    raise
+                time.sleep(delay)
+                attempt += 1
+            else:
+                self._record(failed=False)
+                return result
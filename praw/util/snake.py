@@ -2,13 +2,20 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Any
 
 _re_camel_to_snake = re.compile(r"([a-z0-9](?=[A-Z])|[A-Z](?=[A-Z][a-z]))")
 
 
+@lru_cache(maxsize=4096)
 def camel_to_snake(name: str) -> str:
-    """Convert ``name`` from camelCase to snake_case."""
+    """Convert ``name`` from camelCase to snake_case.
+
+    Conversions are memoized, as the same keys are converted for every object in a
+    response.
+
+    """
     return _re_camel_to_snake.sub(r"\1_", name).lower()
 
 
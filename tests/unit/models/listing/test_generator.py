@@ -1,12 +1,132 @@
 """Test praw.models.listing.generator."""
+import asyncio
+from unittest import mock
+
 import pytest
 
+from praw.exceptions import DeadlineExceededException
+from praw.models import Listing
 from praw.models.listing.generator import ListingGenerator
+from praw.util.deadline import Deadline
 
 from ... import UnitTest
 
 
 class TestListingGenerator(UnitTest):
+    def test_aiter(self, reddit):
+        async def collect():
+            return [item async for item in generator]
+
+        generator = ListingGenerator(reddit, "r/test/new", limit=None)
+        listing = Listing(
+            reddit, _data={"after": None, "children": [{"id": "1"}, {"id": "2"}]}
+        )
+        with mock.patch.object(reddit, "get", return_value=listing):
+            assert asyncio.run(collect()) == [
+                {"id": "1"},
+                {"id": "2"},
+            ]
+        reddit.async_executor.shutdown()
+
+    def test_deadline(self, reddit):
+        deadline = Deadline()
+        generator = ListingGenerator(reddit, "r/test/new", deadline=deadline, limit=4)
+        reddit._core.request = mock.Mock(
+            return_value={
+                "data": {"after": "t3_2", "children": [{"id": "1"}]},
+                "kind": "Listing",
+            }
+        )
+        assert next(generator) == {"id": "1"}
+        deadline.cancel()
+        with pytest.raises(DeadlineExceededException):
+            next(generator)
+        assert reddit._core.request.call_count == 1
+
+    def test_fields(self, reddit):
+        reddit._core.request = mock.Mock(
+            return_value={
+                "data": {
+                    "after": None,
+                    "children": [
+                        {
+                            "data": {"author": "spez", "id": "1", "score": 1},
+                            "kind": "t3",
+                        }
+                    ],
+                },
+                "kind": "Listing",
+            }
+        )
+        submission = next(ListingGenerator(reddit, "r/test/new", fields=["score"]))
+        assert submission.score == 1
+        with pytest.raises(AttributeError):
+            submission.author
+        assert reddit._core.request.call_count == 1
+
+    def test_fields__str(self, reddit):
+        with pytest.raises(TypeError) as excinfo:
+            ListingGenerator(reddit, "r/test/new", fields="score")
+        assert str(excinfo.value) == "'fields' must be a non-str iterable."
+
+    def test_raw(self, reddit):
+        reddit._core.request = mock.Mock(
+            side_effect=[
+                {
+                    "data": {
+                        "after": "t3_1",
+                        "children": [
+                            {
+                                "data": {"id": "1", "name": "t3_1", "score": 1},
+                                "kind": "t3",
+                            }
+                        ],
+                    },
+                    "kind": "Listing",
+                },
+                {
+                    "data": {
+                        "after": None,
+                        "children": [{"data": {"id": "2", "score": 2}, "kind": "t3"}],
+                    },
+                    "kind": "Listing",
+                },
+            ]
+        )
+        generator = ListingGenerator(
+            reddit, "r/test/new", fields=["score"], limit=None, raw=True
+        )
+        assert list(generator) == [{"name": "t3_1", "score": 1}, {"score": 2}]
+        assert reddit._core.request.call_args.kwargs["params"]["after"] == "t3_1"
+
+    def test_raw__flair_listing(self, reddit):
+        reddit._core.request = mock.Mock(
+            side_effect=[
+                {"next": "b", "users": [{"user": "a"}]},
+                {"users": [{"user": "b"}]},
+            ]
+        )
+        generator = ListingGenerator(reddit, "r/test/flair", limit=None, raw=True)
+        assert list(generator) == [{"user": "a"}, {"user": "b"}]
+        assert reddit._core.request.call_args.kwargs["params"]["after"] == "b"
+
+    def test_lean_models(self, reddit):
+        reddit.config.lean_models = True
+        reddit._core.request = mock.Mock(
+            return_value={
+                "data": {
+                    "after": None,
+                    "children": [{"data": {"author": "spez", "id": "1"}, "kind": "t3"}],
+                },
+                "kind": "Listing",
+            }
+        )
+        submission = next(ListingGenerator(reddit, "r/test/new"))
+        assert "author" not in submission.__dict__
+        assert submission.author == "spez"
+        submission = reddit.get("r/test/new").children[0]
+        assert "author" in submission.__dict__
+
     def test_bad_dict(self):
         generator = ListingGenerator(None, None)
         with pytest.raises(ValueError) as excinfo:
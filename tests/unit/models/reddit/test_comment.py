@@ -68,6 +68,15 @@ class TestComment(UnitTest):
         assert hash(comment2) != hash(comment3)
         assert hash(comment1) != hash(comment3)
 
+    def test_hash__cached(self, reddit):
+        comment = Comment(reddit, _data={"id": "Dummy1"})
+        assert hash(comment) == hash(Comment(reddit, _data={"id": "dummy1"}))
+        assert comment._identity_cache == ("Dummy1", "dummy1", hash(comment))
+        comment.id = "dummy2"
+        assert hash(comment) == hash(Comment(reddit, _data={"id": "dummy2"}))
+        assert comment == "DUMMY2"
+        assert comment in {Comment(reddit, _data={"id": "dummy2"})}
+
     def test_id_from_url(self):
         urls = [
             "http://reddit.com/comments/2gmzqe/_/cklhv0f/",
@@ -102,6 +111,18 @@ class TestComment(UnitTest):
             other = pickle.loads(pickle.dumps(comment, protocol=level))
             assert comment == other
 
+    def test_pickle__identity_cache(self, reddit):
+        comment = Comment(reddit, _data={"id": "dummy"})
+        hash(comment)
+        # Simulate a hash computed in a process with a different hash seed
+        comment._identity_cache = comment._identity_cache[:2] + (12345,)
+        for level in range(pickle.HIGHEST_PROTOCOL + 1):
+            other = pickle.loads(pickle.dumps(comment, protocol=level))
+            assert "_identity_cache" not in other.__dict__
+            fresh = Comment(reddit, _data={"id": "dummy"})
+            assert hash(other) == hash(fresh)
+            assert other in {fresh}
+
     def test_repr(self, reddit):
         comment = Comment(reddit, id="dummy")
         assert repr(comment) == "Comment(id='dummy')"
@@ -22,3 +22,38 @@ class TestModmailConversation(UnitTest):
 
         conversation = ModmailConversation(reddit, "ik72")
         assert str(conversation) == "ik72"
+
+    def test_user__lazy(self, reddit):
+        data = {
+            "authors": [],
+            "id": "ik72",
+            "isInternal": False,
+            "owner": None,
+            "participant": None,
+            "user": {
+                "banStatus": {"isBanned": False},
+                "created": "2016-05-12T23:42:30.337289+00:00",
+                "id": "t2_xw1ym",
+                "muteStatus": {"isMuted": False},
+                "name": "bboe",
+                "recentComments": {
+                    "t1_dcmp9du": {"comment": "Comment", "permalink": "/dcmp9du/"}
+                },
+                "recentConvos": {
+                    "ik72": {"id": "ik72", "subject": "First"},
+                    "ik9t": {"id": "ik9t", "subject": "Second"},
+                },
+                "recentPosts": {},
+            },
+        }
+        conversation = ModmailConversation.parse(data, reddit)
+        assert conversation.is_internal is False
+        assert "user" not in conversation.__dict__
+        user = conversation.user
+        assert conversation.__dict__["user"] is user
+        assert user.name == "bboe"
+        assert user.created_string == "2016-05-12T23:42:30.337289+00:00"
+        assert user.mute_status == {"isMuted": False}
+        assert user.recent_comments[0].id == "dcmp9du"
+        assert [convo.subject for convo in user.recent_convos] == ["Second", "First"]
+        assert user.recent_posts == []
@@ -1,11 +1,14 @@
 from json import dumps
+from unittest import mock
 
 import pytest
 from pytest import raises
 
 from praw.models import (
+    IDCard,
     SubredditWidgets,
     SubredditWidgetsModeration,
+    TextArea,
     Widget,
     WidgetModeration,
 )
@@ -44,6 +47,39 @@ class TestWidgets(UnitTest):
         with pytest.raises(AttributeError):
             _ = widgets.nonexistant_attribute
 
+    def test_lazy_widgets(self, reddit):
+        data = {
+            "items": {
+                "widget_1": {"id": "widget_1", "kind": "id-card", "shortName": "Card"},
+                "widget_2": {
+                    "id": "widget_2",
+                    "kind": "textarea",
+                    "shortName": "Text",
+                    "text": "Hello",
+                },
+                "widget_3": {"id": "widget_3", "kind": "moderators", "mods": []},
+            },
+            "layout": {
+                "idCardWidget": "widget_1",
+                "moderatorWidget": "widget_3",
+                "sidebar": {"order": ["widget_2"]},
+                "topbar": {"order": []},
+            },
+        }
+        widgets = SubredditWidgets(Subreddit(reddit, "test"))
+        with mock.patch.object(reddit, "get", return_value=data) as get:
+            id_card = widgets.id_card
+        get.assert_called_once()
+        assert isinstance(id_card, IDCard)
+        assert list(widgets._widgets) == ["widget_1"]
+        assert isinstance(widgets.sidebar[0], TextArea)
+        assert widgets.sidebar[0].text == "Hello"
+        assert list(widgets._widgets) == ["widget_1", "widget_2"]
+        assert widgets.topbar == []
+        assert list(widgets.items) == ["widget_1", "widget_2", "widget_3"]
+        assert widgets.items["widget_1"] is id_card
+        assert widgets.items["widget_3"] is widgets.moderators_widget
+
     def test_repr(self, reddit):
         widgets = SubredditWidgets(
             Subreddit(reddit, pytest.placeholders.test_subreddit)
@@ -0,0 +1,131 @@
+"""Test praw.models.state."""
+import pickle
+from datetime import datetime
+from unittest import mock
+
+import pytest
+
+from praw.models import Comment, Draft, MoreComments, Redditor, Submission
+from praw.models.comment_forest import CommentForest
+
+from .. import UnitTest
+
+
+def comment_data(id, parent_id, replies=""):
+    return {
+        "kind": "t1",
+        "data": {
+            "author": "bboe",
+            "body": f"Comment {id}",
+            "id": id,
+            "link_id": "t3_abc",
+            "name": f"t1_{id}",
+            "parent_id": parent_id,
+            "replies": replies,
+            "subreddit": "test",
+        },
+    }
+
+
+def listing(*children):
+    return {"kind": "Listing", "data": {"after": None, "children": list(children)}}
+
+
+class TestState(UnitTest):
+    @pytest.fixture
+    def submission(self, reddit):
+        response = [
+            listing(
+                {
+                    "kind": "t3",
+                    "data": {
+                        "author": "bboe",
+                        "id": "abc",
+                        "name": "t3_abc",
+                        "subreddit": "test",
+                        "title": "Title",
+                    },
+                }
+            ),
+            listing(
+                comment_data(
+                    "c1",
+                    "t3_abc",
+                    listing(
+                        comment_data("c2", "t1_c1"),
+                        {
+                            "kind": "more",
+                            "data": {
+                                "children": ["c3"],
+                                "count": 1,
+                                "id": "c3",
+                                "name": "t1_c3",
+                                "parent_id": "t1_c1",
+                            },
+                        },
+                    ),
+                ),
+                comment_data("c4", "t3_abc"),
+            ),
+        ]
+        submission = reddit.submission("abc")
+        with mock.patch.object(Submission, "_fetch_data", return_value=response):
+            submission._fetch()
+        return submission
+
+    def test_from_state__wrong_class(self, reddit):
+        state = Redditor(reddit, "bboe").to_state()
+        with pytest.raises(ValueError) as excinfo:
+            Comment.from_state(reddit, state)
+        assert str(excinfo.value) == "The state is of a 'Redditor', not a 'Comment'."
+
+    def test_from_state__unknown_kind(self, reddit):
+        with pytest.raises(ValueError) as excinfo:
+            Comment.from_state(reddit, {"__praw__": "Unknown", "data": {}})
+        assert str(excinfo.value) == "Unknown kind 'Unknown' in state."
+
+    def test_to_state(self, reddit):
+        comment = Comment(reddit, _data={"id": "abc", "subreddit": "test"})
+        hash(comment)
+        comment.subreddit.mod  # a helper, which is not data
+        state = comment.to_state()
+        assert state["__praw__"] == "Comment"
+        assert state["data"]["id"] == "abc"
+        assert "_identity_cache" not in state["data"]
+        assert "_reddit" not in state["data"]
+        assert "mod" not in state["data"]["subreddit"]["data"]
+
+    def test_to_state__datetime(self, reddit):
+        draft = Draft(reddit, "abc")
+        draft.modified = datetime(2023, 7, 11, 12)
+        other = Draft.from_state(reddit, pickle.loads(pickle.dumps(draft.to_state())))
+        assert other.modified == datetime(2023, 7, 11, 12)
+
+    def test_to_state__unsupported(self, reddit):
+        comment = Comment(reddit, _data={"id": "abc", "unsupported": object()})
+        with pytest.raises(TypeError) as excinfo:
+            comment.to_state()
+        assert str(excinfo.value) == "Cannot convert 'object' object to state."
+
+    def test_to_state__round_trip(self, reddit, submission):
+        state = pickle.loads(pickle.dumps(submission.to_state()))
+        assert len(pickle.dumps(state)) < len(pickle.dumps(submission))
+        other = Submission.from_state(reddit, state)
+        assert other == submission
+        assert other._fetched
+        assert other.title == "Title"
+        assert other.author == Redditor(reddit, "bboe")
+        assert isinstance(other.comments, CommentForest)
+        assert [str(comment) for comment in other.comments] == ["c1", "c4"]
+        first = other.comments[0]
+        assert first._reddit is reddit
+        assert first.submission is other
+        assert first.body == "Comment c1"
+        assert first.replies[0].submission is other
+        assert isinstance(first.replies[1], MoreComments)
+        assert other._comments_by_id["t1_c2"] is first.replies[0]
+        assert [
+            comment.id
+            for comment in other.comments.list()
+            if isinstance(comment, Comment)
+        ] == ["c1", "c4", "c2"]
@@ -1,6 +1,8 @@
 """Test praw.models.util."""
 from collections import namedtuple
+from unittest import mock
 
+from praw.models import ListingGenerator
 from praw.models.util import (
     BoundedSet,
     ExponentialCounter,
@@ -125,6 +127,53 @@ class TestStream(UnitTest):
             assert thing not in seen
             seen.add(thing)
 
+    def test_stream__raw(self):
+        calls = []
+
+        def generate(limit, params, raw):
+            calls.append(params)
+            return [{"name": "t1_b"}, {"name": "t1_a"}]
+
+        stream = stream_generator(generate, pause_after=-1, raw=True)
+        assert next(stream) == {"name": "t1_a"}
+        assert next(stream) == {"name": "t1_b"}
+        assert next(stream) is None
+        assert next(stream) is None
+        assert calls == [{"before": None}, {"before": "t1_b"}]
+
+    def test_stream__raw_fields(self, reddit):
+        reddit._core.request = mock.Mock(
+            return_value={
+                "data": {
+                    "after": None,
+                    "children": [
+                        {
+                            "data": {"body": "b", "id": "b", "name": "t1_b"},
+                            "kind": "t1",
+                        },
+                        {
+                            "data": {"body": "a", "id": "a", "name": "t1_a"},
+                            "kind": "t1",
+                        },
+                    ],
+                },
+                "kind": "Listing",
+            }
+        )
+
+        def generate(**kwargs):
+            return ListingGenerator(reddit, "r/test/comments", **kwargs)
+
+        stream = stream_generator(generate, fields=["body"], pause_after=-1, raw=True)
+        assert next(stream) == {"body": "a", "name": "t1_a"}
+        assert next(stream) == {"body": "b", "name": "t1_b"}
+        assert next(stream) is None
+
+        stream = stream_generator(
+            generate, attribute_name="id", fields=["body"], pause_after=-1, raw=True
+        )
+        assert next(stream) == {"body": "a", "id": "a", "name": "t1_a"}
+
     def test_comments__with_continue_after_id(
         self,
     ):
@@ -42,6 +42,21 @@ class TestConfig:
                 else:
                     os.environ[env_name] = prev_environment[env_name]
 
+    def test_cache_ttls(self):
+        config = Config("DEFAULT", cache_ttl="5", cache_ttl_rules="300")
+        assert config.cache_ttl == 5.0
+        assert config.cache_ttls == {"rules": 300.0}
+        assert config.custom == {}
+
+    def test_cache_ttls__invalid(self):
+        with pytest.raises(ValueError) as excinfo:
+            Config("DEFAULT", cache_ttl_rules="forever")
+        assert (
+            str(excinfo.value)
+            == "An incorrect config type was given for option cache_ttl_rules. The"
+            " expected type is float, but the given value is forever."
+        )
+
     def test_check_for_updates__false(self):
         for value in [False, "False", "other"]:
             config = Config("DEFAULT", check_for_updates=value)
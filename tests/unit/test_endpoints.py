@@ -0,0 +1,26 @@
+import pytest
+
+from praw.endpoints import endpoint_name
+
+from . import UnitTest
+
+
+class TestEndpointName(UnitTest):
+    @pytest.mark.parametrize(
+        ("path", "name"),
+        [
+            ("api/info/", "info"),
+            ("/api/morechildren", "morechildren"),
+            ("https://oauth.reddit.com/r/test/about/rules", "rules"),
+            ("r/test/about/", "subreddit_about"),
+            ("r/test/about/log/", "about_log"),
+            ("r/test/wiki/config/automoderator", "wiki_page"),
+            ("r/test/wiki/pages/", "wiki_pages"),
+            ("user/bboe/about/", "user_about"),
+        ],
+    )
+    def test_endpoint_name(self, path, name):
+        assert endpoint_name(path) == name
+
+    def test_endpoint_name__unknown(self):
+        assert endpoint_name("not/an/endpoint/") is None
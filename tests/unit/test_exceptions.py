@@ -2,7 +2,9 @@ import pytest
 
 from praw.exceptions import (
     APIException,
+    CircuitBreakerOpenException,
     ClientException,
+    DeadlineExceededException,
     DuplicateReplaceException,
     InvalidFlairTemplateID,
     InvalidImplicitAuth,
@@ -23,6 +25,20 @@ class TestAPIException:
             raise exc
 
 
+class TestCircuitBreakerOpenException:
+    def test_inheritance(self):
+        assert issubclass(CircuitBreakerOpenException, ClientException)
+
+    def test_message(self):
+        exception = CircuitBreakerOpenException(retry_after=12.34)
+        assert exception.retry_after == 12.34
+        assert (
+            str(exception)
+            == "Requests are failing fast after repeated failures. A request will be"
+            " attempted again in 12.3 seconds."
+        )
+
+
 class TestClientException:
     def test_inheritance(self):
         assert issubclass(ClientException, PRAWException)
@@ -32,6 +48,19 @@ class TestClientException:
         assert str(ClientException("error message")) == "error message"
 
 
+class TestDeadlineExceededException:
+    def test_inheritance(self):
+        assert issubclass(DeadlineExceededException, ClientException)
+
+    def test_message(self):
+        assert str(DeadlineExceededException(cancelled=True)) == (
+            "The operation was cancelled."
+        )
+        assert str(DeadlineExceededException(cancelled=False)) == (
+            "The deadline of the operation has passed."
+        )
+
+
 class TestDuplicateReplaceException:
     def test_inheritance(self):
         assert issubclass(DuplicateReplaceException, ClientException)
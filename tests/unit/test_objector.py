@@ -1,9 +1,95 @@
+import json
+from pathlib import Path
+from unittest import mock
+
 import pytest
 
 from praw.exceptions import ClientException, RedditAPIException
+from praw.models import Comment, MoreComments, Redditor, Submission
+from praw.objector import Objector
 
 from . import UnitTest
 
+CASSETTES = Path(__file__).parent.parent / "integration" / "cassettes"
+
+
+def chained_dict_handler(data):  # noqa: PLR0911,PLR0912
+    """Return the dict handler chosen by the original chain of key checks."""
+    if {"messages", "modActions"}.issubset(data) and {
+        "conversations",
+        "conversation",
+    }.intersection(data):
+        return "_objectify_modmail_fetched_conversation"
+    if {"messages", "modActions"}.issubset(data) or {
+        "legacyFirstMessageId",
+        "state",
+    }.issubset(data):
+        return "_objectify_modmail_conversation"
+    if {"conversationIds", "conversations", "messages"}.issubset(data):
+        return "_objectify_modmail_conversations"
+    if {"actionTypeId", "author", "date"}.issubset(data):
+        return "_objectify_modmail_action"
+    if {"bodyMarkdown", "isInternal"}.issubset(data):
+        return "_objectify_modmail_message"
+    if {"kind", "short_name", "violation_reason"}.issubset(data):
+        return "_objectify_rule"
+    if {"isAdmin", "isDeleted"}.issubset(data):
+        return "_objectify_modmail_author"
+    if {"banStatus", "muteStatus", "recentComments"}.issubset(data):
+        return "_objectify_modmail_user"
+    if {"displayName", "id", "type"}.issubset(data):
+        return "_objectify_modmail_subreddit"
+    if {"date", "id", "name"}.issubset(data) or {
+        "id",
+        "name",
+        "permissions",
+    }.issubset(data):
+        return "_objectify_redditor"
+    if {"text", "url"}.issubset(data):
+        return "_objectify_button_or_menu_link"
+    if {"children", "text"}.issubset(data):
+        return "_objectify_submenu"
+    if {"height", "url", "width"}.issubset(data):
+        return "_objectify_image"
+    if {"isSubscribed", "name", "subscribers"}.issubset(data):
+        return "_objectify_subreddit_name"
+    if {"authorFlairType", "name"}.issubset(data):
+        return "_objectify_redditor_name"
+    if {"parent_id"}.issubset(data):
+        return "_objectify_comment"
+    if "collection_id" in data:
+        return "_objectify_collection"
+    if {"moderators", "moderatorIds", "allUsersLoaded", "subredditId"}.issubset(data):
+        return "_objectify_moderator_list"
+    if "username" in data:
+        return "_objectify_username"
+    if {"mod_permissions", "name", "sr", "subscribers"}.issubset(data):
+        return "_objectify_moderated_subreddit"
+    if {"drafts", "subreddits"}.issubset(data):
+        return "_objectify_draft_list"
+    if {"mod_action_data", "user_note_data"}.issubset(data):
+        return "_objectify_mod_note"
+    if "created" in data:
+        return "_objectify_created"
+    return "_objectify_unknown"
+
+
+def cassette_dicts():
+    """Yield every dict in the JSON response bodies recorded in the cassettes."""
+    for path in sorted(CASSETTES.glob("*.json")):
+        for interaction in json.loads(path.read_text())["http_interactions"]:
+            try:
+                pending = [json.loads(interaction["response"]["body"]["string"])]
+            except (KeyError, ValueError):
+                continue
+            while pending:
+                value = pending.pop()
+                if isinstance(value, dict):
+                    yield value
+                    pending.extend(value.values())
+                elif isinstance(value, list):
+                    pending.extend(value)
+
 
 class TestObjector(UnitTest):
     def test_check_error(self, reddit):
@@ -16,6 +102,140 @@ class TestObjector(UnitTest):
         with pytest.raises(RedditAPIException):
             objector.check_error(error_response)
 
+    def test_dict_handler__parity_with_cassettes(self):
+        key_sets = {frozenset(data) for data in cassette_dicts()}
+        assert len(key_sets) > 100
+        for keys in key_sets:
+            assert Objector._dict_handler(keys) == chained_dict_handler(keys)
+
+    def test_lean(self, reddit):
+        objector = reddit._objector
+        data = [
+            {
+                "data": {
+                    "author": "spez",
+                    "body": "a",
+                    "id": "a",
+                    "replies": "",
+                    "subreddit": "test",
+                },
+                "kind": "t1",
+            }
+        ]
+        with objector.lean():
+            assert "author" in objector.objectify(data)[0].__dict__
+        reddit.config.lean_models = True
+        with objector.lean():
+            (comment,) = objector.objectify(data)
+        assert isinstance(objector.objectify(data)[0].__dict__["author"], Redditor)
+        assert comment.__dict__.keys() == {
+            "_fetched",
+            "_lean_data",
+            "_reddit",
+            "_submission",
+            "body",
+            "id",
+        }
+        assert comment._lean_data == {
+            "_replies": "",
+            "author": "spez",
+            "subreddit": "test",
+        }
+        assert comment.body == "a"
+        assert isinstance(comment.author, Redditor)
+        assert comment.author == "spez"
+        assert comment._replies == []
+        assert comment._lean_data == {"subreddit": "test"}
+        assert data[0]["data"]["author"] == "spez"
+
+    def test_lean__concurrent_access(self, reddit):
+        objector = reddit._objector
+        reddit.config.lean_models = True
+        data = [
+            {
+                "data": {"author": "spez", "body": "a", "id": "a", "subreddit": "test"},
+                "kind": "t1",
+            }
+        ]
+        with objector.lean():
+            (comment,) = objector.objectify(data)
+        author = comment.author
+        # A first access in another thread that started before ``author`` was converted
+        assert comment.__getattr__("author") is author
+        assert comment.__getattr__("subreddit") == "test"
+        assert comment._lean_data == {}
+
+    def test_projection(self, reddit):
+        objector = reddit._objector
+        data = [
+            {"data": {"author": "spez", "id": "a", "score": 1}, "kind": "t3"},
+            {"data": {"author": "spez", "id": "b", "score": 2}, "kind": "t3"},
+        ]
+        with objector.projection(None):
+            assert objector.objectify(data)[0].score == 1
+        with objector.projection(frozenset({"score"})):
+            submissions = objector.objectify(data)
+            (submission,) = objector.objectify(data[:1])
+            message = objector.objectify(
+                {
+                    "data": {
+                        "author": None,
+                        "body": "a",
+                        "dest": "a",
+                        "id": "c",
+                        "replies": "",
+                        "subreddit": None,
+                    },
+                    "kind": "t4",
+                }
+            )
+        assert getattr(objector._local, "fields", None) is None
+        assert [submission.score for submission in submissions] == [1, 2]
+        assert submission.id == "a"
+        assert message.body == "a"
+        with pytest.raises(AttributeError) as excinfo:
+            submission.author
+        assert str(excinfo.value) == (
+            "'Submission' object has no attribute 'author', which was dropped because"
+            " it is not in 'fields'"
+        )
+        assert data[0]["data"]["author"] == "spez"
+
+    def test_objectify_dict__created(self, reddit):
+        assert reddit._objector.objectify({"created": 1}) == {"created": 1}
+
+    def test_objectify_dict__memoized(self, reddit):
+        Objector._dict_handlers.clear()
+        reddit._objector.objectify({"a": 1})
+        reddit._objector.objectify({"a": 2})
+        assert Objector._dict_handlers == {frozenset({"a"}): "_objectify_unknown"}
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(Objector, "MAX_DICT_HANDLERS", 1)
+            reddit._objector.objectify({"b": 1})
+        assert Objector._dict_handlers == {frozenset({"b"}): "_objectify_unknown"}
+
+    def test_objectify_list__mixed_kinds(self, reddit):
+        objector = reddit._objector
+        data = [
+            {"data": {"id": "a"}, "kind": "t1"},
+            {"data": {"children": ["b"], "id": "b"}, "kind": "more"},
+        ]
+        with mock.patch.object(objector, "objectify", wraps=objector.objectify) as spy:
+            comment, more = spy(data)
+        assert spy.call_count == 3
+        assert isinstance(comment, Comment)
+        assert isinstance(more, MoreComments)
+
+    def test_objectify_list__single_kind(self, reddit):
+        objector = reddit._objector
+        data = [{"data": {"id": id}, "kind": "t3"} for id in ("a", "b")]
+        with mock.patch.object(objector, "objectify", wraps=objector.objectify) as spy:
+            submissions = spy(data)
+        assert spy.call_count == 1
+        assert [type(submission) for submission in submissions] == [Submission] * 2
+        assert [submission.id for submission in submissions] == ["a", "b"]
+        assert objector.objectify([]) == []
+
     def test_objectify_returns_None_for_None(self, reddit):
         assert reddit._objector.objectify(None) is None
 
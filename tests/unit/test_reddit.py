@@ -1,17 +1,25 @@
 import asyncio
 import configparser
 import types
+from threading import Event, Thread
 from unittest import mock
 from unittest.mock import MagicMock
 
 import pytest
 import requests
 from prawcore import Requestor
-from prawcore.exceptions import BadRequest
+from prawcore.exceptions import BadRequest, ServerError
 
 from praw import Reddit, __version__
 from praw.config import Config
-from praw.exceptions import ClientException, RedditAPIException
+from praw.exceptions import (
+    ClientException,
+    DeadlineExceededException,
+    RedditAPIException,
+)
+from praw.util.connection_pool import ConnectionPool
+from praw.util.deadline import Deadline
+from praw.util.retry import RetryPolicy
 from praw.util.token_manager import BaseTokenManager
 
 from . import UnitTest
@@ -42,11 +50,26 @@ class TestReddit(UnitTest):
         response.status_code = 200
         return response
 
+    def test_async_iterator(self, caplog):
+        async def collect():
+            return [item async for item in reddit.async_iterator(requests_made())]
+
+        def requests_made():
+            for _ in range(2):
+                yield reddit.request(method="GET", path="path")
+
+        reddit = Reddit(**self.REQUIRED_DUMMY_SETTINGS)
+        reddit._core.request = mock.Mock(return_value={"name": "username"})
+        with reddit:
+            assert asyncio.run(collect()) == [{"name": "username"}] * 2
+            assert reddit.async_executor._executor is not None
+        assert reddit.async_executor._executor is None
+        assert caplog.records == []
+
     def test_check_for_async(self, caplog):
         reddit = Reddit(**self.REQUIRED_DUMMY_SETTINGS)
         reddit._core.request = self.patch_request
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self.check_async(reddit))
+        asyncio.run(self.check_async(reddit))
         log_record = caplog.records[0]
         assert log_record.levelname == "WARNING"
         assert (
@@ -62,8 +85,7 @@ class TestReddit(UnitTest):
     def test_check_for_async__disabled(self, caplog):
         reddit = Reddit(check_for_async=False, **self.REQUIRED_DUMMY_SETTINGS)
         reddit._core.request = self.patch_request
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self.check_async(reddit))
+        asyncio.run(self.check_async(reddit))
         assert caplog.records == []
 
     @mock.patch("praw.reddit.UPDATE_CHECKER_MISSING", False)
@@ -98,10 +120,103 @@ class TestReddit(UnitTest):
             "'token_manager'"
         )
 
+    def test_connection_pool(self):
+        pool = ConnectionPool()
+        instances = [
+            Reddit(
+                client_id="dummy",
+                client_secret="dummy",
+                connection_pool=pool,
+                user_agent=user_agent,
+            )
+            for user_agent in ("first", "second")
+        ]
+        sessions = [reddit._core._requestor._http for reddit in instances]
+        assert all(reddit.connection_pool is pool for reddit in instances)
+        assert sessions[0] is not sessions[1]
+        assert sessions[0].adapters["https://"] is sessions[1].adapters["https://"]
+        assert sessions[0].headers["User-Agent"].startswith("first ")
+        assert sessions[1].headers["User-Agent"].startswith("second ")
+        assert pool.stats()["sessions"] == 2
+
+    def test_connection_pool__not_set(self):
+        class CustomRequestor(Requestor):
+            def __init__(self, user_agent, oauth_url, reddit_url):
+                super().__init__(user_agent, oauth_url, reddit_url)
+
+        reddit = Reddit(requestor_class=CustomRequestor, **self.REQUIRED_DUMMY_SETTINGS)
+        assert isinstance(reddit._core._requestor, CustomRequestor)
+        assert reddit.connection_pool is None
+
+    def test_connection_pool__with_session(self):
+        with pytest.raises(TypeError):
+            Reddit(
+                client_id="dummy",
+                client_secret="dummy",
+                connection_pool=ConnectionPool(),
+                requestor_kwargs={"session": mock.Mock(headers={})},
+                user_agent="dummy",
+            )
+
     def test_context_manager(self):
         with Reddit(**self.REQUIRED_DUMMY_SETTINGS) as reddit:
             assert not reddit.config.check_for_updates
 
+    def test_info__fields(self, reddit):
+        reddit._core.request = mock.Mock(
+            return_value={
+                "data": {
+                    "after": None,
+                    "children": [
+                        {"data": {"id": "1", "score": 1, "title": "a"}, "kind": "t3"}
+                    ],
+                },
+                "kind": "Listing",
+            }
+        )
+        for max_workers in (None, 2):
+            (submission,) = reddit.info(
+                fields=("score",), fullnames=["t3_1"], max_workers=max_workers
+            )
+            assert submission.__dict__.keys() >= {"id", "score"}
+            assert "title" not in submission.__dict__
+        (submission,) = reddit.info(url="https://example.com")
+        assert submission.title == "a"
+        with pytest.raises(TypeError) as excinfo:
+            reddit.info(fields="score", url="https://example.com")
+        assert str(excinfo.value) == "'fields' must be a non-str iterable."
+
+    def test_info__raw(self, reddit):
+        reddit._core.request = mock.Mock(
+            return_value={
+                "data": {
+                    "after": None,
+                    "children": [
+                        {
+                            "data": {
+                                "id": "1",
+                                "name": "t3_1",
+                                "score": 1,
+                                "title": "a",
+                            },
+                            "kind": "t3",
+                        }
+                    ],
+                },
+                "kind": "Listing",
+            }
+        )
+        assert list(reddit.info(fullnames=["t3_1"], raw=True)) == [
+            {"id": "1", "name": "t3_1", "score": 1, "title": "a"}
+        ]
+        assert list(reddit.info(fields=["score"], fullnames=["t3_1"], raw=True)) == [
+            {"name": "t3_1", "score": 1}
+        ]
+        assert list(
+            reddit.info(fields=["score"], fullnames=["t3_1"], max_workers=2, raw=True)
+        ) == [{"name": "t3_1", "score": 1}]
+        assert reddit.get("api/info", raw=True) == reddit._core.request.return_value
+
     def test_info__invalid_param(self, reddit):
         with pytest.raises(TypeError) as excinfo:
             reddit.info(fullnames=None)
@@ -114,6 +229,44 @@ class TestReddit(UnitTest):
 
         assert str(excinfo.value) == err_str
 
+    def test_info__max_workers(self, reddit):
+        fullnames = [f"t3_{i}" for i in range(450)]
+
+        def get(path, params):
+            return params["id"].split(",")
+
+        with mock.patch.object(reddit, "get", side_effect=get) as mock_get:
+            assert list(reddit.info(fullnames=fullnames, max_workers=3)) == fullnames
+        assert mock_get.call_count == 5
+
+    def test_info__max_workers__deadline(self, reddit):
+        reddit._core.request = mock.Mock(
+            return_value={"data": {"after": None, "children": []}, "kind": "Listing"}
+        )
+        deadline = Deadline()
+        deadline.cancel()
+        with deadline, pytest.raises(DeadlineExceededException):
+            list(reddit.info(fullnames=["t3_a"], max_workers=2))
+        assert reddit._core.request.call_count == 0
+
+    def test_info__max_workers__priority(self, reddit):
+        lanes = []
+
+        def get(path, params):
+            lanes.append(reddit.scheduler.current_lane(method="GET"))
+            return []
+
+        with mock.patch.object(reddit, "get", side_effect=get):
+            with reddit.scheduler.priority("low"):
+                list(reddit.info(fullnames=["t3_a"] * 150, max_workers=2))
+            list(reddit.info(fullnames=["t3_a"], max_workers=2))
+        assert lanes == ["low", "low", "normal"]
+
+    def test_info__max_workers__invalid(self, reddit):
+        with pytest.raises(ValueError) as excinfo:
+            reddit.info(fullnames=["t3_a"], max_workers=0)
+        assert str(excinfo.value) == "'max_workers' must be a positive integer."
+
     def test_info__not_list(self, reddit):
         with pytest.raises(TypeError) as excinfo:
             reddit.info(fullnames="Let's try a string")
@@ -136,6 +289,57 @@ class TestReddit(UnitTest):
             "expected type is int, but the given value is test."
         )
 
+    def test_intern_models(self):
+        reddit = Reddit(
+            client_id="dummy",
+            client_secret="dummy",
+            intern_models=True,
+            user_agent="dummy",
+        )
+        subreddit = reddit.subreddit("test")
+        assert reddit.subreddit("TEST") is subreddit
+        assert reddit.redditor("spez") is reddit.redditor("Spez")
+        assert reddit.redditor(fullname="t2_1") is not reddit.redditor(fullname="t2_1")
+        comment, submission = reddit._objector.objectify(
+            [
+                {
+                    "data": {"author": "spez", "id": "1", "subreddit": "test"},
+                    "kind": "t1",
+                },
+                {
+                    "data": {"author": "spez", "id": "2", "subreddit": "test"},
+                    "kind": "t3",
+                },
+            ]
+        )
+        assert comment.subreddit is submission.subreddit is subreddit
+        assert comment.author is submission.author is reddit.redditor("spez")
+
+    def test_intern_models__disabled(self, reddit):
+        assert reddit.subreddit("test") is not reddit.subreddit("test")
+        assert reddit.redditor("spez") is not reddit.redditor("spez")
+
+    def test_json_backend(self):
+        reddit = Reddit(
+            client_id="dummy",
+            client_secret="dummy",
+            json_backend="json",
+            user_agent="dummy",
+        )
+        assert reddit._json_backend.name == "json"
+        response = requests.Response()
+        response._content = b'{"json": {"data": {"rules": "[]"}}}'
+        with mock.patch.object(
+            reddit._core._requestor._http, "request", return_value=response
+        ), mock.patch.object(
+            reddit._json_backend, "loads", wraps=reddit._json_backend.loads
+        ) as loads:
+            response = reddit._core._requestor.request(
+                "GET", "https://oauth.reddit.com"
+            )
+            assert reddit._objector.objectify(response.json()) == []
+        assert loads.call_count == 2
+
     def test_live_info__invalid_param(self, reddit):
         with pytest.raises(TypeError) as excinfo:
             reddit.live.info(None)
@@ -493,6 +697,124 @@ class TestReddit(UnitTest):
             reddit.request(method="POST", path="/")
         assert str(excinfo.value) == "received 400 HTTP response"
 
+    def test_request__cache(self):
+        reddit = Reddit(cache_ttl_subreddit_about=60, **self.REQUIRED_DUMMY_SETTINGS)
+        reddit._core.request = MagicMock(
+            return_value={"kind": "t5", "data": {"display_name": "test"}}
+        )
+        for _ in range(2):
+            assert reddit.get("r/test/about/").display_name == "test"
+        reddit.get("r/test/about/rules")
+        reddit.get("r/test/about/rules")
+        with reddit.cache.bypass():
+            reddit.get("r/test/about/")
+        assert reddit._core.request.call_count == 4
+
+    def test_request__cache__read_only(self):
+        reddit = Reddit(
+            cache_ttl_subreddit_about=60,
+            password="dummy",
+            username="dummy",
+            **self.REQUIRED_DUMMY_SETTINGS,
+        )
+        response = {"kind": "t5", "data": {"display_name": "test"}}
+        reddit._authorized_core.request = MagicMock(return_value=response)
+        reddit._read_only_core.request = MagicMock(return_value=response)
+        reddit.get("r/test/about/")
+        reddit.read_only = True
+        reddit.get("r/test/about/")
+        reddit.get("r/test/about/")
+        assert reddit._authorized_core.request.call_count == 1
+        assert reddit._read_only_core.request.call_count == 1
+
+    def test_request__conditional(self):
+        reddit = Reddit(conditional_requests=True, **self.REQUIRED_DUMMY_SETTINGS)
+        assert reddit._conditional_cache.enabled
+        request = reddit._core._requestor.request
+        assert request.func == reddit._json_backend.request
+        assert request.args[0].func == reddit._conditional_cache.request
+
+    def test_request__deadline(self, reddit):
+        reddit._core.request = mock.Mock(return_value={})
+        with mock.patch("time.monotonic", return_value=100):
+            deadline = Deadline(5)
+            with deadline:
+                reddit.request(method="GET", path="path")
+        assert reddit._core.request.call_args.kwargs["timeout"] == 5
+        deadline.cancel()
+        with mock.patch.object(reddit.scheduler, "acquire") as mock_acquire:
+            with deadline, pytest.raises(DeadlineExceededException):
+                reddit.request(method="GET", path="other_path")
+        mock_acquire.assert_not_called()
+        assert reddit._core.request.call_count == 1
+
+    def test_request__deadline__not_shared(self, reddit):
+        release = Event()
+
+        def request(**kwargs):
+            if "timeout" in kwargs:
+                release.wait(timeout=5)
+                raise TimeoutError
+            return {}
+
+        reddit._core.request = mock.Mock(side_effect=request)
+
+        def leader():
+            with Deadline(5), pytest.raises(TimeoutError):
+                reddit.request(method="GET", path="path")
+
+        thread = Thread(target=leader)
+        thread.start()
+        while not reddit._core.request.called:
+            pass
+        assert reddit.request(method="GET", path="path") == {}
+        release.set()
+        thread.join()
+        assert reddit._core.request.call_count == 2
+
+    def test_request__hooks(self):
+        def response(status, content):
+            response = requests.Response()
+            response._content = content.encode("utf-8")
+            response.headers.update(
+                {
+                    "x-ratelimit-remaining": "99",
+                    "x-ratelimit-reset": "60",
+                    "x-ratelimit-used": "1",
+                }
+            )
+            response.status_code = status
+            return response
+
+        reddit = Reddit(**self.REQUIRED_DUMMY_SETTINGS)
+        calls = []
+        reddit.request_hooks["pre"].append(lambda info: calls.append(info.status))
+        reddit.request_hooks["post"].append(calls.append)
+        with mock.patch.object(
+            reddit._core._requestor._http,
+            "request",
+            side_effect=[
+                response(
+                    200, '{"access_token": "a", "expires_in": 3600, "scope": "*"}'
+                ),
+                response(503, ""),
+                response(200, '{"name": "username"}'),
+            ],
+        ):
+            assert reddit.request(method="GET", path="path") == {"name": "username"}
+        assert calls[0] is None
+        info = calls[1]
+        assert (info.method, info.path, info.status) == ("GET", "path", 200)
+        assert info.bytes == 20
+        assert info.elapsed >= 0
+        assert info.exception is None
+        assert info.ratelimit == {"remaining": "99", "reset": "60", "used": "1"}
+        assert info.retries == 1
+        metrics = reddit.metrics.snapshot()
+        assert metrics["endpoints"]["other"]["size"]["count"] == 1
+        assert (metrics["bytes"], metrics["requests"], metrics["retries"]) == (20, 1, 1)
+        assert metrics["statuses"] == {200: 1}
+
     def test_request__json_and_body(self):
         reddit = Reddit(client_id="dummy", client_secret="dummy", user_agent="dummy")
         with pytest.raises(ClientException) as excinfo:
@@ -503,12 +825,34 @@ class TestReddit(UnitTest):
             "At most one of 'data' or 'json' is supported."
         )
 
+    def test_request__retry_policy(self, reddit):
+        reddit.retry_policy = RetryPolicy(retries={ServerError: 1})
+        reddit._core.request = mock.Mock(
+            side_effect=[ServerError(mock.Mock(status_code=500)), {"name": "username"}]
+        )
+        assert reddit.request(method="GET", path="path") == {"name": "username"}
+        assert reddit._core.request.call_count == 2
+
     def test_submission(self, reddit):
         assert reddit.submission("2gmzqe").id == "2gmzqe"
 
     def test_subreddit(self, reddit):
         assert reddit.subreddit("redditdev").display_name == "redditdev"
 
+    def test_request__priority_lane(self, reddit):
+        lanes = []
+        reddit._core.request = lambda **_: lanes.append(
+            reddit.scheduler.current_lane(method="GET")
+        )
+        for _ in reddit.subreddit("test").new():
+            pass
+        with reddit.scheduler.priority("high"):
+            for _ in reddit.subreddit("test").new():
+                pass
+        for _ in reddit.subreddit("test").mod.modqueue():
+            pass
+        assert lanes == ["low", "high", "normal"]
+
 
 class TestRedditCustomRequestor(UnitTest):
     def test_requestor_class(self, reddit):
@@ -545,3 +889,4 @@ class TestRedditCustomRequestor(UnitTest):
         )
 
         assert reddit._core._requestor._http is session
+        assert reddit.connection_pool is None
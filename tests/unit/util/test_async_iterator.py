@@ -0,0 +1,100 @@
+"""Test praw.util.async_iterator."""
+import asyncio
+import pickle
+import threading
+
+import pytest
+
+from praw.util.async_iterator import AsyncExecutor, AsyncIterator
+
+from .. import UnitTest
+
+
+async def collect(iterator):
+    return [item async for item in iterator]
+
+
+class TestAsyncExecutor(UnitTest):
+    def test_init__invalid_max_workers(self):
+        with pytest.raises(ValueError) as excinfo:
+            AsyncExecutor(max_workers=0)
+        assert str(excinfo.value) == "'max_workers' must be a positive integer."
+
+    def test_iterate(self):
+        executor = AsyncExecutor(max_workers=1)
+        iterator = executor.iterate(range(3))
+        assert isinstance(iterator, AsyncIterator)
+        assert asyncio.run(collect(iterator)) == [
+            0,
+            1,
+            2,
+        ]
+        executor.shutdown()
+
+    def test_iterate__bounded_concurrency(self):
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def slow(count):
+            for item in range(count):
+                with lock:
+                    active.append(item)
+                    peak.append(len(active))
+                threading.Event().wait(0.01)
+                with lock:
+                    active.remove(item)
+                yield item
+
+        async def main():
+            return await asyncio.gather(
+                *(collect(executor.iterate(slow(3))) for _ in range(5))
+            )
+
+        executor = AsyncExecutor(max_workers=2)
+        assert asyncio.run(main()) == [[0, 1, 2]] * 5
+        assert max(peak) <= 2
+        executor.shutdown()
+
+    def test_pickle(self):
+        executor = AsyncExecutor(max_workers=3)
+        executor.executor  # noqa: B018
+        unpickled = pickle.loads(pickle.dumps(executor))
+        assert unpickled.max_workers == 3
+        assert unpickled._executor is None
+        executor.shutdown()
+
+    def test_shutdown(self):
+        executor = AsyncExecutor(max_workers=1)
+        executor.shutdown()
+        pool = executor.executor
+        executor.shutdown()
+        assert executor._executor is None
+        assert executor.executor is not pool
+        executor.shutdown()
+
+
+class TestAsyncIterator(UnitTest):
+    def test_anext__exception(self):
+        def fail():
+            yield 1
+            raise RuntimeError
+
+        async def main():
+            iterator = AsyncIterator(fail(), executor=executor)
+            assert await iterator.__anext__() == 1
+            with pytest.raises(RuntimeError):
+                await iterator.__anext__()
+
+        executor = AsyncExecutor(max_workers=1)
+        asyncio.run(main())
+        executor.shutdown()
+
+    def test_anext__runs_in_executor(self):
+        def thread_names():
+            yield threading.current_thread().name
+
+        executor = AsyncExecutor(max_workers=1)
+        names = asyncio.run(collect(AsyncIterator(thread_names(), executor=executor)))
+        assert names[0].startswith("praw-async")
+        executor.shutdown()
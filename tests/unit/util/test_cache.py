@@ -1,6 +1,18 @@
 """Test praw.util.cache."""
+import pickle
+from threading import Event, Thread
+from unittest import mock
 
-from praw.util.cache import cachedproperty
+import pytest
+import requests
+
+from praw.util.cache import (
+    ConditionalRequestCache,
+    ResponseCache,
+    SingleFlight,
+    cachedproperty,
+    request_key,
+)
 
 from .. import UnitTest
 
@@ -41,3 +53,218 @@ class TestCachedProperty(UnitTest):
 
         property_repr = repr(self.Klass.ten)
         assert property_repr.startswith("<cachedproperty <function")
+
+
+class TestConditionalRequestCache(UnitTest):
+    URL = "https://oauth.reddit.com/r/test/wiki/config/automoderator"
+
+    @staticmethod
+    def request_function(status_code, content=b"", headers=None):
+        def request(method, url, **kwargs):
+            request.calls.append(kwargs.get("headers"))
+            response = requests.Response()
+            response.status_code = status_code
+            response._content = content
+            response.headers.update(headers or {})
+            return response
+
+        request.calls = []
+        return request
+
+    def test_request(self):
+        cache = ConditionalRequestCache(enabled=True, max_bytes=1024)
+        request = self.request_function(
+            200, b'{"kind": "wikipage"}', {"ETag": '"abc"', "Content-Length": "20"}
+        )
+        response = cache.request(request, "GET", self.URL, params={"raw_json": 1})
+        assert response.json() == {"kind": "wikipage"}
+        assert request.calls == [None]
+        assert len(cache) == 1
+
+        request = self.request_function(304, headers={"Content-Length": "0"})
+        response = cache.request(
+            request,
+            "GET",
+            self.URL,
+            headers={"Authorization": "bearer"},
+            params={"raw_json": 1},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-length"] == "20"
+        assert response.json() == {"kind": "wikipage"}
+        assert request.calls == [{"Authorization": "bearer", "If-None-Match": '"abc"'}]
+
+    def test_request__disabled(self):
+        cache = ConditionalRequestCache(max_bytes=1024)
+        request = self.request_function(200, b"{}", {"ETag": '"abc"'})
+        cache.request(request, "GET", self.URL)
+        assert len(cache) == 0
+
+    def test_request__last_modified(self):
+        cache = ConditionalRequestCache(enabled=True, max_bytes=1024)
+        last_modified = "Wed, 21 Oct 2015 07:28:00 GMT"
+        request = self.request_function(200, b"{}", {"Last-Modified": last_modified})
+        cache.request(request, "GET", self.URL)
+        cache.request(request, "GET", self.URL)
+        assert request.calls == [None, {"If-Modified-Since": last_modified}]
+
+    def test_request__other_endpoint(self):
+        cache = ConditionalRequestCache(enabled=True, max_bytes=1024)
+        request = self.request_function(200, b"{}", {"ETag": '"abc"'})
+        cache.request(request, "GET", "https://oauth.reddit.com/r/test/about/")
+        cache.request(request, "POST", self.URL)
+        assert len(cache) == 0
+
+    def test_request__too_large(self):
+        cache = ConditionalRequestCache(enabled=True, max_bytes=4)
+        request = self.request_function(200, b"[1, 2, 3]", {"ETag": '"abc"'})
+        cache.request(request, "GET", self.URL)
+        assert len(cache) == 0
+        assert cache.size == 0
+
+
+class TestRequestKey(UnitTest):
+    def test_request_key(self):
+        assert request_key("/api/info/", {"id": "t3_a", "limit": 1}) == request_key(
+            "api/info", {"limit": "1", "id": "t3_a"}
+        )
+        assert request_key("r/test/about/", None) == ("r/test/about", None)
+
+
+class TestResponseCache(UnitTest):
+    def test_bypass(self):
+        cache = ResponseCache(default_ttl=60, max_bytes=1024)
+        cache.store(path="r/test/about/", value={"name": "t5_2qh0u"})
+        with cache.bypass():
+            assert cache.get(path="r/test/about/") is ResponseCache.MISS
+            cache.store(path="r/test2/about/", value={})
+        assert cache.get(path="r/test/about/") == {"name": "t5_2qh0u"}
+        assert len(cache) == 1
+
+    def test_enabled(self):
+        assert not ResponseCache().enabled
+        assert not ResponseCache(default_ttl=60).enabled
+        assert ResponseCache(default_ttl=60, max_bytes=1024).enabled
+        assert ResponseCache(max_bytes=1024, ttls={"rules": 60}).enabled
+
+    def test_get__copy(self):
+        cache = ResponseCache(default_ttl=60, max_bytes=1024)
+        cache.store(path="r/test/about/", value={"data": {"id": "2qh0u"}})
+        cache.get(path="r/test/about/")["data"].clear()
+        assert cache.get(path="r/test/about/") == {"data": {"id": "2qh0u"}}
+
+    def test_get__expired(self):
+        cache = ResponseCache(default_ttl=60, max_bytes=1024)
+        with mock.patch("time.monotonic", return_value=0):
+            cache.store(path="r/test/about/", value={})
+        with mock.patch("time.monotonic", return_value=59):
+            assert cache.get(path="r/test/about/") == {}
+        with mock.patch("time.monotonic", return_value=60):
+            assert cache.get(path="r/test/about/") is ResponseCache.MISS
+        assert len(cache) == 0
+        assert cache.size == 0
+
+    def test_get__params(self):
+        cache = ResponseCache(default_ttl=60, max_bytes=1024)
+        cache.store(path="api/info/", params={"id": "t3_a", "limit": 1}, value=[1])
+        assert cache.get(path="/api/info", params={"limit": "1", "id": "t3_a"}) == [1]
+        assert cache.get(path="api/info/", params={"id": "t3_b"}) is ResponseCache.MISS
+
+    def test_get__read_only(self):
+        cache = ResponseCache(default_ttl=60, max_bytes=1024)
+        cache.store(path="r/test/about/", value={"user_is_moderator": True})
+        assert cache.get(path="r/test/about/", read_only=True) is ResponseCache.MISS
+        cache.store(path="r/test/about/", read_only=True, value={})
+        assert cache.get(path="r/test/about/", read_only=True) == {}
+        assert cache.get(path="r/test/about/") == {"user_is_moderator": True}
+
+    def test_pickle(self):
+        cache = ResponseCache(default_ttl=1, max_bytes=1024, ttls={"rules": 60})
+        cache.store(path="r/test/about/", value={})
+        other = pickle.loads(pickle.dumps(cache))
+        assert other.ttls == {"rules": 60}
+        assert len(other) == 0
+
+    def test_store__endpoint_ttl(self):
+        cache = ResponseCache(max_bytes=1024, ttls={"rules": 60})
+        cache.store(path="r/test/about/rules", value={"rules": []})
+        cache.store(path="r/test/about/", value={})
+        assert cache.get(path="r/test/about/rules") == {"rules": []}
+        assert cache.get(path="r/test/about/") is ResponseCache.MISS
+
+    def test_store__max_bytes(self):
+        cache = ResponseCache(default_ttl=60, max_bytes=20)
+        cache.store(path="r/a/about/", value="a" * 8)
+        cache.store(path="r/b/about/", value="b" * 8)
+        assert cache.get(path="r/a/about/") == "a" * 8
+        cache.store(path="r/c/about/", value="c" * 8)
+        assert cache.get(path="r/b/about/") is ResponseCache.MISS
+        assert cache.get(path="r/a/about/") == "a" * 8
+        assert cache.size == 20
+        cache.store(path="r/d/about/", value="d" * 64)
+        assert cache.get(path="r/d/about/") is ResponseCache.MISS
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.size == 0
+
+
+class TestSingleFlight(UnitTest):
+    @staticmethod
+    def run_concurrently(single_flight, function, count):
+        results = []
+        threads = [
+            Thread(target=lambda: results.append(single_flight.call("key", function)))
+            for _ in range(count)
+        ]
+        for thread in threads:
+            thread.start()
+        return threads, results
+
+    def test_call(self):
+        assert SingleFlight().call("key", lambda: {"a": 1}) == {"a": 1}
+
+    def test_call__check(self):
+        single_flight = SingleFlight()
+        release = Event()
+        threads, results = self.run_concurrently(
+            single_flight, lambda: release.wait(timeout=5), 1
+        )
+        while not single_flight._calls:
+            pass
+        check = mock.Mock(side_effect=[0.01, TimeoutError])
+        with pytest.raises(TimeoutError):
+            single_flight.call("key", lambda: False, check=check)
+        assert check.call_count == 2
+        release.set()
+        threads[0].join()
+        assert results == [True]
+
+    def test_call__exception(self):
+        single_flight = SingleFlight()
+        with pytest.raises(ValueError):
+            single_flight.call("key", mock.Mock(side_effect=ValueError))
+        assert single_flight.call("key", lambda: 1) == 1
+
+    def test_call__shared(self):
+        single_flight = SingleFlight()
+        release = Event()
+        calls = []
+
+        def function():
+            calls.append(None)
+            release.wait()
+            return {"data": [1, 2]}
+
+        threads, results = self.run_concurrently(single_flight, function, 4)
+        while not single_flight._calls or single_flight._calls["key"].followers < 3:
+            pass
+        release.set()
+        for thread in threads:
+            thread.join()
+        assert len(calls) == 1
+        assert results == [{"data": [1, 2]}] * 4
+        assert len({id(result["data"]) for result in results}) == 4
+
+    def test_pickle(self):
+        other = pickle.loads(pickle.dumps(SingleFlight()))
+        assert other.call("key", lambda: 1) == 1
@@ -0,0 +1,66 @@
+"""Test praw.util.connection_pool."""
+import pickle
+from unittest import mock
+
+from praw.util.connection_pool import ConnectionPool
+
+from .. import UnitTest
+
+
+class TestConnectionPool(UnitTest):
+    def test_close(self):
+        pool = ConnectionPool()
+        with mock.patch.object(pool._adapter.poolmanager, "clear") as clear:
+            pool.session().close()
+            assert not clear.called
+            pool.close()
+        clear.assert_called_once_with()
+
+    def test_init(self):
+        pool = ConnectionPool(block=True, max_per_host=4, pool_size=2)
+        assert pool._adapter._pool_block
+        assert pool._adapter._pool_connections == 2
+        assert pool._adapter._pool_maxsize == 4
+
+    def test_pickle(self):
+        pool = ConnectionPool(keep_alive=False, max_per_host=4)
+        pool.session()
+        for level in range(pickle.HIGHEST_PROTOCOL + 1):
+            other = pickle.loads(pickle.dumps(pool, protocol=level))
+            assert not other.keep_alive
+            assert other.max_per_host == 4
+            assert other._adapter._pool_maxsize == 4
+            assert other.sessions == 1
+
+    def test_session(self):
+        pool = ConnectionPool()
+        first, second = pool.session(), pool.session()
+        assert first is not second
+        assert first.adapters["https://"] is pool._adapter
+        assert second.adapters["http://"] is pool._adapter
+        assert first.headers["Connection"] == "keep-alive"
+        assert pool.stats() == {"hosts": {}, "sessions": 2}
+
+    def test_session__keep_alive_disabled(self):
+        session = ConnectionPool(keep_alive=False).session()
+        assert session.headers["Connection"] == "close"
+
+    def test_stats(self):
+        pool = ConnectionPool(max_per_host=3)
+        connection_pool = pool._adapter.poolmanager.connection_from_url(
+            "https://oauth.reddit.com"
+        )
+        connection = connection_pool._get_conn()
+        connection_pool.num_connections = 1
+        connection_pool.num_requests = 5
+        assert pool.stats()["hosts"] == {
+            "https://oauth.reddit.com:443": {
+                "connections": 1,
+                "idle": 0,
+                "in_use": 1,
+                "requests": 5,
+            }
+        }
+        connection_pool._put_conn(connection)
+        assert pool.stats()["hosts"]["https://oauth.reddit.com:443"]["idle"] == 1
+        assert pool.stats()["hosts"]["https://oauth.reddit.com:443"]["in_use"] == 0
@@ -0,0 +1,54 @@
+"""Test praw.util.deadline."""
+from unittest import mock
+
+import pytest
+
+from praw.exceptions import DeadlineExceededException
+from praw.util.deadline import Deadline
+
+from .. import UnitTest
+
+
+class TestDeadline(UnitTest):
+    def test_active(self):
+        outer, inner = Deadline(), Deadline()
+        assert Deadline.active() == ()
+        with outer:
+            with inner:
+                assert Deadline.active() == (outer, inner)
+            assert Deadline.active() == (outer,)
+        assert Deadline.active() == ()
+
+    def test_cancel(self):
+        deadline = Deadline()
+        assert deadline.check() is None
+        deadline.cancel()
+        with pytest.raises(DeadlineExceededException) as excinfo:
+            deadline.check()
+        assert excinfo.value.cancelled
+
+    def test_check__passed(self):
+        with mock.patch("time.monotonic", return_value=100):
+            deadline = Deadline(5)
+        with mock.patch("time.monotonic", return_value=104):
+            assert deadline.check() == 1
+        with mock.patch("time.monotonic", return_value=105), pytest.raises(
+            DeadlineExceededException
+        ) as excinfo:
+            deadline.check()
+        assert not excinfo.value.cancelled
+
+    def test_check_active(self):
+        assert Deadline.check_active() is None
+        with mock.patch("time.monotonic", return_value=100):
+            outer = Deadline(30)
+            inner = Deadline(10)
+            with outer:
+                assert Deadline.check_active() == 30
+                with inner, Deadline():
+                    assert Deadline.check_active() == 10
+                assert Deadline.check_active() == 30
+                outer.cancel()
+                with pytest.raises(DeadlineExceededException):
+                    Deadline.check_active()
+        assert Deadline.check_active() is None
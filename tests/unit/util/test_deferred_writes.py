@@ -0,0 +1,158 @@
+"""Test praw.util.deferred_writes."""
+import pickle
+import time
+from threading import Event, Thread
+from unittest import mock
+
+import pytest
+
+from praw.exceptions import RedditAPIException
+from praw.util.deferred_writes import DeferredWriteQueue
+
+from .. import UnitTest
+
+RATELIMIT = {
+    "json": {
+        "errors": [
+            [
+                "RATELIMIT",
+                "You are doing that too much. Try again in 5 milliseconds.",
+                "ratelimit",
+            ]
+        ]
+    }
+}
+
+
+class TestDeferredWriteQueue(UnitTest):
+    @staticmethod
+    def rate_limited(*results):
+        results = iter(results)
+
+        def function():
+            result = next(results)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        return function
+
+    @staticmethod
+    def ratelimit_exception():
+        return RedditAPIException(RATELIMIT["json"]["errors"])
+
+    def test_pickle(self, reddit):
+        queue = DeferredWriteQueue(reddit, max_attempts=5)
+        unpickled = pickle.loads(pickle.dumps(queue))
+        assert unpickled.max_attempts == 5
+        assert len(unpickled) == 0
+
+    def test_post__does_not_sleep(self, reddit):
+        with mock.patch.object(
+            reddit, "request", return_value=RATELIMIT
+        ) as mock_request, mock.patch.object(
+            reddit, "_handle_rate_limit", return_value=0
+        ):
+            future = DeferredWriteQueue(reddit, max_attempts=2).submit(
+                reddit.post, "test"
+            )
+            with pytest.raises(RedditAPIException):
+                future.result(timeout=5)
+        assert mock_request.call_count == 2
+
+    def test_submit(self, reddit):
+        future = DeferredWriteQueue(reddit).submit(lambda value: value * 2, 21)
+        assert future.done()
+        assert future.result() == 42
+
+    def test_submit__cancel_during_retry(self, reddit):
+        queue = DeferredWriteQueue(reddit)
+        futures = []
+        submitted = Event()
+
+        def function():
+            if not futures:
+                futures.append(None)
+                raise self.ratelimit_exception()
+            submitted.wait(timeout=5)
+            assert not futures[-1].cancel()
+            return "result"
+
+        with mock.patch.object(reddit, "_handle_rate_limit", return_value=0):
+            futures.append(queue.submit(function))
+            submitted.set()
+            assert futures[-1].result(timeout=5) == "result"
+            assert not futures[-1].cancelled()
+            function = self.rate_limited(self.ratelimit_exception(), "next")
+            assert queue.submit(function).result(timeout=5) == "next"
+        assert queue._thread.is_alive()
+
+    def test_submit__closed(self, reddit):
+        queue = DeferredWriteQueue(reddit)
+        queue.shutdown()
+        with pytest.raises(RuntimeError) as excinfo:
+            queue.submit(print)
+        assert str(excinfo.value) == (
+            "Cannot submit writes after the queue was shut down."
+        )
+
+    def test_submit__exception(self, reddit):
+        future = DeferredWriteQueue(reddit).submit(self.rate_limited(ValueError()))
+        assert isinstance(future.exception(), ValueError)
+
+    def test_submit__max_attempts(self, reddit):
+        queue = DeferredWriteQueue(reddit, max_attempts=2)
+        function = self.rate_limited(
+            self.ratelimit_exception(), self.ratelimit_exception(), "unreachable"
+        )
+        with mock.patch.object(reddit, "_handle_rate_limit", return_value=0):
+            future = queue.submit(function)
+            assert isinstance(future.exception(timeout=5), RedditAPIException)
+
+    def test_submit__rate_limited(self, reddit):
+        queue = DeferredWriteQueue(reddit)
+        function = self.rate_limited(self.ratelimit_exception(), "result")
+        with mock.patch.object(reddit, "_handle_rate_limit", return_value=0):
+            future = queue.submit(function)
+            assert future.result(timeout=5) == "result"
+        queue.shutdown()
+        assert not queue._thread.is_alive()
+
+    def test_submit__restarts_thread(self, reddit):
+        queue = DeferredWriteQueue(reddit)
+        queue._thread = Thread(target=lambda: None)
+        queue._thread.start()
+        queue._thread.join()
+        function = self.rate_limited(self.ratelimit_exception(), "result")
+        with mock.patch.object(reddit, "_handle_rate_limit", return_value=0):
+            assert queue.submit(function).result(timeout=5) == "result"
+        assert queue._thread.is_alive()
+
+    def test_shutdown__no_wait(self, reddit):
+        queue = DeferredWriteQueue(reddit)
+        function = self.rate_limited(self.ratelimit_exception(), "result")
+        with mock.patch.object(reddit, "_handle_rate_limit", return_value=3600):
+            future = queue.submit(function)
+        assert not future.done()
+        assert len(queue) == 1
+        queue.shutdown(wait=False)
+        assert future.cancelled()
+        assert len(queue) == 0
+        queue._thread.join(timeout=5)
+        assert not queue._thread.is_alive()
+
+    def test_shutdown__no_wait__retried(self, reddit):
+        queue = DeferredWriteQueue(reddit)
+        function = self.rate_limited(
+            self.ratelimit_exception(), self.ratelimit_exception(), "result"
+        )
+        with mock.patch.object(
+            reddit, "_handle_rate_limit", side_effect=[0, 3600]
+        ) as mock_handle:
+            future = queue.submit(function)
+            while mock_handle.call_count < 2 or len(queue) < 1:
+                time.sleep(0.01)
+        assert future.running()
+        queue.shutdown(wait=False)
+        assert isinstance(future.exception(timeout=5), RuntimeError)
+        assert len(queue) == 0
@@ -0,0 +1,38 @@
+"""Test praw.util.interning."""
+import gc
+import pickle
+
+from praw.models import Redditor, Subreddit
+from praw.util.interning import Interner
+
+from .. import UnitTest
+
+
+class TestInterner(UnitTest):
+    def test_get(self, reddit):
+        interner = Interner(enabled=True)
+        subreddit = interner.get(Subreddit, "Test", lambda: Subreddit(reddit, "Test"))
+        assert interner.get(Subreddit, "test", lambda: None) is subreddit
+        redditor = interner.get(Redditor, "test", lambda: Redditor(reddit, "test"))
+        assert redditor is not subreddit
+        assert len(interner) == 2
+        del subreddit, redditor
+        gc.collect()
+        assert len(interner) == 0
+
+    def test_get__disabled(self, reddit):
+        interner = Interner()
+        first = interner.get(Subreddit, "test", lambda: Subreddit(reddit, "test"))
+        second = interner.get(Subreddit, "test", lambda: Subreddit(reddit, "test"))
+        assert first == second
+        assert first is not second
+        assert len(interner) == 0
+
+    def test_pickle(self, reddit):
+        interner = Interner(enabled=True)
+        subreddit = interner.get(Subreddit, "test", lambda: Subreddit(reddit, "test"))
+        for level in range(pickle.HIGHEST_PROTOCOL + 1):
+            other = pickle.loads(pickle.dumps(interner, protocol=level))
+            assert other.enabled
+            assert len(other) == 0
+        assert interner.get(Subreddit, "test", lambda: None) is subreddit
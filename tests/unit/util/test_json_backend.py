@@ -0,0 +1,88 @@
+"""Test praw.util.json_backend."""
+import json
+import pickle
+from unittest import mock
+
+import pytest
+import requests
+
+from praw.util.json_backend import JSONBackend
+
+from .. import UnitTest
+
+
+class TestJSONBackend(UnitTest):
+    @staticmethod
+    def response(content):
+        response = requests.Response()
+        response._content = content
+        response.encoding = "UTF-8"
+        return response
+
+    @mock.patch("praw.util.json_backend.import_module")
+    def test_init__auto(self, import_module):
+        import_module.side_effect = lambda name: mock.Mock(loads=name)
+        backend = JSONBackend()
+        assert backend.name == "orjson"
+        assert backend._loads == "orjson"
+
+    @mock.patch("praw.util.json_backend.import_module", side_effect=ImportError)
+    def test_init__auto__fallback(self, _):
+        backend = JSONBackend()
+        assert backend.name == "json"
+        assert backend._loads is json.loads
+
+    def test_init__invalid(self):
+        with pytest.raises(ValueError):
+            JSONBackend("simplejson")
+
+    @mock.patch("praw.util.json_backend.import_module", side_effect=ImportError)
+    def test_init__not_installed(self, _):
+        with pytest.raises(ImportError):
+            JSONBackend("ujson")
+
+    def test_loads__fallback(self):
+        backend = JSONBackend()
+        backend._loads = mock.Mock(side_effect=ValueError("no matched low surrogate"))
+        assert backend.loads(b'{"a": "\\ud83d"}') == {"a": "\ud83d"}
+        with pytest.raises(ValueError):
+            backend.loads(b"<html>")
+
+    def test_loads__lone_surrogate(self):
+        pytest.importorskip("orjson")
+        backend = JSONBackend("orjson")
+        assert backend.loads(b'{"a": "\\ud83d"}') == {"a": "\ud83d"}
+        response = backend.request(
+            mock.Mock(return_value=self.response(b'["\\ud83d"]')), "GET", "url"
+        )
+        assert response.json() == ["\ud83d"]
+
+    def test_pickle(self):
+        backend = JSONBackend("json")
+        for level in range(pickle.HIGHEST_PROTOCOL + 1):
+            other = pickle.loads(pickle.dumps(backend, protocol=level))
+            assert other.name == "json"
+            assert other._loads is json.loads
+
+    def test_request(self):
+        backend = JSONBackend()
+        request_function = mock.Mock(return_value=self.response(b'{"name": "\\u00e9"}'))
+        response = backend.request(request_function, "GET", "url", params={"a": 1})
+        request_function.assert_called_once_with("GET", "url", params={"a": 1})
+        with mock.patch.object(backend, "loads", wraps=backend.loads) as loads:
+            assert response.json() == {"name": "é"}
+        loads.assert_called_once_with(b'{"name": "\\u00e9"}')
+
+    def test_request__invalid_json(self):
+        backend = JSONBackend()
+        response = backend.request(
+            mock.Mock(return_value=self.response(b"<html>")), "GET", "url"
+        )
+        with pytest.raises(ValueError):
+            response.json()
+
+    def test_request__with_arguments(self):
+        response = JSONBackend().request(
+            mock.Mock(return_value=self.response(b"1.5")), "GET", "url"
+        )
+        assert response.json(parse_float=str) == "1.5"
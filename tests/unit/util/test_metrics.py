@@ -0,0 +1,166 @@
+"""Test praw.util.metrics."""
+import pickle
+from unittest import mock
+
+import pytest
+import requests
+
+from praw.util.metrics import Histogram, RequestInfo, RequestMetrics, request_name
+
+from .. import UnitTest
+
+
+class TestHistogram(UnitTest):
+    def test_add(self):
+        histogram = Histogram((1, 10))
+        for value in (0.5, 1, 5, 20):
+            histogram.add(value)
+        assert histogram.counts == [2, 1, 1]
+        assert (histogram.count, histogram.max, histogram.sum) == (4, 20, 26.5)
+
+    def test_quantile(self):
+        histogram = Histogram((0.1, 1, 10))
+        for _ in range(98):
+            histogram.add(0.05)
+        histogram.add(0.5)
+        histogram.add(3)
+        assert histogram.quantile(0.5) == 0.1
+        assert histogram.quantile(0.99) == 1
+        assert histogram.quantile(1) == 3
+
+    def test_quantile__empty(self):
+        assert Histogram((1,)).quantile(0.5) is None
+
+    def test_quantile__unbounded_bucket(self):
+        histogram = Histogram((1,))
+        histogram.add(50)
+        assert histogram.quantile(0.5) == 50
+
+    def test_snapshot(self):
+        histogram = Histogram((1,))
+        histogram.add(2)
+        snapshot = histogram.snapshot()
+        histogram.add(0)
+        assert snapshot == {
+            "buckets": {1: 0, float("inf"): 1},
+            "count": 1,
+            "max": 2,
+            "p50": 2,
+            "p99": 2,
+            "sum": 2,
+        }
+
+
+class TestRequestInfo(UnitTest):
+    @staticmethod
+    def response(status=200, content=b"{}"):
+        response = requests.Response()
+        response._content = content
+        response.status_code = status
+        return response
+
+    def test_observe__connection_error(self):
+        info = RequestInfo(method="GET", path="path")
+        function = mock.Mock(side_effect=[ConnectionError, self.response()])
+        with info.track():
+            with pytest.raises(ConnectionError):
+                RequestInfo.observe(function, "GET", "https://oauth.reddit.com/path")
+            assert info.status is None
+            RequestInfo.observe(function, "GET", "https://oauth.reddit.com/path")
+        assert (info.bytes, info.retries, info.status) == (2, 1, 200)
+
+    def test_observe__no_current_request(self):
+        response = self.response()
+        function = mock.Mock(return_value=response)
+        assert RequestInfo.observe(function, "GET", "https://oauth.reddit.com/") is (
+            response
+        )
+        function.assert_called_once_with("GET", "https://oauth.reddit.com/")
+
+    def test_observe__token_request(self):
+        info = RequestInfo(method="GET", path="path")
+        function = mock.Mock(return_value=self.response())
+        with info.track():
+            RequestInfo.observe(
+                function, "post", "https://www.reddit.com/api/v1/access_token"
+            )
+        assert (info.bytes, info.retries, info.status) == (0, 0, None)
+
+    def test_request_name(self):
+        assert request_name("api/morechildren/") == "morechildren"
+        assert request_name("r/test/about/log/") == "about_log"
+        assert request_name("r/test/new") == "listing"
+        assert request_name("user/spez/saved") == "listing"
+        assert request_name("path") == "other"
+
+    def test_track(self):
+        info = RequestInfo(method="GET", path="path")
+        assert RequestInfo.current() is None
+        with info.track():
+            assert RequestInfo.current() is info
+        assert RequestInfo.current() is None
+        assert info.elapsed >= 0
+        assert info.exception is None
+
+    def test_track__exception(self):
+        info = RequestInfo(method="GET", path="path")
+        exception = ValueError()
+        with pytest.raises(ValueError), info.track():
+            raise exception
+        assert info.exception is exception
+        assert RequestInfo.current() is None
+
+
+class TestRequestMetrics(UnitTest):
+    @staticmethod
+    def info(exception=None, status=200):
+        info = RequestInfo(method="GET", path="path")
+        info.bytes = 10
+        info.elapsed = 0.5
+        info.exception = exception
+        info.retries = 1
+        info.status = status
+        return info
+
+    def test_pickle(self):
+        metrics = RequestMetrics()
+        metrics.record(self.info())
+        unpickled = pickle.loads(pickle.dumps(metrics))
+        assert unpickled.snapshot() == metrics.snapshot()
+        unpickled.record(self.info())
+        assert unpickled.requests == 2
+
+    def test_record(self):
+        metrics = RequestMetrics()
+        metrics.record(self.info())
+        metrics.record(self.info(exception=ValueError(), status=None))
+        snapshot = metrics.snapshot()
+        endpoint = snapshot.pop("endpoints")["other"]
+        assert snapshot == {
+            "bytes": 20,
+            "elapsed": 1.0,
+            "errors": 1,
+            "methods": {"GET": 2},
+            "requests": 2,
+            "retries": 2,
+            "statuses": {200: 1, None: 1},
+        }
+        assert endpoint["latency"]["buckets"][0.5] == 2
+        assert endpoint["latency"]["p50"] == 0.5
+        assert endpoint["size"]["buckets"][1024] == 2
+        assert endpoint["size"]["sum"] == 20
+
+    def test_reset(self):
+        metrics = RequestMetrics()
+        metrics.record(self.info())
+        metrics.reset()
+        assert metrics.snapshot() == {
+            "bytes": 0,
+            "elapsed": 0.0,
+            "endpoints": {},
+            "errors": 0,
+            "methods": {},
+            "requests": 0,
+            "retries": 0,
+            "statuses": {},
+        }
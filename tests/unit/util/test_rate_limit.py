@@ -0,0 +1,199 @@
+"""Test praw.util.rate_limit."""
+import pickle
+import sys
+import time
+from threading import Thread
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from praw.exceptions import DeadlineExceededException
+from praw.util.deadline import Deadline
+from praw.util.rate_limit import (
+    BaseRateLimitStore,
+    RateLimitScheduler,
+    SQLiteRateLimitStore,
+)
+
+from .. import UnitTest
+
+
+class TestBaseRateLimitStore(UnitTest):
+    def test_init_base_fail(self):
+        with pytest.raises(TypeError):
+            BaseRateLimitStore()
+
+
+class TestRateLimitScheduler(UnitTest):
+    @staticmethod
+    def rate_limiter(remaining, reset_in=600, used=0):
+        return SimpleNamespace(
+            remaining=remaining, reset_timestamp=time.time() + reset_in, used=used
+        )
+
+    def test_acquire__consumes_budget(self):
+        scheduler = RateLimitScheduler()
+        scheduler.update(self.rate_limiter(10))
+        scheduler.acquire("normal")
+        assert scheduler.remaining == 9
+
+    def test_acquire__deadline(self):
+        scheduler = RateLimitScheduler()
+        scheduler.update(self.rate_limiter(0))
+        start = time.monotonic()
+        with Deadline(0.05), pytest.raises(DeadlineExceededException):
+            scheduler.acquire("high")
+        assert time.monotonic() - start < 5
+        assert scheduler._waiting["high"] == 0
+        assert scheduler.remaining == 0
+
+    def test_acquire__default_reserves(self):
+        scheduler = RateLimitScheduler()
+        scheduler.update(self.rate_limiter(100))
+        acquired = []
+        threads = [
+            Thread(target=lambda: acquired.append(scheduler.acquire("low")))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        scheduler.acquire("high")
+        scheduler.acquire("normal")
+        assert scheduler.remaining == 98
+        assert not acquired
+        scheduler.release(self.rate_limiter(600))
+        for thread in threads:
+            thread.join(1)
+        assert acquired == [None] * 5
+
+    def test_acquire__invalid_lane(self):
+        with pytest.raises(ValueError) as excinfo:
+            RateLimitScheduler().acquire("urgent")
+        assert str(excinfo.value).startswith("Invalid priority lane 'urgent'.")
+
+    def test_acquire__reserve_blocks_lower_lane(self):
+        scheduler = RateLimitScheduler(reserves={"low": 5})
+        scheduler.update(self.rate_limiter(5))
+        scheduler.acquire("high")
+        acquired = []
+        thread = Thread(target=lambda: acquired.append(scheduler.acquire("low")))
+        thread.start()
+        thread.join(0.1)
+        assert not acquired
+        scheduler.release(self.rate_limiter(50))
+        thread.join(1)
+        assert acquired == [None]
+
+    def test_acquire__unknown_budget(self):
+        scheduler = RateLimitScheduler(reserves={"low": 5})
+        scheduler.acquire("low")
+        assert scheduler.remaining is None
+
+    def test_acquire__window_reset(self):
+        scheduler = RateLimitScheduler(reserves={"low": 5})
+        scheduler.update(self.rate_limiter(0, reset_in=-1))
+        scheduler.acquire("low")
+        assert scheduler.remaining is None
+
+    def test_chosen_lane(self):
+        assert RateLimitScheduler.chosen_lane() is None
+        with RateLimitScheduler.priority("low"):
+            assert RateLimitScheduler.chosen_lane() == "low"
+        assert RateLimitScheduler.chosen_lane() is None
+
+    def test_current_lane(self):
+        assert RateLimitScheduler.current_lane(method="GET") == "normal"
+        assert RateLimitScheduler.current_lane(method="POST") == "high"
+        with RateLimitScheduler.priority("low"):
+            assert RateLimitScheduler.current_lane(method="POST") == "low"
+        assert RateLimitScheduler.current_lane(method="POST") == "high"
+
+    def test_default_priority(self):
+        with RateLimitScheduler.default_priority("low"):
+            assert RateLimitScheduler.current_lane(method="GET") == "low"
+        with RateLimitScheduler.priority("high"):
+            with RateLimitScheduler.default_priority("low"):
+                assert RateLimitScheduler.current_lane(method="GET") == "high"
+
+    def test_pickle(self):
+        scheduler = RateLimitScheduler(reserves={"low": 5})
+        scheduler.update(self.rate_limiter(10))
+        for level in range(pickle.HIGHEST_PROTOCOL + 1):
+            other = pickle.loads(pickle.dumps(scheduler, protocol=level))
+            assert other.remaining == 10
+            assert other.reserves["low"] == 5
+            other.acquire("low")
+
+    @mock.patch("time.sleep")
+    def test_slot__store(self, mock_sleep):
+        store = mock.Mock(spec=BaseRateLimitStore)
+        store.acquire.return_value = 1.5
+        scheduler = RateLimitScheduler(store=store)
+        rate_limiter = self.rate_limiter(42, used=3)
+        with scheduler.slot(method="GET", rate_limiter=rate_limiter):
+            pass
+        with scheduler.slot(method="GET", rate_limiter=rate_limiter):
+            pass
+        mock_sleep.assert_has_calls([mock.call(1.5), mock.call(1.5)])
+        store.update.assert_called_once_with(
+            remaining=42, reset_timestamp=rate_limiter.reset_timestamp, used=3
+        )
+
+    @mock.patch("time.sleep")
+    def test_slot__store__deadline(self, mock_sleep):
+        store = mock.Mock(spec=BaseRateLimitStore)
+        store.acquire.return_value = 3600
+        deadline = Deadline(5)
+        mock_sleep.side_effect = lambda _: deadline.cancel()
+        with deadline, pytest.raises(DeadlineExceededException):
+            with RateLimitScheduler(store=store).slot(method="GET"):
+                pass
+        assert mock_sleep.call_args.args[0] <= 5
+
+    def test_slot(self):
+        scheduler = RateLimitScheduler()
+        with scheduler.slot(method="GET", rate_limiter=self.rate_limiter(42, used=3)):
+            pass
+        assert scheduler.remaining == 42
+        assert scheduler.used == 3
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="this test fails on windows")
+class TestSQLiteRateLimitStore(UnitTest):
+    @pytest.fixture
+    def database(self, tmp_path):
+        return str(tmp_path / "ratelimit.db")
+
+    def test_acquire__exhausted(self, database):
+        store = SQLiteRateLimitStore(database=database, key="dummy")
+        store.update(remaining=0, reset_timestamp=time.time() + 60, used=600)
+        assert 59 < store.acquire() <= 60
+
+    def test_acquire__paced(self, database):
+        store = SQLiteRateLimitStore(database=database, key="dummy")
+        store.update(remaining=10, reset_timestamp=time.time() + 100, used=0)
+        assert store.acquire() == 0
+        assert 9 < store.acquire() <= 10
+
+    def test_acquire__shared(self, database):
+        store = SQLiteRateLimitStore(database=database, key="dummy")
+        other = SQLiteRateLimitStore(database=database, key="dummy")
+        unrelated = SQLiteRateLimitStore(database=database, key="other")
+        store.update(remaining=1, reset_timestamp=time.time() + 60, used=599)
+        assert store.acquire() == 0
+        assert other.acquire() > 59
+        assert unrelated.acquire() == 0
+
+    def test_acquire__unknown(self, database):
+        store = SQLiteRateLimitStore(database=database, key="dummy")
+        assert store.acquire() == 0
+        store.update(remaining=0, reset_timestamp=time.time() - 1, used=600)
+        assert store.acquire() == 0
+
+    def test_pickle(self, database):
+        store = SQLiteRateLimitStore(database=database, key="dummy")
+        store.update(remaining=0, reset_timestamp=time.time() + 60, used=600)
+        other = pickle.loads(pickle.dumps(store))
+        assert other.key == "dummy"
+        assert other.acquire() > 59
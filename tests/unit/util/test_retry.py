@@ -0,0 +1,114 @@
+"""Test praw.util.retry."""
+import pickle
+from unittest import mock
+
+import pytest
+from prawcore.exceptions import NotFound, RequestException, ServerError
+
+from praw.exceptions import CircuitBreakerOpenException
+from praw.util.deadline import Deadline
+from praw.util.retry import RetryPolicy
+
+from .. import UnitTest
+
+
+class TestRetryPolicy(UnitTest):
+    @staticmethod
+    def function(*results):
+        return mock.Mock(side_effect=results)
+
+    @staticmethod
+    def server_error():
+        return ServerError(mock.Mock(status_code=503))
+
+    def test_call(self):
+        function = self.function("result")
+        assert RetryPolicy().call(function, method="GET") == "result"
+        function.assert_called_once_with()
+
+    def test_call__backoff(self):
+        policy = RetryPolicy(max_backoff=2, retries={ServerError: 3})
+        function = self.function(*[self.server_error()] * 3, "result")
+        with mock.patch("time.sleep") as mock_sleep:
+            assert policy.call(function, method="GET") == "result"
+        sleeps = [call.args[0] for call in mock_sleep.call_args_list]
+        assert [round(seconds) for seconds in sleeps] == [1, 2, 2]
+
+    def test_call__deadline(self):
+        policy = RetryPolicy(retries={ServerError: 3})
+        function = self.function(*[self.server_error()] * 2, "result")
+        with mock.patch("time.sleep") as mock_sleep:
+            with Deadline(0.5), pytest.raises(ServerError):
+                policy.call(function, method="GET")
+            deadline = Deadline()
+            with deadline, pytest.raises(ServerError):
+                deadline.cancel()
+                policy.call(function, method="GET")
+        assert function.call_count == 2
+        mock_sleep.assert_not_called()
+
+    def test_call__exhausted(self):
+        policy = RetryPolicy(retries={ServerError: 2})
+        function = self.function(*[self.server_error()] * 3)
+        with pytest.raises(ServerError):
+            policy.call(function, method="GET")
+        assert function.call_count == 3
+
+    def test_call__method_cap(self):
+        policy = RetryPolicy(methods={"POST": 0}, retries={ServerError: 2})
+        function = self.function(self.server_error(), "result")
+        with pytest.raises(ServerError):
+            policy.call(function, method="POST")
+        assert function.call_count == 1
+
+    def test_call__most_specific_exception_class(self):
+        policy = RetryPolicy(retries={Exception: 5, NotFound: 0})
+        function = self.function(NotFound(mock.Mock(status_code=404)), "result")
+        with pytest.raises(NotFound):
+            policy.call(function, method="GET")
+
+    def test_call__not_retried(self):
+        policy = RetryPolicy(retries={ServerError: 2})
+        function = self.function(ValueError(), "result")
+        with pytest.raises(ValueError):
+            policy.call(function, method="GET")
+        assert function.call_count == 1
+
+    def test_circuit_breaker(self):
+        policy = RetryPolicy(
+            failure_threshold=2, recovery_timeout=30, retries={RequestException: 0}
+        )
+        exception = RequestException(ValueError(), (), {})
+        with mock.patch("time.monotonic", return_value=100):
+            for _ in range(2):
+                with pytest.raises(RequestException):
+                    policy.call(self.function(exception), method="GET")
+            assert policy.is_open
+            function = self.function("result")
+            with pytest.raises(CircuitBreakerOpenException) as excinfo:
+                policy.call(function, method="GET")
+            assert excinfo.value.retry_after == 30
+            function.assert_not_called()
+        with mock.patch("time.monotonic", return_value=130):
+            with pytest.raises(RequestException):
+                policy.call(self.function(exception), method="GET")
+            assert policy.is_open
+        with mock.patch("time.monotonic", return_value=160):
+            assert policy.call(self.function("result"), method="GET") == "result"
+        assert not policy.is_open
+
+    def test_circuit_breaker__success_resets_failures(self):
+        policy = RetryPolicy(failure_threshold=2, retries={ServerError: 0})
+        for result in (self.server_error(), "result", self.server_error()):
+            try:
+                policy.call(self.function(result), method="GET")
+            except ServerError:
+                pass
+        assert not policy.is_open
+
+    def test_pickle(self):
+        policy = RetryPolicy(failure_threshold=3, retries={ServerError: 2})
+        unpickled = pickle.loads(pickle.dumps(policy))
+        assert unpickled.failure_threshold == 3
+        assert unpickled.retries == {ServerError: 2}
+        assert unpickled.call(self.function("result"), method="GET") == "result"
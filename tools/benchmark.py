@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""Run micro-benchmarks of PRAW's hot code paths.
+
+No network requests are issued: requests are answered by a stub in place of prawcore's
+session so that only PRAW's own per-call overhead is measured.
+
+Each benchmark returns the total seconds, or bytes of memory when an integer, used by
+each operation over ``number`` runs.
+
+"""
+import argparse
+import gc
+import json
+import sys
+import timeit
+import tracemalloc
+from collections import deque
+from contextlib import nullcontext
+from itertools import count, cycle, islice
+from pathlib import Path
+from unittest import mock
+
+import praw
+from praw.models import Comment, ListingGenerator
+from praw.models.reddit.base import RedditBase
+from praw.objector import Objector
+from praw.util import _deprecate_args
+from praw.util.json_backend import BACKENDS, JSONBackend
+
+BENCHMARKS = {}
+CASSETTES = Path(__file__).resolve().parent.parent / "tests/integration/cassettes"
+
+
+def benchmark(function):
+    BENCHMARKS[function.__name__.replace("benchmark_", "")] = function
+    return function
+
+
+def dummy_reddit(**settings):
+    """Return a :class:`.Reddit` instance whose requests are not sent."""
+    return praw.Reddit(
+        client_id="dummy",
+        client_secret="dummy",
+        user_agent="praw benchmark",
+        check_for_updates=False,
+        **settings,
+    )
+
+
+def cassette_bodies():
+    """Return the JSON response bodies recorded in the integration test cassettes."""
+    bodies = []
+    for path in sorted(CASSETTES.glob("*.json")):
+        for interaction in json.loads(path.read_text())["http_interactions"]:
+            body = interaction["response"]["body"].get("string", "").encode()
+            try:
+                json.loads(body)
+            except ValueError:
+                continue
+            bodies.append(body)
+    return bodies
+
+
+@benchmark
+def benchmark_identity(number):
+    """Measure set membership of ``number`` comments, per comment.
+
+    Run with ``-n 1000000`` to measure sets of a million comments.
+
+    """
+    reddit = dummy_reddit()
+
+    def comments():
+        return [Comment(reddit, _data={"id": f"{i:x}"}) for i in range(number)]
+
+    def uncached_identity(self):
+        key = str(self).lower()
+        return None, key, hash(self.__class__.__name__) ^ hash(key)
+
+    def measure(mode):
+        items, others = comments(), comments()
+        start = timeit.default_timer()
+        members = set(items)
+        results[f"{mode} add"] = timeit.default_timer() - start
+        results[f"{mode} contains same instances"] = timeit.timeit(
+            lambda: all(item in members for item in items), number=1
+        )
+        results[f"{mode} contains equal instances"] = timeit.timeit(
+            lambda: all(item in members for item in others), number=1
+        )
+
+    results = {}
+    with mock.patch.object(
+        RedditBase, "_identity", uncached_identity
+    ), mock.patch.object(RedditBase, "__hash__", lambda self: self._identity()[2]):
+        measure("uncached")
+    gc.collect()
+    measure("cached")
+    return results
+
+
+@benchmark
+def benchmark_json(number):
+    """Measure decoding the recorded response bodies with each installed backend."""
+    bodies = list(islice(cycle(cassette_bodies()), number))
+    results = {}
+    for name in BACKENDS:
+        try:
+            loads = JSONBackend(name).loads
+        except ImportError:
+            continue
+        results[f"JSONBackend {name}"] = timeit.timeit(
+            lambda loads=loads: deque(map(loads, bodies), maxlen=0), number=1
+        )
+    return results
+
+
+def cassette_listing(name):
+    """Return the first full page of a listing recorded in a cassette."""
+    path = CASSETTES / f"{name}.json"
+    for interaction in json.loads(path.read_text())["http_interactions"]:
+        body = json.loads(interaction["response"]["body"]["string"])
+        if (
+            isinstance(body, dict)
+            and len(body.get("data", {}).get("children", ())) >= 100
+        ):
+            body["data"]["after"] = None
+            return body
+    raise ValueError(name)
+
+
+@benchmark
+def benchmark_lean(number):
+    """Measure building and keeping 100 item pages of eager and lean models."""
+    pages = {
+        "comments": cassette_listing("TestComment.test_block"),
+        "submissions": cassette_listing("TestSubredditQuarantine.test_opt_in"),
+    }
+    results = {}
+    for lean_models in (False, True):
+        reddit = dummy_reddit(lean_models=lean_models)
+        mode = "lean" if lean_models else "eager"
+        for name, page in pages.items():
+            reddit._core.request = lambda page=page, **_: page
+
+            def fetch():
+                return list(ListingGenerator(reddit, "path", limit=None))
+
+            def read(items):
+                for item in items:
+                    item.author, item.created_utc, item.id, item.subreddit
+
+            results[f"{mode} {name}"] = timeit.timeit(fetch, number=number)
+            results[f"{mode} {name} and read 4 fields"] = timeit.timeit(
+                lambda: read(fetch()), number=number
+            )
+            kept = min(number, 100)
+            tracemalloc.start()
+            items = [fetch() for _ in range(kept)]
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            del items
+            results[f"{mode} {name} memory"] = size * number // kept
+    return results
+
+
+@benchmark
+def benchmark_listing(number):
+    """Measure building the objects of 100 item listing pages, per page."""
+    reddit = dummy_reddit()
+    pages = {
+        "comments": cassette_listing("TestComment.test_block"),
+        "submissions": cassette_listing("TestSubredditQuarantine.test_opt_in"),
+    }
+    results = {}
+    for name, page in pages.items():
+        reddit._core.request = lambda page=page, **_: page
+
+        def fetch():
+            deque(ListingGenerator(reddit, "path", limit=None), maxlen=0)
+
+        results[f"ListingGenerator {name}"] = timeit.timeit(fetch, number=number)
+        results[f"ListingGenerator {name} with 4 fields"] = timeit.timeit(
+            lambda: deque(
+                ListingGenerator(
+                    reddit,
+                    "path",
+                    fields=("author", "created_utc", "id", "subreddit"),
+                    limit=None,
+                ),
+                maxlen=0,
+            ),
+            number=number,
+        )
+        results[f"ListingGenerator {name} raw"] = timeit.timeit(
+            lambda: deque(
+                ListingGenerator(reddit, "path", limit=None, raw=True), maxlen=0
+            ),
+            number=number,
+        )
+        with mock.patch.object(
+            Objector, "_objectify_listing_children", return_value=None
+        ):
+            results[f"ListingGenerator {name} per item"] = timeit.timeit(
+                fetch, number=number
+            )
+    return results
+
+
+@benchmark
+def benchmark_modmail(number):
+    """Measure objectifying the modmail responses recorded in the cassettes, per body."""
+    reddit = dummy_reddit()
+    bodies = []
+    for path in sorted(CASSETTES.glob("*Modmail*.json")):
+        for interaction in json.loads(path.read_text())["http_interactions"]:
+            body = interaction["response"]["body"].get("string", "")
+            if '"objIds"' in body and not isinstance(
+                reddit._objector.objectify(json.loads(body)), (dict, list)
+            ):
+                bodies.append(body)
+    bodies = list(islice(cycle(bodies), number))
+
+    def objectify(read_user):
+        for body in bodies:
+            result = reddit._objector.objectify(json.loads(body))
+            if read_user:
+                for conversation in vars(result).get("conversations", [result]):
+                    if "_lean_data" in vars(conversation):
+                        conversation.user
+
+    decode = timeit.timeit(lambda: deque(map(json.loads, bodies), maxlen=0), number=1)
+    results = {}
+    for mode in ("uncached keys", "cached keys"):
+        with (
+            mock.patch(
+                "praw.util.snake.camel_to_snake", praw.util.camel_to_snake.__wrapped__
+            )
+            if mode == "uncached keys"
+            else nullcontext()
+        ):
+            results[mode] = timeit.timeit(lambda: objectify(False), number=1)
+            results[f"{mode} and read user"] = timeit.timeit(
+                lambda: objectify(True), number=1
+            )
+    return {operation: total - decode for operation, total in results.items()}
+
+
+@benchmark
+def benchmark_request(number):
+    """Measure the overhead of the request stack per call."""
+    reddit = dummy_reddit()
+    reddit._core.request = lambda **_: {}
+
+    @_deprecate_args("path", "params")
+    def deprecated(path, params=None):
+        pass
+
+    def plain(path, params=None):
+        pass
+
+    return {
+        "_deprecate_args": timeit.timeit(lambda: deprecated(path="path"), number=number)
+        - timeit.timeit(lambda: plain(path="path"), number=number),
+        "Reddit.request GET": timeit.timeit(
+            lambda: reddit.request(method="GET", path="api/v1/me"), number=number
+        ),
+        "Reddit.request GET unique paths": timeit.timeit(
+            lambda ids=count(): reddit.request(
+                method="GET", path=f"comments/{next(ids):x}/"
+            ),
+            number=number,
+        ),
+        "Reddit.request POST": timeit.timeit(
+            lambda: reddit.request(method="POST", path="api/v1/me"), number=number
+        ),
+        "Reddit.get": timeit.timeit(lambda: reddit.get("api/v1/me"), number=number),
+        "Reddit.post": timeit.timeit(lambda: reddit.post("api/v1/me"), number=number),
+    }
+
+
+def main():
+    """The main function."""
+    parser = argparse.ArgumentParser(description="Run PRAW micro-benchmarks.")
+    parser.add_argument(
+        "name", choices=sorted(BENCHMARKS), help="The benchmark to run."
+    )
+    parser.add_argument(
+        "-n",
+        "--number",
+        default=100000,
+        help="The number of times each operation is timed (default: 100000).",
+        type=int,
+    )
+    parser.add_argument(
+        "--max-microseconds",
+        help="Exit with an error if any operation takes longer than this on average.",
+        type=float,
+    )
+    args = parser.parse_args()
+
+    exceeded = False
+    for operation, total in BENCHMARKS[args.name](args.number).items():
+        if isinstance(total, int):
+            print(f"{operation:<40} {total / args.number:10.0f} B")
+            continue
+        microseconds = total / args.number * 1e6
+        print(f"{operation:<40} {microseconds:10.2f} us")
+        if args.max_microseconds is not None and microseconds > args.max_microseconds:
+            exceeded = True
+    return int(exceeded)
+
+
+if __name__ == "__main__":
+    sys.exit(main())